@@ -7,7 +7,13 @@ This API is meant to be called by the Next.js website to get pre-calculated plan
 
 Endpoints:
 - POST /calculate - Calculate chart for given date, time, and location
-- GET /health - Health check
+- POST /ingresses - Find sign or nakshatra ingresses in a date window
+- POST /retrogrades - Find retrograde periods in a date window
+- POST /lagna-table - Rising times of the 12 lagnas for a local day
+- POST /vimshopaka - Vimshopaka bala and vargottama flags of a chart
+- POST /varga-sensitivity - Time to the next varga sign change per body
+- POST /rectify - Birth-time windows matching chart constraints
+- GET /health - Health check (503 while warming up or after a failed warm-up)
 
 Usage:
     python api.py
@@ -18,12 +24,22 @@ The server runs on http://localhost:5000 by default.
 from flask import Flask, jsonify, request
 from flask_cors import CORS
 from astrology_calculator import AstrologyCalculator
-from divisional_charts import calculate_divisional_chart, calculate_all_divisional_charts, CHART_NAMES, DIVISIONAL_CHARTS
+from divisional_charts import calculate_divisional_chart, calculate_all_divisional_charts, calculate_divisional_charts_compact, calculate_varga_sensitivity, varga_version, CHART_NAMES, DIVISIONAL_CHARTS, SIGN_NAMES
+from events import find_ingresses, find_retrograde_periods
+from vimshopaka import calculate_vimshopaka
+from rectification import find_birth_windows
 from datetime import datetime
+import threading
+import time
 import traceback
 import pytz
 from timezonefinder import TimezoneFinder
 
+# Whole Sign houses ('W') are traditional in Vedic astrology. Their cusps, like
+# those of the other systems in AstrologyCalculator.DERIVED_HOUSE_SYSTEMS, come
+# from the same houses_ex call that gives the Ascendant.
+HOUSE_SYSTEM = 'W'
+
 app = Flask(__name__)
 CORS(app)  # Enable CORS for Next.js to call this API
 
@@ -37,14 +53,71 @@ except Exception as e:
     calculator = None
     timezone_finder = None
 
+# Startup warm-up progress, reported by /health
+warmup_status = {
+    'ready': False,
+    'error': None,
+    'timings': {}
+}
+
+
+def warm_up():
+    """
+    Touch every ephemeris file and the timezone index before serving traffic.
+    
+    Runs once in a background thread started at import; /health answers 503
+    until it has finished.
+    """
+    if calculator is None:
+        warmup_status['error'] = 'Ephemeris not initialized'
+        return
+    
+    try:
+        started = time.perf_counter()
+        ephemeris = calculator.warm_up()
+        warmup_status['timings']['ephemeris'] = round(ephemeris['seconds'], 4)
+        warmup_status['timings']['ephemerisFiles'] = ephemeris['files']
+        
+        # The first lookup loads the timezone polygons
+        tz_started = time.perf_counter()
+        timezone_finder.timezone_at(lat=28.6139, lng=77.2090)
+        warmup_status['timings']['timezone'] = round(time.perf_counter() - tz_started, 4)
+        
+        warmup_status['timings']['total'] = round(time.perf_counter() - started, 4)
+        warmup_status['ready'] = True
+        print(f"✓ Warm-up finished in {warmup_status['timings']['total']}s")
+    except Exception as e:
+        traceback.print_exc()
+        warmup_status['error'] = str(e)
+
+
+threading.Thread(target=warm_up, name='warm-up', daemon=True).start()
+
 
 @app.route('/health', methods=['GET'])
 def health_check():
-    """Health check endpoint"""
+    """
+    Health check endpoint.
+    
+    Returns 503 until the startup warm-up has finished, so load balancers
+    only route traffic to warm instances. The status is 'warming_up' while
+    the warm-up runs and 'failed' if the calculator could not be initialized
+    or the warm-up raised.
+    """
+    ready = warmup_status['ready']
+    if ready:
+        status = 'healthy'
+    elif warmup_status['error'] is not None:
+        status = 'failed'
+    else:
+        status = 'warming_up'
     return jsonify({
-        'status': 'healthy',
-        'ephemeris_loaded': calculator is not None
-    })
+        'status': status,
+        'ephemeris_loaded': calculator is not None,
+        'ready': ready,
+        'warmupError': warmup_status['error'],
+        'warmupTimings': warmup_status['timings']
+    }), 200 if ready else 503
 
 
 @app.route('/calculate', methods=['POST'])
@@ -58,7 +131,10 @@ def calculate_chart():
         "time": "14:30:00",              # Time in HH:MM:SS format (optional, defaults to 12:00:00)
         "latitude": 28.6139,             # Geographic latitude
         "longitude": 77.2090,            # Geographic longitude
-        "timezone": "Asia/Kolkata"       # Optional timezone (defaults to UTC)
+        "timezone": "Asia/Kolkata",      # Optional timezone (defaults to UTC)
+        "ayanamsa": "lahiri",            # Optional ayanamsa (defaults to lahiri)
+        "ayanamsas": ["raman", "kp"],    # Optional extra ayanamsas to return as variants
+        "houseSystems": ["P", "K", "E"]  # Optional extra house systems
     }
     
     Response:
@@ -66,10 +142,23 @@ def calculate_chart():
         "success": true,
         "data": {
             "planets": {
-                "Sun": { "longitude": 25.5, "sign": "Aries", "signNumber": 1, "degreeInSign": 25.5 },
+                "Sun": { "longitude": 25.5, "sign": "Aries", "signNumber": 1, "degreeInSign": 25.5,
+                         "speed": 0.98, "retrograde": false },
                 ...
             },
             "ascendant": { ... },
+            "ayanamsa": "lahiri",
+            "ayanamsaValue": 23.72,
+            "houses": { "house1": {...}, ... },   # Whole sign houses
+            "houseSystems": {               # Only when "houseSystems" is given
+                "P": { "house1": {...}, ... },
+                "G": { "house1": {...}, ..., "house36": {...} },   # Gauquelin sectors
+                ...
+            },
+            "ayanamsaVariants": {          # Only when "ayanamsas" is given
+                "raman": { "ayanamsaValue": 22.28, "planets": {...}, "ascendant": {...} },
+                ...
+            },
             "calculatedAt": "2025-12-24T10:00:00Z",
             "inputData": { ... }
         }
@@ -95,6 +184,8 @@ def calculate_chart():
         time_str = data.get('time', '12:00:00')
         latitude = data.get('latitude')
         longitude = data.get('longitude')
+        ayanamsa = str(data.get('ayanamsa', 'lahiri')).lower()
+        variant_ayanamsas = data.get('ayanamsas') or []
         
         if not date_str:
             return jsonify({
@@ -102,6 +193,37 @@ def calculate_chart():
                 'error': 'Date is required (format: YYYY-MM-DD)'
             }), 400
         
+        if not isinstance(variant_ayanamsas, list):
+            return jsonify({
+                'success': False,
+                'error': 'ayanamsas must be a list of ayanamsa names'
+            }), 400
+        variant_ayanamsas = [str(name).lower() for name in variant_ayanamsas]
+        
+        house_systems = data.get('houseSystems') or []
+        if not isinstance(house_systems, list):
+            return jsonify({
+                'success': False,
+                'error': 'houseSystems must be a list of house system codes'
+            }), 400
+        house_systems = [str(code).upper() for code in house_systems]
+        unknown = [code for code in house_systems if code not in AstrologyCalculator.HOUSE_SYSTEMS]
+        if unknown:
+            return jsonify({
+                'success': False,
+                'error': f"Unknown house system '{unknown[0]}'. "
+                         f"Available: {', '.join(AstrologyCalculator.HOUSE_SYSTEMS)}"
+            }), 400
+        
+        unknown = [name for name in [ayanamsa] + variant_ayanamsas
+                   if name not in AstrologyCalculator.AYANAMSAS]
+        if unknown:
+            return jsonify({
+                'success': False,
+                'error': f"Unknown ayanamsa '{unknown[0]}'. "
+                         f"Available: {', '.join(AstrologyCalculator.AYANAMSAS)}"
+            }), 400
+        
         if latitude is None or longitude is None:
             return jsonify({
                 'success': False,
@@ -124,46 +246,41 @@ def calculate_chart():
         
         # Convert local time to UTC based on birth location timezone
         # This is CRITICAL for accurate Ascendant calculation
-        local_datetime_str = f"{date_str} {time_str}"
-        try:
-            # Find timezone based on coordinates
-            tz_name = timezone_finder.timezone_at(lat=latitude, lng=longitude)
-            if tz_name:
-                tz = pytz.timezone(tz_name)
-                local_dt = datetime.strptime(local_datetime_str, "%Y-%m-%d %H:%M:%S")
-                local_dt = tz.localize(local_dt)
-                utc_dt = local_dt.astimezone(pytz.UTC)
-                datetime_str = utc_dt.strftime('%Y-%m-%d %H:%M:%S')
-            else:
-                # Fallback: use as-is if timezone cannot be determined
-                datetime_str = local_datetime_str
-        except Exception as tz_error:
-            print(f"Warning: Timezone conversion failed: {tz_error}, using local time as-is")
-            datetime_str = local_datetime_str
+        datetime_str = local_to_utc(date_str, time_str, latitude, longitude)
         
-        # Calculate all planetary positions
-        chart_data = calculator.get_planetary_chart_data(datetime_str, latitude, longitude)
+        # Calculate all planetary positions and the house cusps in one pass
+        chart = calculator.calculate_chart(datetime_str, latitude, longitude, HOUSE_SYSTEM, ayanamsa)
+        planets, ascendant_data = format_chart_data(calculator.chart_to_data(chart))
         
-        # Format response for the website
-        planets = {}
-        ascendant_data = None
+        # Further ayanamsas reuse the cached tropical positions of this instant,
+        # so each variant only costs an ayanamsa lookup
+        ayanamsa_variants = None
+        if variant_ayanamsas:
+            ayanamsa_variants = {}
+            for name in variant_ayanamsas:
+                variant = calculator.calculate_chart(datetime_str, latitude, longitude, HOUSE_SYSTEM, name)
+                variant_planets, variant_ascendant = format_chart_data(calculator.chart_to_data(variant))
+                ayanamsa_variants[name] = {
+                    'ayanamsaValue': round(variant['ayanamsa'], 6),
+                    'planets': variant_planets,
+                    'ascendant': variant_ascendant
+                }
         
-        for planet, info in chart_data.items():
-            planet_info = {
-                'longitude': round(info['longitude'], 6),
-                'sign': info['sign_name'],
-                'signNumber': info['sign_number'],
-                'degreeInSign': round(info['degree_in_sign'], 4),
-                'formatted': info['formatted']
-            }
-            
-            if planet == 'Ascendant':
-                ascendant_data = planet_info
-            else:
-                planets[planet] = planet_info
+        # Format house cusps (12 houses)
+        houses = format_houses(chart['cusps'])
         
-        # Calculate house cusps (12 houses)
-        houses = calculate_houses(datetime_str, latitude, longitude)
+        # Extra house systems share the chart's sidereal time and obliquity
+        house_system_data = None
+        if house_systems:
+            try:
+                cusps_by_system = calculator.calculate_houses(datetime_str, latitude, longitude,
+                                                              house_systems, ayanamsa)
+            except ValueError as e:
+                return jsonify({
+                    'success': False,
+                    'error': str(e)
+                }), 400
+            house_system_data = {code: format_houses(cusps) for code, cusps in cusps_by_system.items()}
         
         # Get requested chart type (default to D1)
         chart_type = data.get('chartType', 'D1')
@@ -183,6 +300,10 @@ def calculate_chart():
                 'planets': planets,
                 'ascendant': ascendant_data,
                 'houses': houses,
+                'houseSystems': house_system_data,
+                'ayanamsa': ayanamsa,
+                'ayanamsaValue': round(chart['ayanamsa'], 6),
+                'ayanamsaVariants': ayanamsa_variants,
                 'chartType': chart_type,
                 'chartName': CHART_NAMES.get(chart_type, 'Birth Chart'),
                 'divisionalChart': divisional_data,
@@ -207,14 +328,20 @@ def calculate_chart():
 @app.route('/divisional-charts', methods=['POST'])
 def get_all_divisional_charts():
     """
-    Calculate all divisional charts (D1-D60) for a birth chart.
+    Calculate divisional charts (D1-D60) for a birth chart.
+    
+    Only the requested charts are computed and only the requested fields are
+    serialized, so both scale with what the client displays.
     
     Request Body:
     {
         "date": "2025-05-11",
         "time": "14:30:00",
         "latitude": 28.6139,
-        "longitude": 77.2090
+        "longitude": 77.2090,
+        "charts": ["D1", "D9"],          # Optional, defaults to all 16 charts
+        "fields": ["signNumber"],        # Optional, defaults to all fields
+        "format": "compact"              # Optional, 'full' (default) or 'compact'
     }
     
     Response:
@@ -226,6 +353,20 @@ def get_all_divisional_charts():
             ...
         }
     }
+    
+    With "format": "compact" every chart carries parallel arrays instead of
+    per-planet dicts ("fields" is ignored) and the sign names are sent once:
+    {
+        "success": true,
+        "data": {
+            "bodies": ["Sun", "Moon", ...],
+            "signNames": ["Aries", ...],
+            "charts": {
+                "D9": { "name": "Navamsa", "signNumbers": [9, 4, ...], "degrees": [12.3456, ...] },
+                ...
+            }
+        }
+    }
     """
     if calculator is None:
         return jsonify({
@@ -253,23 +394,32 @@ def get_all_divisional_charts():
                 'error': 'date, latitude, and longitude are required'
             }), 400
         
+        chart_types = data.get('charts')
+        fields = data.get('fields')
+        if chart_types is not None and not isinstance(chart_types, list):
+            return jsonify({
+                'success': False,
+                'error': 'charts must be a list of chart types'
+            }), 400
+        if fields is not None and not isinstance(fields, list):
+            return jsonify({
+                'success': False,
+                'error': 'fields must be a list of field names'
+            }), 400
+        if chart_types is not None:
+            chart_types = [str(chart_type).upper() for chart_type in chart_types]
+        output_format = str(data.get('format', 'full')).lower()
+        if output_format not in ('full', 'compact'):
+            return jsonify({
+                'success': False,
+                'error': "format must be 'full' or 'compact'"
+            }), 400
+        
         latitude = float(latitude)
         longitude = float(longitude)
         
         # Convert local time to UTC
-        local_datetime_str = f"{date_str} {time_str}"
-        try:
-            tz_name = timezone_finder.timezone_at(lat=latitude, lng=longitude)
-            if tz_name:
-                tz = pytz.timezone(tz_name)
-                local_dt = datetime.strptime(local_datetime_str, "%Y-%m-%d %H:%M:%S")
-                local_dt = tz.localize(local_dt)
-                utc_dt = local_dt.astimezone(pytz.UTC)
-                datetime_str = utc_dt.strftime('%Y-%m-%d %H:%M:%S')
-            else:
-                datetime_str = local_datetime_str
-        except Exception:
-            datetime_str = local_datetime_str
+        datetime_str = local_to_utc(date_str, time_str, latitude, longitude)
         
         # Get D1 chart positions
         chart_data = calculator.get_planetary_chart_data(datetime_str, latitude, longitude)
@@ -279,15 +429,540 @@ def get_all_divisional_charts():
         for planet, info in chart_data.items():
             positions[planet] = {'longitude': info['longitude']}
         
-        # Calculate all divisional charts
-        all_charts = calculate_all_divisional_charts(positions)
+        # Calculate the requested divisional charts
+        try:
+            if output_format == 'compact':
+                all_charts = calculate_divisional_charts_compact(positions, chart_types)
+            else:
+                all_charts = calculate_all_divisional_charts(positions, chart_types, fields)
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
+        
+        # The compact result already holds 'charts' next to 'bodies' and 'signNames'
+        response_data = all_charts if output_format == 'compact' else {'charts': all_charts}
+        response_data.update({
+            'format': output_format,
+            'chartVersions': {chart_type: varga_version(chart_type) for chart_type in response_data['charts']},
+            'availableCharts': list(CHART_NAMES.keys()),
+            'chartNames': CHART_NAMES,
+            'calculatedAt': datetime.utcnow().isoformat() + 'Z'
+        })
+        
+        return jsonify({
+            'success': True,
+            'data': response_data
+        })
+        
+    except Exception as e:
+        traceback.print_exc()
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
+@app.route('/ingresses', methods=['POST'])
+def get_ingresses():
+    """
+    Find when bodies change sign or nakshatra.
+    
+    Request Body:
+    {
+        "start": "2025-01-01",           # Window start (UTC)
+        "end": "2030-01-01",             # Window end (UTC)
+        "bodies": ["saturn"],            # Optional (defaults to all planets)
+        "division": "sign",              # Optional: "sign" or "nakshatra"
+        "ayanamsa": "lahiri"             # Optional
+    }
+    
+    Response:
+    {
+        "success": true,
+        "data": {
+            "ingresses": [
+                { "body": "Saturn", "datetime": "2025-03-29T...Z", "from": 11, "to": 12,
+                  "fromName": "Aquarius", "toName": "Pisces", "retrograde": false, ... },
+                ...
+            ]
+        }
+    }
+    """
+    if calculator is None:
+        return jsonify({
+            'success': False,
+            'error': 'Ephemeris not initialized.'
+        }), 500
+    
+    try:
+        data = request.get_json()
+        
+        if not data or not data.get('start') or not data.get('end'):
+            return jsonify({
+                'success': False,
+                'error': 'start and end are required (format: YYYY-MM-DD)'
+            }), 400
+        
+        bodies = data.get('bodies') or list(AstrologyCalculator.PLANETS.keys())
+        try:
+            events = find_ingresses(calculator, bodies, data['start'], data['end'],
+                                    division=data.get('division', 'sign'),
+                                    ayanamsa=data.get('ayanamsa'))
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
+        
+        ingresses = [{
+            'body': event['body'],
+            'jd': round(event['jd'], 6),
+            'datetime': event['datetime'].strftime('%Y-%m-%dT%H:%M:%SZ'),
+            'division': event['division'],
+            'from': event['from'],
+            'to': event['to'],
+            'fromName': event['from_name'],
+            'toName': event['to_name'],
+            'longitude': round(event['longitude'], 6),
+            'retrograde': event['retrograde']
+        } for event in events]
+        
+        return jsonify({
+            'success': True,
+            'data': {
+                'ingresses': ingresses,
+                'calculatedAt': datetime.utcnow().isoformat() + 'Z'
+            }
+        })
+        
+    except Exception as e:
+        traceback.print_exc()
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
+@app.route('/retrogrades', methods=['POST'])
+def get_retrogrades():
+    """
+    Find retrograde periods of the planets.
+    
+    Request Body:
+    {
+        "start": "2025-01-01",           # Window start (UTC)
+        "end": "2026-01-01",             # Window end (UTC)
+        "bodies": ["mercury"],           # Optional (defaults to Mercury through Saturn)
+        "ayanamsa": "lahiri"             # Optional
+    }
+    
+    Response:
+    {
+        "success": true,
+        "data": {
+            "retrogrades": [
+                { "body": "Mercury", "start": "2025-03-15T06:40:04Z", "end": "2025-04-07T11:02:38Z",
+                  "startLongitude": 345.379, "endLongitude": 332.616, ... },
+                ...
+            ]
+        }
+    }
+    
+    Periods already running at the window start (or still running at its end)
+    have null start (or end) fields.
+    """
+    if calculator is None:
+        return jsonify({
+            'success': False,
+            'error': 'Ephemeris not initialized.'
+        }), 500
+    
+    try:
+        data = request.get_json()
+        
+        if not data or not data.get('start') or not data.get('end'):
+            return jsonify({
+                'success': False,
+                'error': 'start and end are required (format: YYYY-MM-DD)'
+            }), 400
+        
+        try:
+            periods = find_retrograde_periods(calculator, data.get('bodies'), data['start'], data['end'],
+                                              ayanamsa=data.get('ayanamsa'))
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
+        
+        def format_time(value):
+            return value.strftime('%Y-%m-%dT%H:%M:%SZ') if value is not None else None
+        
+        def format_number(value):
+            return round(value, 6) if value is not None else None
+        
+        retrogrades = [{
+            'body': period['body'],
+            'start': format_time(period['start']),
+            'end': format_time(period['end']),
+            'startJd': format_number(period['start_jd']),
+            'endJd': format_number(period['end_jd']),
+            'startLongitude': format_number(period['start_longitude']),
+            'endLongitude': format_number(period['end_longitude'])
+        } for period in periods]
         
         return jsonify({
             'success': True,
             'data': {
-                'charts': all_charts,
-                'availableCharts': list(CHART_NAMES.keys()),
-                'chartNames': CHART_NAMES,
+                'retrogrades': retrogrades,
+                'calculatedAt': datetime.utcnow().isoformat() + 'Z'
+            }
+        })
+        
+    except Exception as e:
+        traceback.print_exc()
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
+@app.route('/lagna-table', methods=['POST'])
+def get_lagna_table():
+    """
+    Find when each lagna (Ascendant sign) rises during a local day.
+    
+    Request Body:
+    {
+        "date": "2025-05-11",            # Local date at the location
+        "latitude": 28.6139,
+        "longitude": 77.2090,
+        "ayanamsa": "lahiri"             # Optional
+    }
+    
+    Response:
+    {
+        "success": true,
+        "data": {
+            "lagnas": [
+                { "sign": "Aries", "signNumber": 1, "start": "2025-05-10T18:30:00Z",
+                  "end": "2025-05-10T18:49:28Z" },
+                ...
+            ]
+        }
+    }
+    
+    Times are UTC; the first and last lagnas are clipped to the day.
+    """
+    if calculator is None:
+        return jsonify({
+            'success': False,
+            'error': 'Ephemeris not initialized.'
+        }), 500
+    
+    try:
+        data = request.get_json()
+        
+        if not data or not data.get('date') or data.get('latitude') is None or data.get('longitude') is None:
+            return jsonify({
+                'success': False,
+                'error': 'date, latitude, and longitude are required'
+            }), 400
+        
+        latitude = float(data['latitude'])
+        longitude = float(data['longitude'])
+        
+        # The table covers the local day from midnight
+        start = local_to_utc(data['date'], '00:00:00', latitude, longitude)
+        try:
+            table = calculator.lagna_table(start, latitude, longitude, ayanamsa=data.get('ayanamsa'))
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
+        
+        lagnas = [{
+            'sign': entry['sign_name'],
+            'signNumber': entry['sign_number'],
+            'start': entry['start'].strftime('%Y-%m-%dT%H:%M:%SZ'),
+            'end': entry['end'].strftime('%Y-%m-%dT%H:%M:%SZ'),
+            'startJd': round(entry['start_jd'], 6),
+            'endJd': round(entry['end_jd'], 6)
+        } for entry in table]
+        
+        return jsonify({
+            'success': True,
+            'data': {
+                'lagnas': lagnas,
+                'calculatedAt': datetime.utcnow().isoformat() + 'Z'
+            }
+        })
+        
+    except Exception as e:
+        traceback.print_exc()
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
+@app.route('/varga-sensitivity', methods=['POST'])
+def get_varga_sensitivity():
+    """
+    Report how close each body is to a sign change in every divisional chart.
+    
+    Request Body:
+    {
+        "date": "2025-05-11",
+        "time": "14:30:00",
+        "latitude": 28.6139,
+        "longitude": 77.2090,
+        "charts": ["D9", "D60"]          # Optional, defaults to all 16 charts
+    }
+    
+    Response:
+    {
+        "success": true,
+        "data": {
+            "charts": {
+                "D60": {
+                    "Ascendant": { "degreesToPrevious": 0.389873, "degreesToNext": 0.110127,
+                                   "minutesEarlier": 1.77, "minutesLater": 0.5 },
+                    ...
+                },
+                ...
+            }
+        }
+    }
+    
+    "minutesEarlier" / "minutesLater" are the shifts of birth time that change
+    the body's sign in that chart, estimated from its current speed.
+    """
+    if calculator is None:
+        return jsonify({
+            'success': False,
+            'error': 'Ephemeris not initialized.'
+        }), 500
+    
+    try:
+        data = request.get_json()
+        
+        if not data or not data.get('date') or data.get('latitude') is None or data.get('longitude') is None:
+            return jsonify({
+                'success': False,
+                'error': 'date, latitude, and longitude are required'
+            }), 400
+        
+        chart_types = data.get('charts')
+        if chart_types is not None and not isinstance(chart_types, list):
+            return jsonify({
+                'success': False,
+                'error': 'charts must be a list of chart types'
+            }), 400
+        if chart_types is not None:
+            chart_types = [str(chart_type).upper() for chart_type in chart_types]
+        
+        latitude = float(data['latitude'])
+        longitude = float(data['longitude'])
+        
+        datetime_str = local_to_utc(data['date'], data.get('time', '12:00:00'), latitude, longitude)
+        chart = calculator.calculate_chart(datetime_str, latitude, longitude)
+        speeds = dict(chart['speeds'])
+        speeds['Ascendant'] = calculator.calculate_ascendant_speed(chart['jd'], latitude, longitude)
+        
+        try:
+            charts = calculate_varga_sensitivity(chart['positions'], speeds, chart_types)
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
+        
+        return jsonify({
+            'success': True,
+            'data': {
+                'charts': charts,
+                'calculatedAt': datetime.utcnow().isoformat() + 'Z'
+            }
+        })
+        
+    except Exception as e:
+        traceback.print_exc()
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
+@app.route('/vimshopaka', methods=['POST'])
+def get_vimshopaka():
+    """
+    Calculate Vimshopaka bala and vargottama flags for a birth chart.
+    
+    Request Body:
+    {
+        "date": "2025-05-11",
+        "time": "14:30:00",
+        "latitude": 28.6139,
+        "longitude": 77.2090,
+        "schemes": ["shadvarga"]         # Optional, defaults to all four schemes
+    }
+    
+    Response:
+    {
+        "success": true,
+        "data": {
+            "planets": {
+                "Sun": { "vargottama": false, "navamsaSign": "Capricorn",
+                         "shadvarga": 8.75, "saptavarga": 9.88, ... },
+                ...
+                "Rahu": { "vargottama": false, "navamsaSign": "Taurus" },
+                ...
+            }
+        }
+    }
+    
+    Points range from 5 to 20; Rahu, Ketu and the Ascendant only get the
+    vargottama flag.
+    """
+    if calculator is None:
+        return jsonify({
+            'success': False,
+            'error': 'Ephemeris not initialized.'
+        }), 500
+    
+    try:
+        data = request.get_json()
+        
+        if not data or not data.get('date') or data.get('latitude') is None or data.get('longitude') is None:
+            return jsonify({
+                'success': False,
+                'error': 'date, latitude, and longitude are required'
+            }), 400
+        
+        schemes = data.get('schemes')
+        if schemes is not None and not isinstance(schemes, list):
+            return jsonify({
+                'success': False,
+                'error': 'schemes must be a list of scheme names'
+            }), 400
+        if schemes is not None:
+            schemes = [str(scheme).lower() for scheme in schemes]
+        
+        latitude = float(data['latitude'])
+        longitude = float(data['longitude'])
+        
+        datetime_str = local_to_utc(data['date'], data.get('time', '12:00:00'), latitude, longitude)
+        chart_data = calculator.get_planetary_chart_data(datetime_str, latitude, longitude)
+        
+        try:
+            planets = calculate_vimshopaka(chart_data, schemes)
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
+        
+        return jsonify({
+            'success': True,
+            'data': {
+                'planets': planets,
+                'calculatedAt': datetime.utcnow().isoformat() + 'Z'
+            }
+        })
+        
+    except Exception as e:
+        traceback.print_exc()
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
+@app.route('/rectify', methods=['POST'])
+def rectify_birth_time():
+    """
+    Find the parts of a birth-time window that satisfy chart constraints.
+    
+    Request Body:
+    {
+        "date": "1990-05-11",            # Local date of the window start
+        "startTime": "08:00:00",         # Local time
+        "endTime": "10:00:00",           # Local time (on "endDate" if given)
+        "endDate": "1990-05-11",         # Optional, defaults to "date"
+        "latitude": 28.6139,
+        "longitude": 77.2090,
+        "constraints": [
+            { "chart": "D9", "sign": "Scorpio" },          # Ascendant by default
+            { "chart": "D10", "sign": ["Leo", "Virgo"] },
+            { "body": "Moon", "nakshatra": "Rohini" }
+        ],
+        "ayanamsa": "lahiri"             # Optional
+    }
+    
+    Response:
+    {
+        "success": true,
+        "data": {
+            "windows": [
+                { "start": "1990-05-11T03:01:20Z", "end": "1990-05-11T03:08:15Z", "minutes": 6.92 },
+                ...
+            ]
+        }
+    }
+    
+    Times are UTC; the window may span at most three days.
+    """
+    if calculator is None:
+        return jsonify({
+            'success': False,
+            'error': 'Ephemeris not initialized.'
+        }), 500
+    
+    try:
+        data = request.get_json()
+        
+        required = ('date', 'startTime', 'endTime', 'latitude', 'longitude', 'constraints')
+        if not data or any(data.get(field) is None for field in required):
+            return jsonify({
+                'success': False,
+                'error': f"{', '.join(required)} are required"
+            }), 400
+        
+        constraints = data['constraints']
+        if not isinstance(constraints, list) or not all(isinstance(item, dict) for item in constraints):
+            return jsonify({
+                'success': False,
+                'error': 'constraints must be a list of objects'
+            }), 400
+        
+        latitude = float(data['latitude'])
+        longitude = float(data['longitude'])
+        start = local_to_utc(data['date'], data['startTime'], latitude, longitude)
+        end = local_to_utc(data.get('endDate', data['date']), data['endTime'], latitude, longitude)
+        
+        try:
+            windows = find_birth_windows(calculator, start, end, latitude, longitude, constraints,
+                                         ayanamsa=data.get('ayanamsa'))
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
+        
+        return jsonify({
+            'success': True,
+            'data': {
+                'windows': [{
+                    'start': window['start'].strftime('%Y-%m-%dT%H:%M:%SZ'),
+                    'end': window['end'].strftime('%Y-%m-%dT%H:%M:%SZ'),
+                    'startJd': round(window['start_jd'], 6),
+                    'endJd': round(window['end_jd'], 6),
+                    'minutes': round(window['minutes'], 2)
+                } for window in windows],
                 'calculatedAt': datetime.utcnow().isoformat() + 'Z'
             }
         })
@@ -302,38 +977,87 @@ def get_all_divisional_charts():
 
 @app.route('/chart-types', methods=['GET'])
 def get_chart_types():
-    """Get list of available divisional chart types."""
+    """
+    Get list of available divisional chart types.
+    
+    Includes custom schemes registered with ``divisional_charts.register_varga``;
+    "chartVersions" changes whenever a scheme's definition does, so results
+    can be cached under (chart type, version).
+    """
     return jsonify({
         'success': True,
         'data': {
             'chartTypes': list(CHART_NAMES.keys()),
-            'chartNames': CHART_NAMES
+            'chartNames': CHART_NAMES,
+            'chartVersions': {chart_type: varga_version(chart_type) for chart_type in CHART_NAMES}
         }
     })
 
 
-def calculate_houses(datetime_str, latitude, longitude):
+def local_to_utc(date_str, time_str, latitude, longitude):
+    """
+    Convert a local date and time at a location to a UTC 'YYYY-MM-DD HH:MM:SS' string.
+    
+    The timezone is looked up from the coordinates; if it cannot be determined
+    the local time is used as-is.
+    """
+    local_datetime_str = f"{date_str} {time_str}"
+    try:
+        # Find timezone based on coordinates
+        tz_name = timezone_finder.timezone_at(lat=latitude, lng=longitude)
+        if tz_name:
+            tz = pytz.timezone(tz_name)
+            local_dt = datetime.strptime(local_datetime_str, "%Y-%m-%d %H:%M:%S")
+            local_dt = tz.localize(local_dt)
+            utc_dt = local_dt.astimezone(pytz.UTC)
+            return utc_dt.strftime('%Y-%m-%d %H:%M:%S')
+    except Exception as tz_error:
+        print(f"Warning: Timezone conversion failed: {tz_error}, using local time as-is")
+    # Fallback: use as-is if timezone cannot be determined
+    return local_datetime_str
+
+
+def format_chart_data(chart_data):
     """
-    Calculate all 12 house cusps using Swiss Ephemeris.
+    Format calculator chart data for the website.
+    
+    Returns a (planets, ascendant) tuple; ascendant is None without coordinates.
     """
-    import swisseph as swe
-    from astropy.time import Time
+    planets = {}
+    ascendant_data = None
     
-    t = Time(datetime_str)
-    jd = t.jd
+    for planet, info in chart_data.items():
+        planet_info = {
+            'longitude': round(info['longitude'], 6),
+            'sign': info['sign_name'],
+            'signNumber': info['sign_number'],
+            'degreeInSign': round(info['degree_in_sign'], 4),
+            'formatted': info['formatted']
+        }
+        if 'speed' in info:
+            planet_info['speed'] = round(info['speed'], 6)
+            planet_info['retrograde'] = bool(info['retrograde'])
+        
+        if planet == 'Ascendant':
+            ascendant_data = planet_info
+        else:
+            planets[planet] = planet_info
     
-    # Use Whole Sign house system ('W') which is traditional in Vedic astrology
-    # Other options: 'P' (Placidus), 'E' (Equal), 'K' (Koch)
-    cusps, ascmc = swe.houses_ex(jd, latitude, longitude, b'W', flags=swe.FLG_SIDEREAL)
+    return planets, ascendant_data
+
+
+def format_houses(cusps):
+    """
+    Format the house cusps of a chart for the website.
     
+    Every cusp is included: 12 houses, or 36 sectors for Gauquelin ('G').
+    """
     houses = {}
-    for i, cusp in enumerate(cusps[:12], 1):
+    for i, cusp in enumerate(cusps, 1):
         sign_index = int(cusp // 30)
-        signs = ["Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo",
-                "Libra", "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces"]
         houses[f'house{i}'] = {
             'cusp': round(cusp, 6),
-            'sign': signs[sign_index],
+            'sign': SIGN_NAMES[sign_index],
             'signNumber': sign_index + 1,
             'degreeInSign': round(cusp % 30, 4)
         }
@@ -402,6 +1126,12 @@ if __name__ == '__main__':
     print("=" * 50)
     print("\nEndpoints:")
     print("  POST /calculate  - Calculate chart positions")
+    print("  POST /ingresses  - Find sign/nakshatra ingresses")
+    print("  POST /retrogrades - Find retrograde periods")
+    print("  POST /lagna-table - Lagna rising times for a day")
+    print("  POST /vimshopaka - Vimshopaka bala and vargottama")
+    print("  POST /varga-sensitivity - Time to the next varga sign change")
+    print("  POST /rectify    - Birth-time rectification windows")
     print("  GET  /geocode    - Get coordinates for a place")
     print("  GET  /health     - Health check")
     print("\nStarting server on http://localhost:5000")
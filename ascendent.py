@@ -1,10 +1,10 @@
 import swisseph as swe
-from astropy.time import Time
 import os
 import pytz
 from datetime import datetime
 from timezonefinder import TimezoneFinder
 import location2 as loc
+from julian_day import to_julian_day
 
 def calculate_ascendant_sidereal_longitude(date, latitude, longitude, ephe_path='ephe', house_system='P'):
     """
@@ -13,7 +13,7 @@ def calculate_ascendant_sidereal_longitude(date, latitude, longitude, ephe_path=
 
     Parameters
     ----------
-    date : str or `~astropy.time.Time`
+    date : str, `~datetime.datetime` or `~astropy.time.Time`
         Date and time of observation (e.g., '2025-05-11 14:30:00').
     latitude : float
         Geographic latitude in degrees (positive for North, negative for South).
@@ -43,14 +43,7 @@ def calculate_ascendant_sidereal_longitude(date, latitude, longitude, ephe_path=
     swe.set_ephe_path(ephe_path)
 
     # Convert date to Julian Day
-    if isinstance(date, str):
-        try:
-            t = Time(date)
-        except ValueError as e:
-            raise ValueError(f"Invalid date format: {e}. Use 'YYYY-MM-DD HH:MM:SS'.")
-    else:
-        t = date
-    jd = t.jd  # Julian Day in UTC
+    jd = to_julian_day(date)  # Julian Day in UTC
 
 
     # Set Lahiri Ayanamsa (sidereal mode)
@@ -14,21 +14,37 @@ Features:
 
 Dependencies:
 - swisseph: Swiss Ephemeris library
-- astropy: Astronomical calculations
+- astropy: Optional, only for passing astropy Time objects or unusual date strings
 - geopy: Geographic coordinate lookup
 - pytz: Timezone handling
 - timezonefinder: Timezone detection
+- numpy: Vectorized batch calculations
 
 Author: Combined from individual planetary calculation modules
 """
 
 import swisseph as swe
-from astropy.time import Time
+import numpy as np
 import os
+import re
+import threading
+import time
 import pytz
 from datetime import datetime
 from timezonefinder import TimezoneFinder
 from geopy.geocoders import Nominatim
+from julian_day import from_julian_day, gregorian_to_jd, to_julian_day, to_julian_days
+from chebyshev_ephemeris import ChebyshevEphemeris
+from position_cache import PositionCache, DEFAULT_RESOLUTION
+from events import bracketed_root, PRECISION
+
+# Guards the global Swiss Ephemeris sidereal mode while an ayanamsa is read
+_SID_MODE_LOCK = threading.Lock()
+
+# Swiss Ephemeris data files, e.g. 'sepl_18.se1' (planets from 1800 AD) or
+# 'semom06.se1' (Moon from 600 BC); each file covers 600 years
+_EPHE_FILE_PATTERN = re.compile(r'^se(?:pl|mo|as)([_m])(\d{2})\.se1$')
+_EPHE_FILE_YEARS = 600
 
 
 class AstrologyCalculator:
@@ -51,7 +67,64 @@ class AstrologyCalculator:
         'ketu': swe.TRUE_NODE  # Ketu is calculated as Rahu + 180°
     }
     
-    def __init__(self, ephe_path='ephe'):
+    # Flags for planetary positions (tropical, true geometric positions, with
+    # daily speed from the same call). Sidereal longitudes are obtained by
+    # subtracting the ayanamsa, which keeps the calculations independent of
+    # the global Swiss Ephemeris sidereal mode.
+    CALC_FLAGS = swe.FLG_SWIEPH | swe.FLG_TRUEPOS | swe.FLG_SPEED
+    
+    # Supported ayanamsa systems
+    AYANAMSAS = {
+        'lahiri': swe.SIDM_LAHIRI,
+        'raman': swe.SIDM_RAMAN,
+        'kp': swe.SIDM_KRISHNAMURTI,
+        'fagan_bradley': swe.SIDM_FAGAN_BRADLEY,
+        'yukteshwar': swe.SIDM_YUKTESHWAR,
+        'true_chitra': swe.SIDM_TRUE_CITRA,
+    }
+    
+    # House systems accepted by swe.houses_ex
+    HOUSE_SYSTEMS = ['P', 'E', 'K', 'R', 'C', 'U', 'V', 'X', 'H', 'T', 'B', 'G', 'Y', 'M', 'A', 'O', 'F', 'D', 'I', 'N', 'S', 'W']
+    
+    # House systems whose cusps follow from the Ascendant and MC alone. They
+    # are derived from one Equal-house ``swe.houses_ex`` call (which works at
+    # every latitude) instead of a call per system.
+    DERIVED_HOUSE_SYSTEMS = ('W', 'E', 'A', 'V', 'N', 'O')
+    
+    # Quadrant systems that are undefined within the polar circles, where some
+    # ecliptic degrees never rise
+    POLAR_UNDEFINED_HOUSE_SYSTEMS = ('P', 'K', 'G')
+    
+    # Sampling step of the lagna table scan in days (20 minutes); steps in
+    # which the Ascendant passes more than one boundary are subdivided
+    LAGNA_SAMPLE_STEP = 1.0 / 72
+    
+    # Decimal places of the coordinates a lagna table is computed and cached for
+    LAGNA_COORD_DECIMALS = 2
+    
+    # Half-width of the central difference for the Ascendant's speed in days (1 minute)
+    ASCENDANT_SPEED_STEP = 1.0 / 1440
+    
+    # Longest window in days over which ``ascendant_function`` interpolates the
+    # sidereal time, obliquity and ayanamsa linearly (errors stay below 1")
+    ASCENDANT_WINDOW = 3.0
+    
+    # Mean rate of the Earth's rotation in degrees of ARMC per day
+    SIDEREAL_RATE = 360.98564736629
+    
+    # Spacing in days of the ayanamsa values ``iter_longitudes`` interpolates
+    # between (errors of about 0.01" including nutation)
+    AYANAMSA_NODE_STEP = 1.0
+    
+    # Record layout of the per-body arrays returned by the batch API
+    CHART_DTYPE = np.dtype([
+        ('longitude', np.float64),
+        ('sign_number', np.int8),
+        ('degree_in_sign', np.float64),
+    ])
+    
+    def __init__(self, ephe_path='ephe', ephemeris_store=None, store_fallback=True,
+                 cache_size=4096, cache_resolution=DEFAULT_RESOLUTION, ayanamsa='lahiri'):
         """
         Initialize the calculator with ephemeris path.
         
@@ -59,19 +132,39 @@ class AstrologyCalculator:
         ----------
         ephe_path : str
             Path to Swiss Ephemeris data files (default: 'ephe')
+        ephemeris_store : str or ChebyshevEphemeris, optional
+            Precomputed Chebyshev store (or the path of its file) used instead of
+            live Swiss Ephemeris calls for planetary longitudes
+        store_fallback : bool, optional
+            Fall back to live Swiss Ephemeris for dates outside the store's window
+            (default: True). When False such dates raise an error.
+        cache_size : int, optional
+            Maximum number of cached positions; 0 disables the cache (default: 4096)
+        cache_resolution : float, optional
+            Julian Day rounding used for cache keys, in days (default: one second)
+        ayanamsa : str, optional
+            Default ayanamsa system, one of ``AYANAMSAS`` (default: 'lahiri').
+            Most methods also accept a per-call ``ayanamsa`` override.
         """
         self.ephe_path = ephe_path
+        self.ayanamsa = ayanamsa.lower()
+        self.sid_mode = self._resolve_sid_mode(self.ayanamsa)
         self._setup_ephemeris()
+        self.cache = PositionCache(cache_size, cache_resolution)
+        if isinstance(ephemeris_store, str):
+            ephemeris_store = ChebyshevEphemeris(ephemeris_store)
+        self.ephemeris_store = ephemeris_store
+        self.store_fallback = store_fallback
     
     def _setup_ephemeris(self):
-        """Set up Swiss Ephemeris with Lahiri Ayanamsa."""
+        """Set up Swiss Ephemeris with the calculator's ayanamsa."""
         if not os.path.exists(self.ephe_path):
             raise FileNotFoundError(
                 f"Ephemeris directory '{self.ephe_path}' not found. "
                 "Download files from ftp://ftp.astro.com/pub/swisseph/ephe/"
             )
         swe.set_ephe_path(self.ephe_path)
-        swe.set_sid_mode(swe.SIDM_LAHIRI)
+        swe.set_sid_mode(self.sid_mode)
     
     def _convert_date_to_jd(self, date):
         """
@@ -79,7 +172,7 @@ class AstrologyCalculator:
         
         Parameters
         ----------
-        date : str or astropy.time.Time
+        date : str, datetime or astropy.time.Time
             Date of observation
         
         Returns
@@ -87,23 +180,287 @@ class AstrologyCalculator:
         float
             Julian Day in UTC
         """
-        if isinstance(date, str):
-            t = Time(date)
+        return to_julian_day(date)
+    
+    def _convert_dates_to_jd(self, dates):
+        """
+        Convert an array of dates to Julian Days in a single pass.
+        
+        Parameters
+        ----------
+        dates : array_like
+            Date strings, datetimes, ``numpy.datetime64`` values (UTC), an
+            astropy ``Time`` array, or Julian Days given as floats
+        
+        Returns
+        -------
+        numpy.ndarray
+            1-D array of Julian Days in UTC
+        """
+        return to_julian_days(dates)
+    
+    def _resolve_sid_mode(self, ayanamsa):
+        """Swiss Ephemeris sidereal mode for an ayanamsa name (None: the calculator's default)."""
+        if ayanamsa is None:
+            return self.sid_mode
+        name = ayanamsa.lower()
+        if name not in self.AYANAMSAS:
+            available = ', '.join(self.AYANAMSAS.keys())
+            raise ValueError(f"Unknown ayanamsa '{ayanamsa}'. Available: {available}")
+        return self.AYANAMSAS[name]
+    
+    def _store_covers(self, body, jds, sid_mode):
+        """
+        Check whether the Chebyshev store can answer a lookup.
+        
+        Raises ValueError for dates outside the store's window when falling
+        back to Swiss Ephemeris is disabled.
+        """
+        store = self.ephemeris_store
+        if store is None or store.sid_mode != sid_mode or not store.has_body(body):
+            return False
+        if np.isscalar(jds):
+            covered = store.covers(jds)
+        else:
+            covered = bool(np.all((jds >= store.start_jd) & (jds < store.end_jd)))
+        if covered:
+            return True
+        if not self.store_fallback:
+            raise ValueError(
+                f"Date outside the precomputed ephemeris window "
+                f"(JD {store.start_jd} to {store.end_jd})."
+            )
+        return False
+    
+    def _ayanamsa_at(self, jd, sid_mode):
+        """Ayanamsa value in degrees at a Julian Day (cached)."""
+        key = self.cache.key(jd, 'ayanamsa', self.CALC_FLAGS, sid_mode)
+        ayanamsa = self.cache.get(key)
+        if ayanamsa is None:
+            ayanamsa = self._ayanamsas_at([jd], sid_mode)[0]
+            self.cache.put(key, ayanamsa)
+        return ayanamsa
+    
+    def _ayanamsas_at(self, jds, sid_mode):
+        """
+        Ayanamsa values for a sequence of Julian Days.
+        
+        The sidereal mode is global Swiss Ephemeris state, so it is only switched
+        inside a lock and only for the duration of these reads.
+        """
+        with _SID_MODE_LOCK:
+            swe.set_sid_mode(sid_mode)
+            return np.array([swe.get_ayanamsa_ex_ut(jd, self.CALC_FLAGS)[1] for jd in jds],
+                            dtype=np.float64)
+    
+    def _ayanamsa_rate_at(self, jd, sid_mode):
+        """Daily change of the ayanamsa at a Julian Day (cached)."""
+        key = self.cache.key(jd, 'ayanamsa_rate', self.CALC_FLAGS, sid_mode)
+        rate = self.cache.get(key)
+        if rate is None:
+            before, after = self._ayanamsas_at([jd - 0.5, jd + 0.5], sid_mode)
+            rate = after - before
+            self.cache.put(key, rate)
+        return rate
+    
+    def _tropical_position_at(self, jd, body):
+        """Tropical (longitude, daily speed) of a Swiss Ephemeris body at a Julian Day (cached)."""
+        key = self.cache.key(jd, body, self.CALC_FLAGS, None)
+        position = self.cache.get(key)
+        if position is None:
+            result = swe.calc_ut(jd, body, self.CALC_FLAGS)
+            if isinstance(result, int):
+                raise RuntimeError(f"swe.calc_ut failed with error code: {result}")
+            pos, _ = result
+            position = (pos[0], pos[3])
+            self.cache.put(key, position)
+        return position
+    
+    def _longitude_at(self, jd, body, sid_mode=None):
+        """Sidereal longitude of a Swiss Ephemeris body at a Julian Day."""
+        if sid_mode is None:
+            sid_mode = self.sid_mode
+        if self._store_covers(body, jd, sid_mode):
+            return self.ephemeris_store.longitude(body, jd)
+        return (self._tropical_position_at(jd, body)[0] - self._ayanamsa_at(jd, sid_mode)) % 360
+    
+    def _position_at(self, jd, body, sid_mode=None):
+        """Sidereal (longitude, daily speed) of a Swiss Ephemeris body at a Julian Day."""
+        if sid_mode is None:
+            sid_mode = self.sid_mode
+        if self._store_covers(body, jd, sid_mode):
+            return self.ephemeris_store.position(body, jd)
+        longitude, speed = self._tropical_position_at(jd, body)
+        return ((longitude - self._ayanamsa_at(jd, sid_mode)) % 360,
+                speed - self._ayanamsa_rate_at(jd, sid_mode))
+    
+    def _houses_at(self, jd, latitude, longitude, house_system, sid_mode=None):
+        """Sidereal ``swe.houses_ex`` result (cusps, ascmc) at a Julian Day."""
+        if sid_mode is None:
+            sid_mode = self.sid_mode
+        base_system = 'E' if house_system in self.DERIVED_HOUSE_SYSTEMS else house_system
+        key = self.cache.key(jd, 'houses', latitude, longitude, base_system)
+        houses = self.cache.get(key)
+        if houses is None:
+            if base_system == 'I':
+                # Sunshine houses also depend on the Sun's declination
+                houses = swe.houses_ex(jd, latitude, longitude, b'I')
+            else:
+                sidereal_time, obliquity = self._house_frame_at(jd)
+                armc = (sidereal_time * 15 + longitude) % 360
+                houses = swe.houses_armc(armc, latitude, obliquity, base_system.encode('ascii'))
+            self.cache.put(key, houses)
+        cusps, ascmc = houses
+        return self._to_sidereal_houses(cusps, ascmc, self._ayanamsa_at(jd, sid_mode), house_system)
+    
+    def _house_frame_at(self, jd):
+        """
+        Greenwich apparent sidereal time (hours) and true obliquity at a Julian Day (cached).
+        
+        These are the parts of ``swe.houses_ex`` that depend on the time only;
+        with them every house system at every location is a ``swe.houses_armc``
+        call with identical results.
+        """
+        key = self.cache.key(jd, 'house_frame')
+        frame = self.cache.get(key)
+        if frame is None:
+            frame = (swe.sidtime(jd), swe.calc_ut(jd, swe.ECL_NUT)[0][0])
+            self.cache.put(key, frame)
+        return frame
+    
+    @classmethod
+    def _to_sidereal_houses(cls, cusps, ascmc, ayanamsa, house_system):
+        """
+        Convert tropical ``swe.houses_ex`` output to sidereal.
+        
+        All angles except the ARMC (sidereal time) shift by the ayanamsa.
+        Cusps of ``DERIVED_HOUSE_SYSTEMS`` are rebuilt from the sidereal angles.
+        """
+        ascmc = tuple(value if i == 2 else (value - ayanamsa) % 360 for i, value in enumerate(ascmc))
+        if house_system in cls.DERIVED_HOUSE_SYSTEMS:
+            cusps = cls.derive_cusps(ascmc[0], ascmc[1], house_system)
         else:
-            t = date
-        return t.jd
+            cusps = tuple((cusp - ayanamsa) % 360 for cusp in cusps)
+        return cusps, ascmc
+    
+    @staticmethod
+    def derive_cusps(ascendant, mc, house_system):
+        """
+        Calculate the 12 house cusps of a system defined by the angles alone.
+        
+        Parameters
+        ----------
+        ascendant : float
+            Ascendant longitude in degrees
+        mc : float
+            Midheaven longitude in degrees
+        house_system : str
+            'W' (whole sign), 'E' / 'A' (equal), 'V' (Vehlow equal),
+            'N' (1st house = Aries) or 'O' (Porphyry)
+        
+        Returns
+        -------
+        tuple of float
+            The 12 cusps in degrees, starting with the 1st house
+        """
+        if house_system == 'W':
+            first = ascendant // 30 * 30
+            return tuple((first + 30.0 * i) % 360 for i in range(12))
+        if house_system in ('E', 'A'):
+            return tuple((ascendant + 30.0 * i) % 360 for i in range(12))
+        if house_system == 'V':
+            return tuple((ascendant - 15 + 30.0 * i) % 360 for i in range(12))
+        if house_system == 'N':
+            return tuple(30.0 * i for i in range(12))
+        if house_system == 'O':
+            # Porphyry: each quadrant between the angles is trisected
+            ic = (mc + 180) % 360
+            lower = (ic - ascendant) % 360
+            upper = 180 - lower
+            cusps = [ascendant, ascendant + lower / 3, ascendant + 2 * lower / 3,
+                     ic, ic + upper / 3, ic + 2 * upper / 3]
+            return tuple(cusp % 360 for cusp in cusps + [cusp + 180 for cusp in cusps])
+        raise ValueError(f"House system '{house_system}' cannot be derived from the angles.")
+    
+    def warm_up(self):
+        """
+        Compute a sentinel chart in every ephemeris file's date range.
+        
+        Swiss Ephemeris opens its data files and fills its internal buffers
+        lazily, so the first chart in each 600-year range is noticeably slower
+        than the rest. Calling this at startup moves that cost out of the first
+        requests. Without data files a single chart at J2000 is computed.
+        
+        Returns
+        -------
+        dict
+            'files': number of ephemeris data files found,
+            'charts': number of sentinel charts computed,
+            'seconds': time spent
+        """
+        started = time.perf_counter()
+        start_years = set()
+        files = 0
+        for name in os.listdir(self.ephe_path):
+            match = _EPHE_FILE_PATTERN.match(name)
+            if match:
+                files += 1
+                sign = -1 if match.group(1) == 'm' else 1
+                start_years.add(sign * int(match.group(2)) * 100)
+        
+        # The middle of each file's range; J2000 when no files are installed
+        jds = [gregorian_to_jd(year + _EPHE_FILE_YEARS // 2, 1, 1) for year in sorted(start_years)]
+        for jd in jds or [gregorian_to_jd(2000, 1, 1, 12)]:
+            self.calculate_chart(jd, 0.0, 0.0)
+        
+        return {
+            'files': files,
+            'charts': len(jds) or 1,
+            'seconds': time.perf_counter() - started,
+        }
+    
+    def cache_info(self):
+        """
+        Get position cache statistics.
+        
+        Returns
+        -------
+        dict
+            hits, misses, size, maxsize and resolution of the position cache
+        """
+        return self.cache.info()
+    
+    def get_ayanamsa(self, date, ayanamsa=None):
+        """
+        Get the ayanamsa value for a date.
+        
+        Parameters
+        ----------
+        date : str, datetime or astropy.time.Time
+            Date of observation
+        ayanamsa : str, optional
+            Ayanamsa system (default: the calculator's ayanamsa)
+        
+        Returns
+        -------
+        float
+            Ayanamsa in degrees
+        """
+        return self._ayanamsa_at(self._convert_date_to_jd(date), self._resolve_sid_mode(ayanamsa))
     
-    def calculate_sidereal_longitude(self, date, planet):
+    def calculate_sidereal_longitude(self, date, planet, ayanamsa=None):
         """
         Calculate the sidereal longitude for any planet.
         
         Parameters
         ----------
-        date : str or astropy.time.Time
+        date : str, datetime or astropy.time.Time
             Date of observation (e.g., '2025-05-11')
         planet : str
             Planet name ('sun', 'moon', 'mercury', 'venus', 'mars', 
             'jupiter', 'saturn', 'uranus', 'neptune', 'rahu', 'ketu')
+        ayanamsa : str, optional
+            Ayanamsa system, one of ``AYANAMSAS`` (default: the calculator's ayanamsa)
         
         Returns
         -------
@@ -116,15 +473,11 @@ class AstrologyCalculator:
             available = ', '.join(self.PLANETS.keys())
             raise ValueError(f"Unknown planet '{planet}'. Available: {available}")
         
+        sid_mode = self._resolve_sid_mode(ayanamsa)
         jd = self._convert_date_to_jd(date)
-        flags = swe.FLG_SWIEPH | swe.FLG_SIDEREAL | swe.FLG_TRUEPOS
         
         try:
-            result = swe.calc_ut(jd, self.PLANETS[planet], flags)
-            if isinstance(result, int):
-                raise RuntimeError(f"swe.calc_ut failed with error code: {result}")
-            pos, _ = result
-            longitude = pos[0]  # Sidereal longitude in degrees
+            longitude = self._longitude_at(jd, self.PLANETS[planet], sid_mode)  # Sidereal longitude in degrees
             
             # Special case for Ketu (opposite to Rahu)
             if planet == 'ketu':
@@ -135,13 +488,64 @@ class AstrologyCalculator:
         except Exception as e:
             raise RuntimeError(f"Error calculating {planet} position: {e}")
     
-    def calculate_ascendant_sidereal_longitude(self, date, latitude, longitude, house_system='P'):
+    def calculate_sidereal_position(self, date, planet, ayanamsa=None):
+        """
+        Calculate the sidereal longitude and daily speed for any planet.
+        
+        Both values come from a single ``swe.calc_ut`` call (``FLG_SPEED``).
+        
+        Parameters
+        ----------
+        date : str, datetime, float or astropy.time.Time
+            Date of observation (floats are taken as Julian Days)
+        planet : str
+            Planet name (see ``calculate_sidereal_longitude``)
+        ayanamsa : str, optional
+            Ayanamsa system, one of ``AYANAMSAS`` (default: the calculator's ayanamsa)
+        
+        Returns
+        -------
+        tuple of float
+            (sidereal longitude in degrees, speed in degrees per day; negative
+            while retrograde)
+        """
+        planet = planet.lower()
+        
+        if planet not in self.PLANETS:
+            available = ', '.join(self.PLANETS.keys())
+            raise ValueError(f"Unknown planet '{planet}'. Available: {available}")
+        
+        sid_mode = self._resolve_sid_mode(ayanamsa)
+        jd = self._convert_date_to_jd(date)
+        
+        try:
+            longitude, speed = self._position_at(jd, self.PLANETS[planet], sid_mode)
+            
+            # Special case for Ketu (opposite to Rahu)
+            if planet == 'ketu':
+                longitude = (longitude + 180) % 360
+                
+            return longitude, speed
+            
+        except Exception as e:
+            raise RuntimeError(f"Error calculating {planet} position: {e}")
+    
+    def _validate_location(self, latitude, longitude, house_system):
+        """Validate coordinates and house system for Ascendant calculations."""
+        if not -90 <= latitude <= 90:
+            raise ValueError(f"Latitude {latitude} is invalid. Must be between -90 and 90 degrees.")
+        if not -180 <= longitude <= 180:
+            raise ValueError(f"Longitude {longitude} is invalid. Must be between -180 and 180 degrees.")
+        if house_system not in self.HOUSE_SYSTEMS:
+            raise ValueError(f"Invalid house system '{house_system}'. Use 'P' for Placidus, 'E' for Equal House, etc.")
+    
+    def calculate_ascendant_sidereal_longitude(self, date, latitude, longitude, house_system='P', ayanamsa=None):
         """
         Calculate the sidereal longitude of the Ascendant (Lagna).
         
         Parameters
         ----------
-        date : str or astropy.time.Time
+        date : str, datetime or astropy.time.Time
             Date and time of observation (e.g., '2025-05-11 14:30:00')
         latitude : float
             Geographic latitude in degrees (positive for North, negative for South)
@@ -149,59 +553,406 @@ class AstrologyCalculator:
             Geographic longitude in degrees (positive for East, negative for West)
         house_system : str, optional
             House system for calculation ('P' for Placidus, 'E' for Equal House, etc.)
+        ayanamsa : str, optional
+            Ayanamsa system, one of ``AYANAMSAS`` (default: the calculator's ayanamsa)
         
         Returns
         -------
         float
             Ascendant's sidereal longitude in degrees
         """
-        # Validate inputs
-        if not -90 <= latitude <= 90:
-            raise ValueError(f"Latitude {latitude} is invalid. Must be between -90 and 90 degrees.")
-        if not -180 <= longitude <= 180:
-            raise ValueError(f"Longitude {longitude} is invalid. Must be between -180 and 180 degrees.")
-        if house_system not in ['P', 'E', 'K', 'R', 'C', 'U', 'V', 'X', 'H', 'T', 'B', 'G', 'Y', 'M', 'A', 'O', 'F', 'D', 'I', 'N', 'S', 'W']:
-            raise ValueError(f"Invalid house system '{house_system}'. Use 'P' for Placidus, 'E' for Equal House, etc.")
-        
+        self._validate_location(latitude, longitude, house_system)
+        sid_mode = self._resolve_sid_mode(ayanamsa)
         jd = self._convert_date_to_jd(date)
         
         try:
-            cusps, ascmc = swe.houses_ex(jd, latitude, longitude, house_system.encode('ascii'), flags=swe.FLG_SIDEREAL)
+            cusps, ascmc = self._houses_at(jd, latitude, longitude, house_system, sid_mode)
             return ascmc[0]  # Ascendant longitude in degrees
         except Exception as e:
             raise RuntimeError(f"Error calculating Ascendant's position: {e}")
     
-    def get_all_planetary_positions(self, date, latitude=None, longitude=None):
+    def calculate_ascendant_speed(self, date, latitude, longitude, house_system='P', ayanamsa=None):
         """
-        Calculate all planetary positions for a given date and location.
+        Calculate the daily speed of the sidereal Ascendant.
+        
+        Swiss Ephemeris gives no speed for house angles, so it is the central
+        difference of the Ascendant over ``ASCENDANT_SPEED_STEP`` on both sides.
+        
+        Parameters
+        ----------
+        date : str, datetime or astropy.time.Time
+            Date and time of observation
+        latitude : float
+            Geographic latitude in degrees
+        longitude : float
+            Geographic longitude in degrees
+        house_system : str, optional
+            House system for calculation ('P' for Placidus by default)
+        ayanamsa : str, optional
+            Ayanamsa system, one of ``AYANAMSAS`` (default: the calculator's ayanamsa)
+        
+        Returns
+        -------
+        float
+            Speed of the Ascendant in degrees per day
+        """
+        self._validate_location(latitude, longitude, house_system)
+        sid_mode = self._resolve_sid_mode(ayanamsa)
+        jd = self._convert_date_to_jd(date)
+        step = self.ASCENDANT_SPEED_STEP
+        
+        try:
+            _, before = self._houses_at(jd - step, latitude, longitude, house_system, sid_mode)
+            _, after = self._houses_at(jd + step, latitude, longitude, house_system, sid_mode)
+        except Exception as e:
+            raise RuntimeError(f"Error calculating Ascendant's speed: {e}")
+        # Difference wrapped to (-180, 180] across 0 degrees
+        change = (after[0] - before[0] + 180) % 360 - 180
+        return change / (2 * step)
+    
+    def ascendant_function(self, start, end, latitude, longitude, ayanamsa=None):
+        """
+        Build a fast sidereal Ascendant function for a short time window.
+        
+        Only the Earth's rotation changes the Ascendant noticeably within a
+        few days, so the sidereal time, obliquity and ayanamsa are taken at the
+        ends of the window and interpolated linearly; every evaluation is then
+        a single ``swe.houses_armc`` call without any ephemeris lookups.
+        
+        Parameters
+        ----------
+        start, end : str, datetime or float
+            Window of at most ``ASCENDANT_WINDOW`` days (UTC)
+        latitude : float
+            Geographic latitude in degrees
+        longitude : float
+            Geographic longitude in degrees
+        ayanamsa : str, optional
+            Ayanamsa system, one of ``AYANAMSAS`` (default: the calculator's ayanamsa)
+        
+        Returns
+        -------
+        callable
+            Function of a Julian Day returning the sidereal Ascendant in degrees
+        """
+        self._validate_location(latitude, longitude, 'E')
+        sid_mode = self._resolve_sid_mode(ayanamsa)
+        start = self._convert_date_to_jd(start)
+        end = self._convert_date_to_jd(end)
+        span = end - start
+        if not 0 < span <= self.ASCENDANT_WINDOW:
+            raise ValueError(f"Window must be longer than zero and at most {self.ASCENDANT_WINDOW:g} days.")
+        
+        (start_time, start_obliquity), (end_time, end_obliquity) = \
+            self._house_frame_at(start), self._house_frame_at(end)
+        start_armc = (start_time * 15 + longitude) % 360
+        # ARMC travelled over the window: the mean rotation plus the small
+        # change of the equation of the equinoxes
+        nominal = self.SIDEREAL_RATE * span
+        armc_rate = (nominal + ((end_time - start_time) * 15 - nominal + 180) % 360 - 180) / span
+        obliquity_rate = (end_obliquity - start_obliquity) / span
+        start_ayanamsa, end_ayanamsa = self._ayanamsas_at([start, end], sid_mode)
+        ayanamsa_rate = (end_ayanamsa - start_ayanamsa) / span
+        
+        def ascendant(jd):
+            dt = jd - start
+            _, ascmc = swe.houses_armc((start_armc + armc_rate * dt) % 360, latitude,
+                                       start_obliquity + obliquity_rate * dt, b'E')
+            return (ascmc[0] - start_ayanamsa - ayanamsa_rate * dt) % 360
+        
+        return ascendant
+    
+    def position_function(self, planet, ayanamsa=None):
+        """
+        Build an uncached sidereal position function for event searches.
+        
+        Root finding evaluates positions at arbitrary instants closer together
+        than the position cache's resolution, so every evaluation reads the
+        Chebyshev store (when it covers the date) or makes one sidereal
+        ``swe.calc_ut`` call at the exact Julian Day. The cache is neither read
+        nor filled, like in ``iter_longitudes``.
+        
+        Parameters
+        ----------
+        planet : str
+            Planet name (see ``calculate_sidereal_longitude``)
+        ayanamsa : str, optional
+            Ayanamsa system, one of ``AYANAMSAS`` (default: the calculator's ayanamsa)
+        
+        Returns
+        -------
+        callable
+            Function of a Julian Day returning (sidereal longitude in degrees,
+            speed in degrees per day)
+        """
+        planet = planet.lower()
+        if planet not in self.PLANETS:
+            available = ', '.join(self.PLANETS.keys())
+            raise ValueError(f"Unknown planet '{planet}'. Available: {available}")
+        sid_mode = self._resolve_sid_mode(ayanamsa)
+        body = self.PLANETS[planet]
+        flags = self.CALC_FLAGS | swe.FLG_SIDEREAL
+        # Ketu is opposite to Rahu
+        shift = 180 if planet == 'ketu' else 0
+        
+        def position(jd):
+            if self._store_covers(body, jd, sid_mode):
+                longitude, speed = self.ephemeris_store.position(body, jd)
+            else:
+                with _SID_MODE_LOCK:
+                    swe.set_sid_mode(sid_mode)
+                    result = swe.calc_ut(jd, body, flags)
+                if isinstance(result, int):
+                    raise RuntimeError(f"swe.calc_ut failed with error code: {result}")
+                longitude, speed = result[0][0], result[0][3]
+            return (longitude + shift) % 360, speed
+        
+        return position
+    
+    def calculate_houses(self, date, latitude, longitude, house_systems=('P',), ayanamsa=None):
+        """
+        Calculate the house cusps of several house systems in one pass.
+        
+        The Julian Day, sidereal time, obliquity and ayanamsa are computed once
+        and shared by all systems; cusps are cached per (jd, location, system).
+        
+        Parameters
+        ----------
+        date : str, datetime or astropy.time.Time
+            Date and time of observation
+        latitude : float
+            Geographic latitude in degrees
+        longitude : float
+            Geographic longitude in degrees
+        house_systems : iterable of str, optional
+            House systems from ``HOUSE_SYSTEMS`` (default: Placidus only)
+        ayanamsa : str, optional
+            Ayanamsa system, one of ``AYANAMSAS`` (default: the calculator's ayanamsa)
+        
+        Returns
+        -------
+        dict
+            Sidereal cusps keyed by house system (12 values; 36 Gauquelin sectors for 'G')
+        
+        Raises
+        ------
+        ValueError
+            For a system of ``POLAR_UNDEFINED_HOUSE_SYSTEMS`` at a latitude
+            within a polar circle (beyond 90 degrees minus the obliquity)
+        """
+        house_systems = list(house_systems)
+        for house_system in house_systems:
+            self._validate_location(latitude, longitude, house_system)
+        sid_mode = self._resolve_sid_mode(ayanamsa)
+        jd = self._convert_date_to_jd(date)
+        
+        polar = [code for code in house_systems if code in self.POLAR_UNDEFINED_HOUSE_SYSTEMS]
+        if polar:
+            limit = 90 - self._house_frame_at(jd)[1]
+            if abs(latitude) >= limit:
+                raise ValueError(f"House system '{polar[0]}' is undefined within the polar circles: "
+                                 f"latitude {latitude} is beyond ±{limit:.2f} degrees. "
+                                 f"Use an Ascendant-based system such as 'O' (Porphyry) or 'W'.")
+        
+        houses = {}
+        for house_system in house_systems:
+            try:
+                cusps, _ = self._houses_at(jd, latitude, longitude, house_system, sid_mode)
+            except Exception as e:
+                raise RuntimeError(f"Error calculating '{house_system}' houses: {e}")
+            houses[house_system] = cusps
+        return houses
+    
+    def lagna_table(self, date, latitude, longitude, ayanamsa=None, precision=PRECISION):
+        """
+        Find the times at which each lagna (Ascendant sign) rises over one day.
+        
+        The Ascendant is sampled every ``LAGNA_SAMPLE_STEP`` and each sign
+        boundary it passes is located by root-finding on ``swe.houses_ex``,
+        which takes about a hundred house calculations instead of one per
+        minute. Coordinates are rounded to ``LAGNA_COORD_DECIMALS`` places and
+        tables are cached per (start, rounded location, ayanamsa).
         
         Parameters
         ----------
-        date : str or astropy.time.Time
+        date : str, datetime or float
+            Start of the 24-hour window (UTC)
+        latitude : float
+            Geographic latitude in degrees
+        longitude : float
+            Geographic longitude in degrees
+        ayanamsa : str, optional
+            Ayanamsa system, one of ``AYANAMSAS`` (default: the calculator's ayanamsa)
+        precision : float, optional
+            Precision of the boundary times in days (default: one second)
+        
+        Returns
+        -------
+        list of dict
+            One entry per lagna in rising order, with 'sign_number', 'sign_name',
+            'start_jd' / 'end_jd' and 'start' / 'end' (UTC datetimes). The first
+            and last entries are clipped to the window.
+        """
+        self._validate_location(latitude, longitude, 'E')
+        sid_mode = self._resolve_sid_mode(ayanamsa)
+        start = self._convert_date_to_jd(date)
+        latitude = round(latitude, self.LAGNA_COORD_DECIMALS)
+        longitude = round(longitude, self.LAGNA_COORD_DECIMALS)
+        
+        key = self.cache.key(start, 'lagna_table', latitude, longitude, sid_mode, precision)
+        table = self.cache.get(key)
+        if table is None:
+            try:
+                table = self._compute_lagna_table(start, latitude, longitude, sid_mode, precision)
+            except Exception as e:
+                raise RuntimeError(f"Error calculating lagna table: {e}")
+            self.cache.put(key, table)
+        return [dict(entry) for entry in table]
+    
+    def _compute_lagna_table(self, start, latitude, longitude, sid_mode, precision):
+        """Scan one day from ``start`` and build the lagna table (uncached)."""
+        # The ayanamsa is linear over a day to far below the precision
+        ayanamsa = self._ayanamsa_at(start, sid_mode)
+        rate = self._ayanamsa_rate_at(start, sid_mode)
+        
+        def ascendant(jd):
+            _, ascmc = swe.houses_ex(jd, latitude, longitude, b'E')
+            return (ascmc[0] - ayanamsa - rate * (jd - start)) % 360
+        
+        crossings = []
+        
+        def scan(t0, asc0, t1, asc1):
+            passed = int(asc1 // 30 - asc0 // 30) % 12
+            if passed == 0:
+                return
+            if passed > 1 and t1 - t0 > precision:
+                middle = (t0 + t1) / 2
+                asc_middle = ascendant(middle)
+                scan(t0, asc0, middle, asc_middle)
+                scan(middle, asc_middle, t1, asc1)
+                return
+            boundary = asc1 // 30 * 30
+            offset = lambda jd: (ascendant(jd) - boundary + 180) % 360 - 180
+            jd = bracketed_root(offset, t0, t1, precision,
+                                (asc0 - boundary + 180) % 360 - 180,
+                                (asc1 - boundary + 180) % 360 - 180)
+            crossings.append((jd, int(asc1 // 30)))
+        
+        samples = int(round(1.0 / self.LAGNA_SAMPLE_STEP))
+        t0, asc0 = start, ascendant(start)
+        for i in range(1, samples + 1):
+            t1 = start + i / samples
+            asc1 = ascendant(t1)
+            scan(t0, asc0, t1, asc1)
+            t0, asc0 = t1, asc1
+        
+        end = start + 1.0
+        table = []
+        sign_index = int(ascendant(start) // 30)
+        period_start = start
+        for jd, next_index in crossings + [(end, None)]:
+            table.append({
+                'sign_number': sign_index + 1,
+                'sign_name': self.longitude_to_sign_name(sign_index * 30),
+                'start_jd': period_start,
+                'end_jd': jd,
+                'start': from_julian_day(period_start),
+                'end': from_julian_day(jd),
+            })
+            sign_index, period_start = next_index, jd
+        return table
+    
+    def calculate_chart(self, date, latitude=None, longitude=None, house_system='P', ayanamsa=None):
+        """
+        Calculate a complete chart for one instant in a single pass.
+        
+        The date is converted to a Julian Day once, each distinct Swiss Ephemeris
+        body is calculated once (Ketu is derived from Rahu) and a single
+        ``swe.houses_ex`` call provides both the Ascendant and the house cusps.
+        Daily speeds come from the same ``swe.calc_ut`` calls (``FLG_SPEED``).
+        Positions are computed tropically and shifted by the ayanamsa, so charts
+        for further ayanamsas at the same instant are served from the cache.
+        
+        Parameters
+        ----------
+        date : str, datetime or astropy.time.Time
             Date and time of observation
         latitude : float, optional
-            Geographic latitude (required for Ascendant calculation)
+            Geographic latitude (required for Ascendant and houses)
         longitude : float, optional
-            Geographic longitude (required for Ascendant calculation)
+            Geographic longitude (required for Ascendant and houses)
+        house_system : str, optional
+            House system for the cusps ('P' for Placidus by default)
+        ayanamsa : str, optional
+            Ayanamsa system, one of ``AYANAMSAS`` (default: the calculator's ayanamsa)
         
         Returns
         -------
         dict
-            Dictionary containing all planetary positions in degrees
+            'jd': Julian Day of the chart,
+            'ayanamsa': ayanamsa value in degrees,
+            'positions': sidereal longitudes keyed by body name ('Sun', ..., 'Ascendant'),
+            'speeds': daily speeds in degrees keyed by planet name (negative
+            while retrograde; the Ascendant has no entry),
+            'cusps': the 12 house cusps (None without coordinates),
+            'ascmc': the ``swe.houses_ex`` angles tuple (None without coordinates)
         """
-        # Calculate all planets using the single function
-        planet_names = ['sun', 'moon', 'mercury', 'venus', 'mars', 
-                       'jupiter', 'saturn', 'uranus', 'neptune', 'rahu', 'ketu']
+        with_ascendant = latitude is not None and longitude is not None
+        if with_ascendant:
+            self._validate_location(latitude, longitude, house_system)
         
+        sid_mode = self._resolve_sid_mode(ayanamsa)
+        jd = self._convert_date_to_jd(date)
         positions = {}
-        for planet in planet_names:
-            positions[planet.capitalize()] = self.calculate_sidereal_longitude(date, planet)
+        speeds = {}
+        cusps = ascmc = None
+        
+        try:
+            for planet, body in self.PLANETS.items():
+                if planet == 'ketu':
+                    # Ketu is opposite to Rahu and moves with it
+                    positions['Ketu'] = (positions['Rahu'] + 180) % 360
+                    speeds['Ketu'] = speeds['Rahu']
+                else:
+                    name = planet.capitalize()
+                    positions[name], speeds[name] = self._position_at(jd, body, sid_mode)
+            
+            if with_ascendant:
+                cusps, ascmc = self._houses_at(jd, latitude, longitude, house_system, sid_mode)
+                positions['Ascendant'] = ascmc[0]
+        except Exception as e:
+            raise RuntimeError(f"Error calculating chart: {e}")
+        
+        return {
+            'jd': jd,
+            'ayanamsa': self._ayanamsa_at(jd, sid_mode),
+            'positions': positions,
+            'speeds': speeds,
+            'cusps': cusps[:12] if cusps is not None else None,
+            'ascmc': ascmc,
+        }
+    
+    def get_all_planetary_positions(self, date, latitude=None, longitude=None, ayanamsa=None):
+        """
+        Calculate all planetary positions for a given date and location.
         
-        # Add Ascendant if coordinates are provided
-        if latitude is not None and longitude is not None:
-            positions['Ascendant'] = self.calculate_ascendant_sidereal_longitude(date, latitude, longitude)
+        Parameters
+        ----------
+        date : str, datetime or astropy.time.Time
+            Date and time of observation
+        latitude : float, optional
+            Geographic latitude (required for Ascendant calculation)
+        longitude : float, optional
+            Geographic longitude (required for Ascendant calculation)
+        ayanamsa : str, optional
+            Ayanamsa system, one of ``AYANAMSAS`` (default: the calculator's ayanamsa)
         
-        return positions
+        Returns
+        -------
+        dict
+            Dictionary containing all planetary positions in degrees
+        """
+        return self.calculate_chart(date, latitude, longitude, ayanamsa=ayanamsa)['positions']
     
     @staticmethod
     def place_coordinates():
@@ -282,28 +1033,45 @@ class AstrologyCalculator:
         """
         return longitude % 30
     
-    def get_planetary_chart_data(self, date, latitude=None, longitude=None):
+    def get_planetary_chart_data(self, date, latitude=None, longitude=None, ayanamsa=None):
         """
         Get complete chart data with signs and degrees for all planets.
         
         Parameters
         ----------
-        date : str or astropy.time.Time
+        date : str, datetime or astropy.time.Time
             Date and time of observation
         latitude : float, optional
             Geographic latitude
         longitude : float, optional
             Geographic longitude
+        ayanamsa : str, optional
+            Ayanamsa system, one of ``AYANAMSAS`` (default: the calculator's ayanamsa)
         
         Returns
         -------
         dict
-            Complete chart data with positions, signs, and degrees
+            Complete chart data with positions, signs, and degrees. Planets also
+            carry their daily 'speed' and a 'retrograde' flag.
+        """
+        return self.chart_to_data(self.calculate_chart(date, latitude, longitude, ayanamsa=ayanamsa))
+    
+    def chart_to_data(self, chart):
         """
-        positions = self.get_all_planetary_positions(date, latitude, longitude)
+        Convert a ``calculate_chart`` result to chart data with signs and degrees.
         
+        Parameters
+        ----------
+        chart : dict
+            Result of ``calculate_chart``
+        
+        Returns
+        -------
+        dict
+            Same structure as ``get_planetary_chart_data``
+        """
         chart_data = {}
-        for planet, long in positions.items():
+        for planet, long in chart['positions'].items():
             chart_data[planet] = {
                 'longitude': long,
                 'sign_number': self.longitude_to_sign(long),
@@ -311,9 +1079,219 @@ class AstrologyCalculator:
                 'degree_in_sign': self.longitude_to_degree_in_sign(long),
                 'formatted': f"{self.longitude_to_sign_name(long)} {self.longitude_to_degree_in_sign(long):.2f}°"
             }
+            if planet in chart['speeds']:
+                speed = chart['speeds'][planet]
+                chart_data[planet]['speed'] = speed
+                chart_data[planet]['retrograde'] = speed < 0
         
         return chart_data
 
+    def calculate_longitudes_batch(self, dates, latitudes=None, longitudes=None, house_system='P', ayanamsa=None):
+        """
+        Calculate sidereal longitudes for many instants in one call.
+        
+        The dates are converted to Julian Days once for the whole batch, so the
+        per-chart cost is reduced to the raw Swiss Ephemeris calls (or a single
+        vectorized polynomial evaluation per body when a Chebyshev store covers
+        all dates). Ketu is derived from the Rahu position instead of a second
+        node calculation. The ayanamsa is read once per date and shared by
+        all bodies. Batch results bypass the position cache.
+        
+        Parameters
+        ----------
+        dates : array_like
+            Dates of observation (see ``julian_day.to_julian_days`` for accepted forms)
+        latitudes : float or array_like, optional
+            Geographic latitudes (required for Ascendant calculation)
+        longitudes : float or array_like, optional
+            Geographic longitudes (required for Ascendant calculation)
+        house_system : str, optional
+            House system used for the Ascendant ('P' for Placidus by default)
+        ayanamsa : str, optional
+            Ayanamsa system, one of ``AYANAMSAS`` (default: the calculator's ayanamsa)
+        
+        Returns
+        -------
+        dict
+            Mapping of body name ('Sun', ..., 'Ketu', 'Ascendant') to a float64
+            array of longitudes with one value per date
+        """
+        sid_mode = self._resolve_sid_mode(ayanamsa)
+        jds = self._convert_dates_to_jd(dates)
+        n = len(jds)
+        
+        with_ascendant = latitudes is not None and longitudes is not None
+        if with_ascendant:
+            lats = np.broadcast_to(np.asarray(latitudes, dtype=np.float64), (n,))
+            lons = np.broadcast_to(np.asarray(longitudes, dtype=np.float64), (n,))
+            if np.any((lats < -90) | (lats > 90)):
+                raise ValueError("Latitudes must be between -90 and 90 degrees.")
+            if np.any((lons < -180) | (lons > 180)):
+                raise ValueError("Longitudes must be between -180 and 180 degrees.")
+            if house_system not in self.HOUSE_SYSTEMS:
+                raise ValueError(f"Invalid house system '{house_system}'. Use 'P' for Placidus, 'E' for Equal House, etc.")
+            hsys = house_system.encode('ascii')
+        
+        longitudes_by_body = {}
+        ayanamsas = None
+        calc_ut, flags = swe.calc_ut, self.CALC_FLAGS
+        try:
+            for planet, body in self.PLANETS.items():
+                if planet == 'ketu':
+                    longitudes_by_body['Ketu'] = (longitudes_by_body['Rahu'] + 180) % 360
+                    continue
+                if self._store_covers(body, jds, sid_mode):
+                    longitudes_by_body[planet.capitalize()] = self.ephemeris_store.longitudes(body, jds)
+                    continue
+                if ayanamsas is None:
+                    ayanamsas = self._ayanamsas_at(jds.tolist(), sid_mode)
+                tropical = np.fromiter((calc_ut(jd, body, flags)[0][0] for jd in jds.tolist()),
+                                       dtype=np.float64, count=n)
+                longitudes_by_body[planet.capitalize()] = (tropical - ayanamsas) % 360
+            if with_ascendant:
+                if ayanamsas is None:
+                    ayanamsas = self._ayanamsas_at(jds.tolist(), sid_mode)
+                ascendant = np.empty(n, dtype=np.float64)
+                for i, jd in enumerate(jds.tolist()):
+                    _, ascmc = swe.houses_ex(jd, lats[i], lons[i], hsys)
+                    ascendant[i] = ascmc[0]
+                longitudes_by_body['Ascendant'] = (ascendant - ayanamsas) % 360
+        except Exception as e:
+            raise RuntimeError(f"Error calculating batch positions: {e}")
+        
+        return longitudes_by_body
+    
+    def iter_longitudes(self, planet, start, end, step, chunk=4096, ayanamsa=None):
+        """
+        Stream a body's sidereal longitude and speed over a date range.
+        
+        Samples ``start, start + step, ...`` up to (excluding) ``end`` and yields
+        them in NumPy chunks, so memory stays flat however long the range is.
+        Samples are computed straight into the chunk arrays without datetime or
+        per-sample result objects: with a Chebyshev store covering the chunk it
+        is one vectorized evaluation, otherwise one ``swe.calc_ut`` call per
+        sample. The ayanamsa is read every ``AYANAMSA_NODE_STEP`` days across
+        the chunk and interpolated linearly (per sample for coarser steps).
+        The position cache is bypassed.
+        
+        Parameters
+        ----------
+        planet : str
+            Planet name ('sun', 'moon', ..., 'rahu', 'ketu')
+        start, end : str, datetime or float
+            Date range (see ``julian_day.to_julian_day`` for accepted forms)
+        step : float or datetime.timedelta
+            Sampling interval (floats are in days)
+        chunk : int, optional
+            Number of samples per yielded chunk (default: 4096)
+        ayanamsa : str, optional
+            Ayanamsa system, one of ``AYANAMSAS`` (default: the calculator's ayanamsa)
+        
+        Yields
+        ------
+        tuple of numpy.ndarray
+            (Julian Days, sidereal longitudes in degrees, speeds in degrees per
+            day), each float64 with up to ``chunk`` values
+        """
+        planet = planet.lower()
+        if planet not in self.PLANETS:
+            available = ', '.join(self.PLANETS.keys())
+            raise ValueError(f"Unknown planet '{planet}'. Available: {available}")
+        if hasattr(step, 'total_seconds'):
+            step = step.total_seconds() / 86400
+        if step <= 0:
+            raise ValueError("Step must be positive.")
+        if chunk < 1:
+            raise ValueError("Chunk size must be at least 1.")
+        
+        sid_mode = self._resolve_sid_mode(ayanamsa)
+        body = self.PLANETS[planet]
+        start_jd = self._convert_date_to_jd(start)
+        end_jd = self._convert_date_to_jd(end)
+        count = max(int(np.ceil((end_jd - start_jd) / step)), 0)
+        calc_ut, flags = swe.calc_ut, self.CALC_FLAGS
+        
+        for offset in range(0, count, chunk):
+            jds = start_jd + step * np.arange(offset, min(offset + chunk, count), dtype=np.float64)
+            if self._store_covers(body, jds, sid_mode):
+                longitudes = self.ephemeris_store.longitudes(body, jds)
+                speeds = self.ephemeris_store.speeds(body, jds)
+            else:
+                longitudes = np.empty(len(jds))
+                speeds = np.empty(len(jds))
+                try:
+                    for i, jd in enumerate(jds.tolist()):
+                        pos = calc_ut(jd, body, flags)[0]
+                        longitudes[i] = pos[0]
+                        speeds[i] = pos[3]
+                except Exception as e:
+                    raise RuntimeError(f"Error calculating {planet} positions: {e}")
+                longitudes -= self._chunk_ayanamsas(jds, sid_mode)
+                longitudes %= 360
+                speeds -= self._ayanamsa_rate_at(jds[0], sid_mode)
+            if planet == 'ketu':
+                longitudes = (longitudes + 180) % 360
+            yield jds, longitudes, speeds
+    
+    def _chunk_ayanamsas(self, jds, sid_mode):
+        """Ayanamsa values for an ascending array of Julian Days, interpolated between nodes."""
+        node_step = self.AYANAMSA_NODE_STEP
+        first = np.floor(jds[0] / node_step)
+        nodes = node_step * np.arange(first, np.floor(jds[-1] / node_step) + 2)
+        if len(nodes) >= len(jds):
+            return self._ayanamsas_at(jds.tolist(), sid_mode)
+        return np.interp(jds, nodes, self._ayanamsas_at(nodes.tolist(), sid_mode))
+    
+    def get_planetary_chart_data_batch(self, dates, latitudes=None, longitudes=None, house_system='P', ayanamsa=None):
+        """
+        Get chart data for many instants in one call.
+        
+        See ``calculate_longitudes_batch`` for how the positions are computed.
+        
+        Parameters
+        ----------
+        dates : array_like
+            Dates of observation (see ``julian_day.to_julian_days`` for accepted forms)
+        latitudes : float or array_like, optional
+            Geographic latitudes (required for Ascendant calculation)
+        longitudes : float or array_like, optional
+            Geographic longitudes (required for Ascendant calculation)
+        house_system : str, optional
+            House system used for the Ascendant ('P' for Placidus by default)
+        ayanamsa : str, optional
+            Ayanamsa system, one of ``AYANAMSAS`` (default: the calculator's ayanamsa)
+        
+        Returns
+        -------
+        dict
+            Mapping of body name ('Sun', ..., 'Ketu', 'Ascendant') to a structured
+            array of ``CHART_DTYPE`` with one record per date
+        """
+        longitudes_by_body = self.calculate_longitudes_batch(dates, latitudes, longitudes, house_system, ayanamsa)
+        return {body: self.to_chart_records(longs) for body, longs in longitudes_by_body.items()}
+    
+    @classmethod
+    def to_chart_records(cls, longitudes):
+        """
+        Convert an array of longitudes to ``CHART_DTYPE`` records.
+        
+        Parameters
+        ----------
+        longitudes : array_like
+            Longitudes in degrees
+        
+        Returns
+        -------
+        numpy.ndarray
+            Structured array with longitude, sign number and degree in sign
+        """
+        longitudes = np.asarray(longitudes, dtype=np.float64)
+        records = np.empty(longitudes.shape, dtype=cls.CHART_DTYPE)
+        records['longitude'] = longitudes
+        records['sign_number'] = (longitudes // 30).astype(np.int8) + 1
+        records['degree_in_sign'] = longitudes % 30
+        return records
+
 
 # Standalone functions - simplified interface
 def calculate_sidereal_longitude(date, planet, ephe_path='ephe'):
@@ -322,7 +1300,7 @@ def calculate_sidereal_longitude(date, planet, ephe_path='ephe'):
     
     Parameters
     ----------
-    date : str or astropy.time.Time
+    date : str, datetime or astropy.time.Time
         Date of observation (e.g., '2025-05-11')
     planet : str
         Planet name ('sun', 'moon', 'mercury', 'venus', 'mars', 
@@ -0,0 +1,191 @@
+"""
+Chart Renderer
+==============
+
+Draw North-Indian style charts of any divisional chart as PNG images.
+
+``render_chart`` is a plain function: it maps the positions through
+``divisional_charts.DIVISIONAL_CHARTS`` and returns the image bytes.
+Importing this module reads no input, touches no network and writes no files.
+
+The chart frame (background, outer square, diagonals and inner diamond) is
+the same for every chart, so it is drawn once per image size with Pillow and
+cached. Each chart only pastes the cached glyph masks of its house numbers and
+planet labels onto a blank layer, adds that to the frame and writes the result
+as a palette PNG, which keeps a chart to about 2 ms instead of the hundreds a
+matplotlib figure takes.
+
+Usage:
+    positions = calc.calculate_chart(date, latitude, longitude, 'W')['positions']
+    png = render_chart('D9', positions)
+    save_chart('D9', positions)   # writes D9.png to CHART_OUTPUT_DIR
+"""
+
+import io
+import os
+from functools import lru_cache
+
+from PIL import Image, ImageChops, ImageDraw, ImageFont
+
+from divisional_charts import DIVISIONAL_CHARTS
+
+# Directory the D-module scripts save their charts to
+CHART_OUTPUT_DIR = os.path.join(os.path.expanduser("~"), "Desktop", "draw", 'merger', 'kundlis')
+
+# Default width and height of a chart image in pixels
+CHART_SIZE = 480
+
+# Lines of the North-Indian chart on a 10 x 10 canvas: the outer square, both
+# diagonals and the inner diamond
+CHART_LINES = [
+    ((0, 0), (10, 0)), ((10, 0), (10, 10)), ((10, 10), (0, 10)), ((0, 10), (0, 0)),
+    ((0, 0), (10, 10)), ((0, 10), (10, 0)),
+    ((0, 5), (5, 10)), ((5, 10), (10, 5)), ((10, 5), (5, 0)), ((5, 0), (0, 5)),
+]
+
+# Label positions of houses 1-12, counter-clockwise from the top diamond
+HOUSE_COORDS = [
+    (4.3, 8.5), (1.5, 9), (.2, 8), (1.5, 5.5), (.2, 2), (2, 1.5),
+    (4, 3), (7, 1.5), (8.4, 2.4), (6, 5), (8, 7.4), (6.5, 9)
+]
+
+# Vertical spacing of planets that share a house (canvas units)
+PLANET_LINE_SPACING = 0.5
+
+# Border around the chart as a fraction of the image size
+_MARGIN = 0.04
+
+# Colours of the chart background, the chart square and its lines. The frame
+# is kept as an 8-bit layer holding the colour index times _SHADES; text
+# coverage (0 to _SHADES - 1) is added to it, and the palette maps every sum
+# to the colour darkened towards the black of the labels.
+_COLOURS = ((211, 211, 211), (173, 216, 230), (0, 0, 255))
+_SHADES = 8
+_PALETTE = [round(channel * (1 - shade / (_SHADES - 1)))
+            for colour in _COLOURS for shade in range(_SHADES) for channel in colour]
+_COVERAGE_LEVELS = [value * _SHADES // 256 for value in range(256)]
+
+
+def _to_pixels(size, x, y):
+    """Convert 10 x 10 canvas coordinates (y up) to image pixels (y down)."""
+    margin = size * _MARGIN
+    scale = (size - 2 * margin) / 10
+    return margin + x * scale, margin + (10 - y) * scale
+
+
+@lru_cache(maxsize=None)
+def _font(pixels):
+    """Scalable font of the given height, shared by all charts."""
+    try:
+        return ImageFont.truetype("DejaVuSans.ttf", pixels)
+    except OSError:
+        return ImageFont.load_default(pixels)
+
+
+@lru_cache(maxsize=1024)
+def _glyph(char, pixels):
+    """Mask of a character, its offset from the baseline origin and its advance."""
+    font = _font(pixels)
+    left, top, right, bottom = font.getbbox(char, anchor='ls')
+    mask = None
+    if right > left and bottom > top:
+        mask = Image.new('L', (right - left, bottom - top))
+        ImageDraw.Draw(mask).text((-left, -top), char, fill=255, font=font, anchor='ls')
+    return mask, (left, top), font.getlength(char)
+
+
+def _draw_label(coverage, position, text, pixels):
+    """Paste the cached glyphs of ``text`` into ``coverage`` from a baseline origin."""
+    x, y = position
+    for char in text:
+        mask, (left, top), advance = _glyph(char, pixels)
+        if mask is not None:
+            coverage.paste(255, (round(x + left), round(y + top)), mask)
+        x += advance
+
+
+@lru_cache(maxsize=8)
+def _template(size):
+    """The static chart frame for an image size (drawn once, then cached)."""
+    image = Image.new('L', (size, size), 0)
+    draw = ImageDraw.Draw(image)
+    draw.rectangle([_to_pixels(size, 0, 10), _to_pixels(size, 10, 0)], fill=_SHADES)
+    width = max(1, size // 240)
+    for start, end in CHART_LINES:
+        draw.line([_to_pixels(size, *start), _to_pixels(size, *end)], fill=2 * _SHADES, width=width)
+    return image
+
+
+def _longitude(data):
+    """Longitude of a position given as a number or a dict with 'longitude'."""
+    return data['longitude'] if isinstance(data, dict) else data
+
+
+def render_chart(chart_type, positions, size=CHART_SIZE):
+    """
+    Render a divisional chart as a PNG image.
+
+    Parameters
+    ----------
+    chart_type : str
+        A key of ``divisional_charts.DIVISIONAL_CHARTS`` (e.g. 'D1', 'D9')
+    positions : dict
+        D1 sidereal longitudes keyed by body name, as numbers or dicts with a
+        'longitude'; must include 'Ascendant', which fixes the first house
+    size : int, optional
+        Width and height of the square image in pixels (default: ``CHART_SIZE``)
+
+    Returns
+    -------
+    bytes
+        PNG image data
+    """
+    if chart_type not in DIVISIONAL_CHARTS:
+        raise ValueError(f"Unknown chart type: {chart_type}. Available: {list(DIVISIONAL_CHARTS.keys())}")
+    if 'Ascendant' not in positions:
+        raise ValueError("Ascendant position is required to place the houses")
+    calc_func = DIVISIONAL_CHARTS[chart_type]
+
+    coverage = Image.new('L', (size, size), 0)
+    sign_pixels = max(8, size // 30)
+    planet_pixels = max(7, size // 42)
+
+    # Sign numbers run counter-clockwise from the Ascendant's sign in house 1
+    ascendant_sign = calc_func(_longitude(positions['Ascendant']))['sign']
+    index = 12 - ascendant_sign + 1
+    sign_coords = HOUSE_COORDS[index:] + HOUSE_COORDS[:index]
+    for sign, (x, y) in enumerate(sign_coords, start=1):
+        _draw_label(coverage, _to_pixels(size, x, y), str(sign), sign_pixels)
+
+    offsets = {}
+    for body, data in positions.items():
+        if body == 'Ascendant':
+            continue
+        varga = calc_func(_longitude(data))
+        x, y = sign_coords[varga['sign'] - 1]
+        offset = offsets.get(varga['sign'], 0)
+        offsets[varga['sign']] = offset + PLANET_LINE_SPACING
+        degree = varga['degree']
+        _draw_label(coverage, _to_pixels(size, x + 0.5, y - offset),
+                    f"{body.capitalize()[:2]} {int(degree)}°{int((degree - int(degree)) * 60)}'",
+                    planet_pixels)
+
+    image = ImageChops.add(_template(size), coverage.point(_COVERAGE_LEVELS))
+    image.putpalette(_PALETTE)
+    buffer = io.BytesIO()
+    image.save(buffer, format='PNG', compress_level=1)
+    return buffer.getvalue()
+
+
+def save_chart(chart_type, positions, output_dir=CHART_OUTPUT_DIR):
+    """
+    Render a divisional chart and save it as ``<chart_type>.png``.
+
+    Returns the path of the written file.
+    """
+    png = render_chart(chart_type, positions)
+    os.makedirs(output_dir, exist_ok=True)
+    path = os.path.join(output_dir, f"{chart_type}.png")
+    with open(path, 'wb') as f:
+        f.write(png)
+    return path
@@ -22,8 +22,23 @@ Supported Charts:
 - D40 (Khavedamsa): Maternal legacy - 40 divisions per sign (0°45' each)
 - D45 (Akshavedamsa): Paternal legacy - 45 divisions per sign (0°40' each)
 - D60 (Shashtiamsa): Past karma - 60 divisions per sign (0°30' each)
+
+Every varga is declared as data in ``VARGA_DEFINITIONS`` (division count,
+start-sign rule, optional unequal segments) and compiled at import into a
+(12 x divisions) table of target signs, so a chart is one index into that
+table. ``calculate_varga`` works on a single longitude (the ``calculate_dN``
+functions are thin wrappers around it) and ``calculate_varga_arrays`` computes
+any set of charts for an array of longitudes at once. D5, D6 and D8 are
+defined as well but are not part of the default set above. Custom schemes
+are added with ``register_varga``.
 """
 
+import copy
+import hashlib
+import json
+
+import numpy as np
+
 
 def get_sign_number(longitude):
     """Get the sign number (1-12) from longitude."""
@@ -35,11 +50,285 @@ def get_degree_in_sign(longitude):
     return longitude % 30
 
 
+SIGN_NAMES = [
+    'Aries', 'Taurus', 'Gemini', 'Cancer', 'Leo', 'Virgo',
+    'Libra', 'Scorpio', 'Sagittarius', 'Capricorn', 'Aquarius', 'Pisces'
+]
+
+# Groups a start rule may be keyed by; each maps a group to its sign numbers
+SIGN_GROUPS = {
+    'odd': [1, 3, 5, 7, 9, 11],
+    'even': [2, 4, 6, 8, 10, 12],
+    'fire': [1, 5, 9],
+    'earth': [2, 6, 10],
+    'air': [3, 7, 11],
+    'water': [4, 8, 12],
+    'cardinal': [1, 4, 7, 10],
+    'fixed': [2, 5, 8, 11],
+    'mutable': [3, 6, 9, 12],
+}
+
+# Declarative varga definitions.
+#   divisions : number of parts per sign
+#   start     : sign of the first part - a sign name, or an int counted from
+#               the sign itself (1 = same sign, 7 = 7th from it); may be a
+#               dict keyed by sign group ('odd'/'even', element or modality)
+#   step      : signs advanced per part (default 1); may be keyed like start
+#   segments  : unequal parts as (width in degrees, sign name) lists for odd
+#               and even signs, replacing start/step
+VARGA_DEFINITIONS = {
+    'D1': {'name': 'Rashi (Birth Chart)', 'divisions': 1, 'start': 1},
+    'D2': {'name': 'Hora (Wealth)', 'divisions': 2,
+           'start': {'odd': 'Leo', 'even': 'Cancer'}, 'step': {'odd': -1, 'even': 1}},
+    'D3': {'name': 'Drekkana (Siblings)', 'divisions': 3, 'start': 1, 'step': 4},
+    'D4': {'name': 'Chaturthamsa (Fortune)', 'divisions': 4, 'start': 1, 'step': 3},
+    'D5': {'name': 'Panchamsa (Fame/Power)', 'divisions': 5,
+           'segments': {'odd': [(6, 'Aries'), (6, 'Aquarius'), (6, 'Sagittarius'),
+                                (6, 'Gemini'), (6, 'Libra')],
+                        'even': [(6, 'Taurus'), (6, 'Virgo'), (6, 'Pisces'),
+                                 (6, 'Capricorn'), (6, 'Scorpio')]}},
+    'D6': {'name': 'Shashtamsa (Health)', 'divisions': 6,
+           'start': {'odd': 'Aries', 'even': 'Libra'}},
+    'D7': {'name': 'Saptamsa (Children)', 'divisions': 7, 'start': {'odd': 1, 'even': 7}},
+    'D8': {'name': 'Ashtamsa (Longevity)', 'divisions': 8,
+           'start': {'cardinal': 'Aries', 'fixed': 'Sagittarius', 'mutable': 'Leo'}},
+    'D9': {'name': 'Navamsa (Spouse/Dharma)', 'divisions': 9,
+           'start': {'fire': 'Aries', 'earth': 'Capricorn', 'air': 'Libra', 'water': 'Cancer'}},
+    'D10': {'name': 'Dasamsa (Career)', 'divisions': 10, 'start': {'odd': 1, 'even': 9}},
+    'D12': {'name': 'Dwadasamsa (Parents)', 'divisions': 12, 'start': 1},
+    'D16': {'name': 'Shodasamsa (Vehicles)', 'divisions': 16,
+            'start': {'cardinal': 'Aries', 'fixed': 'Leo', 'mutable': 'Sagittarius'}},
+    'D20': {'name': 'Vimsamsa (Spiritual)', 'divisions': 20,
+            'start': {'cardinal': 'Aries', 'fixed': 'Sagittarius', 'mutable': 'Leo'}},
+    'D24': {'name': 'Chaturvimsamsa (Education)', 'divisions': 24,
+            'start': {'odd': 'Leo', 'even': 'Cancer'}},
+    'D27': {'name': 'Bhamsa (Strength)', 'divisions': 27,
+            'start': {'fire': 'Aries', 'earth': 'Cancer', 'air': 'Libra', 'water': 'Capricorn'}},
+    'D30': {'name': 'Trimsamsa (Misfortunes)', 'divisions': 30,
+            'segments': {'odd': [(5, 'Aries'), (5, 'Aquarius'), (8, 'Sagittarius'),
+                                 (7, 'Gemini'), (5, 'Libra')],
+                         'even': [(5, 'Taurus'), (7, 'Virgo'), (8, 'Pisces'),
+                                  (5, 'Capricorn'), (5, 'Scorpio')]}},
+    'D40': {'name': 'Khavedamsa (Maternal)', 'divisions': 40,
+            'start': {'odd': 'Aries', 'even': 'Libra'}},
+    'D45': {'name': 'Akshavedamsa (Paternal)', 'divisions': 45,
+            'start': {'cardinal': 'Aries', 'fixed': 'Leo', 'mutable': 'Sagittarius'}},
+    'D60': {'name': 'Shashtiamsa (Past Karma)', 'divisions': 60, 'start': 1},
+}
+
+
+def _sign_number(value):
+    """Sign number (1-12) of a sign name or number."""
+    if isinstance(value, str) and value in SIGN_NAMES:
+        return SIGN_NAMES.index(value) + 1
+    if isinstance(value, (int, np.integer)) and not isinstance(value, bool) and 1 <= value <= 12:
+        return int(value)
+    raise ValueError(f"Invalid sign {value!r}: use a sign name or a number from 1 to 12")
+
+
+def _rule_for_sign(rule, sign):
+    """Pick the entry of a start/step rule that applies to a sign (1-12)."""
+    if not isinstance(rule, dict):
+        return rule
+    for group, value in rule.items():
+        if sign in SIGN_GROUPS[group]:
+            return value
+    raise ValueError(f"Rule {rule} does not cover sign {sign}")
+
+
+# Keys a varga definition may use
+_DEFINITION_KEYS = ('name', 'divisions', 'start', 'step', 'segments', 'table')
+
+
+def _is_number(value):
+    """True for finite ints and floats (bools excluded)."""
+    return (isinstance(value, (int, float, np.integer, np.floating)) and not isinstance(value, bool)
+            and np.isfinite(value))
+
+
+def _validate_varga(definition):
+    """
+    Check that a varga definition maps every degree of every sign to exactly one sign.
+    
+    Raises ValueError describing the first problem found.
+    """
+    if not isinstance(definition, dict):
+        raise ValueError("A varga definition must be a dict")
+    unknown = [key for key in definition if key not in _DEFINITION_KEYS]
+    if unknown:
+        raise ValueError(f"Unknown varga definition key {unknown[0]!r}. Available: {', '.join(_DEFINITION_KEYS)}")
+    if not isinstance(definition.get('name'), str):
+        raise ValueError("A varga definition needs a 'name'")
+    divisions = definition.get('divisions')
+    if not isinstance(divisions, int) or isinstance(divisions, bool) or divisions < 1:
+        raise ValueError("'divisions' must be a positive integer")
+    forms = [form for form in ('start', 'segments', 'table') if form in definition]
+    if len(forms) != 1:
+        raise ValueError("A varga definition needs exactly one of 'start', 'segments' or 'table'")
+    if 'step' in definition and forms[0] != 'start':
+        raise ValueError("'step' can only be used with 'start'")
+    
+    if forms[0] == 'start':
+        for key in ('start', 'step'):
+            rule = definition.get(key, 1)
+            if isinstance(rule, dict):
+                unknown = [group for group in rule if group not in SIGN_GROUPS]
+                if unknown:
+                    raise ValueError(f"Unknown sign group '{unknown[0]}'. Available: {', '.join(SIGN_GROUPS)}")
+                for sign in range(1, 13):
+                    matches = [group for group in rule if sign in SIGN_GROUPS[group]]
+                    if len(matches) != 1:
+                        raise ValueError(f"'{key}' must assign sign {sign} to exactly one group, "
+                                         f"not {len(matches)}")
+            for value in (rule.values() if isinstance(rule, dict) else [rule]):
+                if key == 'start' and isinstance(value, str):
+                    _sign_number(value)
+                elif isinstance(value, bool) or not isinstance(value, int):
+                    raise ValueError(f"Invalid '{key}' value {value!r}")
+    elif forms[0] == 'segments':
+        segments = definition['segments']
+        if not isinstance(segments, dict) or set(segments) != {'odd', 'even'}:
+            raise ValueError("'segments' must have 'odd' and 'even' lists")
+        for parity, parts in segments.items():
+            if not isinstance(parts, (list, tuple)) or not all(
+                    isinstance(part, (list, tuple)) and len(part) == 2 for part in parts):
+                raise ValueError(f"Segments of {parity} signs must be a list of (width, sign) pairs")
+        if len(segments['odd']) != len(segments['even']):
+            raise ValueError("Odd and even signs need the same number of segments")
+        size = 30 / divisions
+        for parity, parts in segments.items():
+            widths = [width for width, _ in parts]
+            if not all(_is_number(width) for width in widths):
+                raise ValueError(f"Segment widths of {parity} signs must be numbers")
+            if any(width <= 0 for width in widths):
+                raise ValueError(f"Segment widths of {parity} signs must be positive")
+            if abs(sum(widths) - 30) > 1e-9:
+                raise ValueError(f"Segments of {parity} signs must cover exactly 30 degrees")
+            # Whole parts of 30 / divisions degrees, so the segments make up the divisions
+            if any(abs(width / size - round(width / size)) > 1e-9 for width in widths):
+                raise ValueError(f"Segments of {parity} signs must be whole parts of {size:g} degrees "
+                                 f"({divisions} divisions)")
+            for _, target in parts:
+                _sign_number(target)
+    else:
+        table = definition['table']
+        if (not isinstance(table, (list, tuple)) or len(table) != 12
+                or any(not isinstance(row, (list, tuple)) or len(row) != divisions for row in table)):
+            raise ValueError(f"'table' must have 12 rows of {divisions} signs")
+        for row in table:
+            for target in row:
+                _sign_number(target)
+
+
+def _json_scalar(value):
+    """Plain Python value of a NumPy scalar, for hashing definitions as JSON."""
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _with_sign_changes(varga):
+    """
+    Add the longitudes (0-360) at which the sign of a compiled varga changes.
+    
+    Neighbouring segments that map to the same sign (e.g. the Cancer halves
+    of Aries and Taurus in D2) are merged, so every entry is a real change.
+    """
+    starts = (varga['bounds'][:, :-1] + np.arange(12)[:, None] * 30).ravel()
+    signs = varga['table'].ravel()
+    varga['changes'] = starts[signs != np.roll(signs, 1)]
+    return varga
+
+
+def _compile_varga(definition):
+    """
+    Compile one varga definition into its lookup data.
+    
+    Returns the division count, the equal part size (None for unequal
+    segments), the (12, parts + 1) segment bounds in degrees, the (12, parts)
+    int8 table of target sign numbers, the longitudes of sign changes and a
+    version hash of the definition.
+    """
+    divisions = definition['divisions']
+    if 'segments' in definition:
+        size = None
+        bounds = np.zeros((12, len(definition['segments']['odd']) + 1), dtype=np.float64)
+        table = np.empty((12, bounds.shape[1] - 1), dtype=np.int8)
+        for sign_index in range(12):
+            parity = 'odd' if sign_index % 2 == 0 else 'even'
+            widths, targets = zip(*definition['segments'][parity])
+            bounds[sign_index, 1:] = np.cumsum(widths)
+            table[sign_index] = [_sign_number(target) for target in targets]
+        # Widths summing to 30 within rounding end exactly at the sign boundary
+        bounds[:, -1] = 30
+    else:
+        size = 30 / divisions
+        bounds = np.tile(np.arange(divisions + 1) * size, (12, 1))
+        table = np.empty((12, divisions), dtype=np.int8)
+        for sign_index in range(12):
+            if 'table' in definition:
+                table[sign_index] = [_sign_number(target) for target in definition['table'][sign_index]]
+                continue
+            start = _rule_for_sign(definition['start'], sign_index + 1)
+            step = _rule_for_sign(definition.get('step', 1), sign_index + 1)
+            if isinstance(start, str):
+                start_index = SIGN_NAMES.index(start)
+            else:
+                start_index = sign_index + start - 1
+            table[sign_index] = (start_index + np.arange(divisions) * step) % 12 + 1
+    
+    if not np.all(np.diff(bounds, axis=1) > 0):
+        raise ValueError("Varga segments must be non-empty")
+    version = hashlib.sha1(json.dumps(definition, sort_keys=True, default=_json_scalar)
+                           .encode('utf-8')).hexdigest()[:12]
+    return _with_sign_changes({'divisions': divisions, 'size': size, 'bounds': bounds,
+                               'table': table, 'version': version})
+
+
+_VARGAS = {chart_type: _compile_varga(definition)
+           for chart_type, definition in VARGA_DEFINITIONS.items()}
+
+
+def calculate_varga(chart_type, longitude):
+    """
+    Calculate the position of one longitude in any registered varga.
+    
+    Parameters
+    ----------
+    chart_type : str
+        Key of ``VARGA_DEFINITIONS`` (e.g. 'D9')
+    longitude : float
+        Longitude in degrees (0-360)
+        
+    Returns
+    -------
+    dict
+        'sign' (1-12), 'degree' (0-30) and 'longitude' in the divisional chart
+    """
+    if chart_type not in _VARGAS:
+        raise ValueError(f"Unknown chart type: {chart_type}. Available: {list(VARGA_DEFINITIONS.keys())}")
+    varga = _VARGAS[chart_type]
+    table = varga['table']
+    sign_index = int(longitude // 30) % 12
+    degree_in_sign = get_degree_in_sign(longitude)
+    
+    if varga['size'] is not None:
+        size = varga['size']
+        part = min(int(degree_in_sign // size), table.shape[1] - 1)
+        degree = (degree_in_sign % size) * varga['divisions']
+    else:
+        bounds = varga['bounds'][sign_index]
+        part = int(np.searchsorted(bounds[1:-1], degree_in_sign, side='right'))
+        start, end = float(bounds[part]), float(bounds[part + 1])
+        degree = (degree_in_sign - start) * (30 / (end - start))
+    
+    sign = int(table[sign_index, part])
+    return {'sign': sign, 'degree': degree, 'longitude': (sign - 1) * 30 + degree}
+
+
 def calculate_d1(longitude):
     """D1 - Rashi Chart (Birth Chart). No transformation needed."""
-    sign = get_sign_number(longitude)
-    degree = get_degree_in_sign(longitude)
-    return {'sign': sign, 'degree': degree, 'longitude': longitude}
+    return calculate_varga('D1', longitude)
 
 
 def calculate_d2(longitude):
@@ -49,22 +338,7 @@ def calculate_d2(longitude):
     Odd signs: 0-15° -> Leo, 15-30° -> Cancer
     Even signs: 0-15° -> Cancer, 15-30° -> Leo
     """
-    sign = get_sign_number(longitude)
-    degree_in_sign = get_degree_in_sign(longitude)
-    part = int(degree_in_sign // 15)  # 0 or 1
-    
-    is_odd_sign = sign % 2 == 1
-    
-    if is_odd_sign:
-        d2_sign = 5 if part == 0 else 4  # Leo or Cancer
-    else:
-        d2_sign = 4 if part == 0 else 5  # Cancer or Leo
-    
-    # Calculate degree in D2
-    d2_degree = (degree_in_sign % 15) * 2
-    d2_longitude = (d2_sign - 1) * 30 + d2_degree
-    
-    return {'sign': d2_sign, 'degree': d2_degree, 'longitude': d2_longitude}
+    return calculate_varga('D2', longitude)
 
 
 def calculate_d3(longitude):
@@ -75,21 +349,7 @@ def calculate_d3(longitude):
     2nd decanate (10-20°): 5th from sign
     3rd decanate (20-30°): 9th from sign
     """
-    sign = get_sign_number(longitude)
-    degree_in_sign = get_degree_in_sign(longitude)
-    part = int(degree_in_sign // 10)  # 0, 1, or 2
-    
-    if part == 0:
-        d3_sign = sign
-    elif part == 1:
-        d3_sign = ((sign - 1 + 4) % 12) + 1  # 5th from sign
-    else:
-        d3_sign = ((sign - 1 + 8) % 12) + 1  # 9th from sign
-    
-    d3_degree = (degree_in_sign % 10) * 3
-    d3_longitude = (d3_sign - 1) * 30 + d3_degree
-    
-    return {'sign': d3_sign, 'degree': d3_degree, 'longitude': d3_longitude}
+    return calculate_varga('D3', longitude)
 
 
 def calculate_d4(longitude):
@@ -98,15 +358,7 @@ def calculate_d4(longitude):
     Each sign is divided into 4 parts of 7°30' each.
     Starts from the sign itself, then 4th, 7th, 10th from it.
     """
-    sign = get_sign_number(longitude)
-    degree_in_sign = get_degree_in_sign(longitude)
-    part = int(degree_in_sign // 7.5)  # 0, 1, 2, or 3
-    
-    d4_sign = ((sign - 1 + part * 3) % 12) + 1
-    d4_degree = (degree_in_sign % 7.5) * 4
-    d4_longitude = (d4_sign - 1) * 30 + d4_degree
-    
-    return {'sign': d4_sign, 'degree': d4_degree, 'longitude': d4_longitude}
+    return calculate_varga('D4', longitude)
 
 
 def calculate_d7(longitude):
@@ -116,22 +368,7 @@ def calculate_d7(longitude):
     Odd signs: Start from same sign
     Even signs: Start from 7th sign
     """
-    sign = get_sign_number(longitude)
-    degree_in_sign = get_degree_in_sign(longitude)
-    division_size = 30 / 7
-    part = int(degree_in_sign // division_size)  # 0 to 6
-    
-    is_odd_sign = sign % 2 == 1
-    
-    if is_odd_sign:
-        d7_sign = ((sign - 1 + part) % 12) + 1
-    else:
-        d7_sign = ((sign - 1 + 6 + part) % 12) + 1  # Start from 7th
-    
-    d7_degree = (degree_in_sign % division_size) * 7
-    d7_longitude = (d7_sign - 1) * 30 + d7_degree
-    
-    return {'sign': d7_sign, 'degree': d7_degree, 'longitude': d7_longitude}
+    return calculate_varga('D7', longitude)
 
 
 def calculate_d9(longitude):
@@ -144,26 +381,7 @@ def calculate_d9(longitude):
     Air signs (3,7,11): Start from Libra
     Water signs (4,8,12): Start from Cancer
     """
-    sign = get_sign_number(longitude)
-    degree_in_sign = get_degree_in_sign(longitude)
-    division_size = 30 / 9
-    part = int(degree_in_sign // division_size)  # 0 to 8
-    
-    # Determine starting sign based on element
-    if sign in [1, 5, 9]:  # Fire signs
-        start_sign = 1  # Aries
-    elif sign in [2, 6, 10]:  # Earth signs
-        start_sign = 10  # Capricorn
-    elif sign in [3, 7, 11]:  # Air signs
-        start_sign = 7  # Libra
-    else:  # Water signs (4, 8, 12)
-        start_sign = 4  # Cancer
-    
-    d9_sign = ((start_sign - 1 + part) % 12) + 1
-    d9_degree = (degree_in_sign % division_size) * 9
-    d9_longitude = (d9_sign - 1) * 30 + d9_degree
-    
-    return {'sign': d9_sign, 'degree': d9_degree, 'longitude': d9_longitude}
+    return calculate_varga('D9', longitude)
 
 
 def calculate_d10(longitude):
@@ -173,22 +391,7 @@ def calculate_d10(longitude):
     Odd signs: Start from same sign
     Even signs: Start from 9th sign
     """
-    sign = get_sign_number(longitude)
-    degree_in_sign = get_degree_in_sign(longitude)
-    division_size = 3  # 30/10
-    part = int(degree_in_sign // division_size)  # 0 to 9
-    
-    is_odd_sign = sign % 2 == 1
-    
-    if is_odd_sign:
-        d10_sign = ((sign - 1 + part) % 12) + 1
-    else:
-        d10_sign = ((sign - 1 + 8 + part) % 12) + 1  # Start from 9th
-    
-    d10_degree = (degree_in_sign % division_size) * 10
-    d10_longitude = (d10_sign - 1) * 30 + d10_degree
-    
-    return {'sign': d10_sign, 'degree': d10_degree, 'longitude': d10_longitude}
+    return calculate_varga('D10', longitude)
 
 
 def calculate_d12(longitude):
@@ -197,16 +400,7 @@ def calculate_d12(longitude):
     Each sign is divided into 12 parts of 2°30' each.
     Starts from the same sign and progresses through all 12 signs.
     """
-    sign = get_sign_number(longitude)
-    degree_in_sign = get_degree_in_sign(longitude)
-    division_size = 2.5  # 30/12
-    part = int(degree_in_sign // division_size)  # 0 to 11
-    
-    d12_sign = ((sign - 1 + part) % 12) + 1
-    d12_degree = (degree_in_sign % division_size) * 12
-    d12_longitude = (d12_sign - 1) * 30 + d12_degree
-    
-    return {'sign': d12_sign, 'degree': d12_degree, 'longitude': d12_longitude}
+    return calculate_varga('D12', longitude)
 
 
 def calculate_d16(longitude):
@@ -217,24 +411,7 @@ def calculate_d16(longitude):
     Fixed signs (2,5,8,11): Start from Leo
     Mutable signs (3,6,9,12): Start from Sagittarius
     """
-    sign = get_sign_number(longitude)
-    degree_in_sign = get_degree_in_sign(longitude)
-    division_size = 30 / 16
-    part = int(degree_in_sign // division_size)  # 0 to 15
-    
-    # Determine starting sign based on modality
-    if sign in [1, 4, 7, 10]:  # Cardinal
-        start_sign = 1  # Aries
-    elif sign in [2, 5, 8, 11]:  # Fixed
-        start_sign = 5  # Leo
-    else:  # Mutable (3, 6, 9, 12)
-        start_sign = 9  # Sagittarius
-    
-    d16_sign = ((start_sign - 1 + part) % 12) + 1
-    d16_degree = (degree_in_sign % division_size) * 16
-    d16_longitude = (d16_sign - 1) * 30 + d16_degree
-    
-    return {'sign': d16_sign, 'degree': d16_degree, 'longitude': d16_longitude}
+    return calculate_varga('D16', longitude)
 
 
 def calculate_d20(longitude):
@@ -245,23 +422,7 @@ def calculate_d20(longitude):
     Fixed signs: Start from Sagittarius
     Mutable signs: Start from Leo
     """
-    sign = get_sign_number(longitude)
-    degree_in_sign = get_degree_in_sign(longitude)
-    division_size = 1.5  # 30/20
-    part = int(degree_in_sign // division_size)  # 0 to 19
-    
-    if sign in [1, 4, 7, 10]:  # Cardinal
-        start_sign = 1  # Aries
-    elif sign in [2, 5, 8, 11]:  # Fixed
-        start_sign = 9  # Sagittarius
-    else:  # Mutable
-        start_sign = 5  # Leo
-    
-    d20_sign = ((start_sign - 1 + part) % 12) + 1
-    d20_degree = (degree_in_sign % division_size) * 20
-    d20_longitude = (d20_sign - 1) * 30 + d20_degree
-    
-    return {'sign': d20_sign, 'degree': d20_degree, 'longitude': d20_longitude}
+    return calculate_varga('D20', longitude)
 
 
 def calculate_d24(longitude):
@@ -271,23 +432,7 @@ def calculate_d24(longitude):
     Odd signs: Start from Leo
     Even signs: Start from Cancer
     """
-    sign = get_sign_number(longitude)
-    degree_in_sign = get_degree_in_sign(longitude)
-    division_size = 1.25  # 30/24
-    part = int(degree_in_sign // division_size)  # 0 to 23
-    
-    is_odd_sign = sign % 2 == 1
-    
-    if is_odd_sign:
-        start_sign = 5  # Leo
-    else:
-        start_sign = 4  # Cancer
-    
-    d24_sign = ((start_sign - 1 + part) % 12) + 1
-    d24_degree = (degree_in_sign % division_size) * 24
-    d24_longitude = (d24_sign - 1) * 30 + d24_degree
-    
-    return {'sign': d24_sign, 'degree': d24_degree, 'longitude': d24_longitude}
+    return calculate_varga('D24', longitude)
 
 
 def calculate_d27(longitude):
@@ -299,25 +444,7 @@ def calculate_d27(longitude):
     Air signs: Start from Libra
     Water signs: Start from Capricorn
     """
-    sign = get_sign_number(longitude)
-    degree_in_sign = get_degree_in_sign(longitude)
-    division_size = 30 / 27
-    part = int(degree_in_sign // division_size)  # 0 to 26
-    
-    if sign in [1, 5, 9]:  # Fire
-        start_sign = 1  # Aries
-    elif sign in [2, 6, 10]:  # Earth
-        start_sign = 4  # Cancer
-    elif sign in [3, 7, 11]:  # Air
-        start_sign = 7  # Libra
-    else:  # Water
-        start_sign = 10  # Capricorn
-    
-    d27_sign = ((start_sign - 1 + part) % 12) + 1
-    d27_degree = (degree_in_sign % division_size) * 27
-    d27_longitude = (d27_sign - 1) * 30 + d27_degree
-    
-    return {'sign': d27_sign, 'degree': d27_degree, 'longitude': d27_longitude}
+    return calculate_varga('D27', longitude)
 
 
 def calculate_d30(longitude):
@@ -327,51 +454,7 @@ def calculate_d30(longitude):
     Odd signs: Mars(5°), Saturn(5°), Jupiter(8°), Mercury(7°), Venus(5°)
     Even signs: Venus(5°), Mercury(7°), Jupiter(8°), Saturn(5°), Mars(5°)
     """
-    sign = get_sign_number(longitude)
-    degree_in_sign = get_degree_in_sign(longitude)
-    
-    is_odd_sign = sign % 2 == 1
-    
-    if is_odd_sign:
-        # Mars(5°) -> Saturn(5°) -> Jupiter(8°) -> Mercury(7°) -> Venus(5°)
-        # Signs: Aries, Aquarius, Sagittarius, Gemini, Libra
-        if degree_in_sign < 5:
-            d30_sign = 1  # Aries (Mars)
-            d30_degree = degree_in_sign * 6
-        elif degree_in_sign < 10:
-            d30_sign = 11  # Aquarius (Saturn)
-            d30_degree = (degree_in_sign - 5) * 6
-        elif degree_in_sign < 18:
-            d30_sign = 9  # Sagittarius (Jupiter)
-            d30_degree = (degree_in_sign - 10) * 3.75
-        elif degree_in_sign < 25:
-            d30_sign = 3  # Gemini (Mercury)
-            d30_degree = (degree_in_sign - 18) * (30/7)
-        else:
-            d30_sign = 7  # Libra (Venus)
-            d30_degree = (degree_in_sign - 25) * 6
-    else:
-        # Venus(5°) -> Mercury(7°) -> Jupiter(8°) -> Saturn(5°) -> Mars(5°)
-        # Signs: Taurus, Virgo, Pisces, Capricorn, Scorpio
-        if degree_in_sign < 5:
-            d30_sign = 2  # Taurus (Venus)
-            d30_degree = degree_in_sign * 6
-        elif degree_in_sign < 12:
-            d30_sign = 6  # Virgo (Mercury)
-            d30_degree = (degree_in_sign - 5) * (30/7)
-        elif degree_in_sign < 20:
-            d30_sign = 12  # Pisces (Jupiter)
-            d30_degree = (degree_in_sign - 12) * 3.75
-        elif degree_in_sign < 25:
-            d30_sign = 10  # Capricorn (Saturn)
-            d30_degree = (degree_in_sign - 20) * 6
-        else:
-            d30_sign = 8  # Scorpio (Mars)
-            d30_degree = (degree_in_sign - 25) * 6
-    
-    d30_longitude = (d30_sign - 1) * 30 + d30_degree
-    
-    return {'sign': d30_sign, 'degree': d30_degree, 'longitude': d30_longitude}
+    return calculate_varga('D30', longitude)
 
 
 def calculate_d40(longitude):
@@ -381,23 +464,7 @@ def calculate_d40(longitude):
     Odd signs: Start from Aries
     Even signs: Start from Libra
     """
-    sign = get_sign_number(longitude)
-    degree_in_sign = get_degree_in_sign(longitude)
-    division_size = 0.75  # 30/40
-    part = int(degree_in_sign // division_size)  # 0 to 39
-    
-    is_odd_sign = sign % 2 == 1
-    
-    if is_odd_sign:
-        start_sign = 1  # Aries
-    else:
-        start_sign = 7  # Libra
-    
-    d40_sign = ((start_sign - 1 + part) % 12) + 1
-    d40_degree = (degree_in_sign % division_size) * 40
-    d40_longitude = (d40_sign - 1) * 30 + d40_degree
-    
-    return {'sign': d40_sign, 'degree': d40_degree, 'longitude': d40_longitude}
+    return calculate_varga('D40', longitude)
 
 
 def calculate_d45(longitude):
@@ -408,23 +475,7 @@ def calculate_d45(longitude):
     Fixed signs: Start from Leo
     Mutable signs: Start from Sagittarius
     """
-    sign = get_sign_number(longitude)
-    degree_in_sign = get_degree_in_sign(longitude)
-    division_size = 30 / 45
-    part = int(degree_in_sign // division_size)  # 0 to 44
-    
-    if sign in [1, 4, 7, 10]:  # Cardinal
-        start_sign = 1  # Aries
-    elif sign in [2, 5, 8, 11]:  # Fixed
-        start_sign = 5  # Leo
-    else:  # Mutable
-        start_sign = 9  # Sagittarius
-    
-    d45_sign = ((start_sign - 1 + part) % 12) + 1
-    d45_degree = (degree_in_sign % division_size) * 45
-    d45_longitude = (d45_sign - 1) * 30 + d45_degree
-    
-    return {'sign': d45_sign, 'degree': d45_degree, 'longitude': d45_longitude}
+    return calculate_varga('D45', longitude)
 
 
 def calculate_d60(longitude):
@@ -433,16 +484,7 @@ def calculate_d60(longitude):
     Each sign is divided into 60 parts of 0°30' each.
     Counts from the same sign, cycling through all 12 signs 5 times.
     """
-    sign = get_sign_number(longitude)
-    degree_in_sign = get_degree_in_sign(longitude)
-    division_size = 0.5  # 30/60
-    part = int(degree_in_sign // division_size)  # 0 to 59
-    
-    d60_sign = ((sign - 1 + part) % 12) + 1
-    d60_degree = (degree_in_sign % division_size) * 60
-    d60_longitude = (d60_sign - 1) * 30 + d60_degree
-    
-    return {'sign': d60_sign, 'degree': d60_degree, 'longitude': d60_longitude}
+    return calculate_varga('D60', longitude)
 
 
 # Mapping of chart types to calculation functions
@@ -465,29 +507,246 @@ DIVISIONAL_CHARTS = {
     'D60': calculate_d60,
 }
 
-CHART_NAMES = {
-    'D1': 'Rashi (Birth Chart)',
-    'D2': 'Hora (Wealth)',
-    'D3': 'Drekkana (Siblings)',
-    'D4': 'Chaturthamsa (Fortune)',
-    'D7': 'Saptamsa (Children)',
-    'D9': 'Navamsa (Spouse/Dharma)',
-    'D10': 'Dasamsa (Career)',
-    'D12': 'Dwadasamsa (Parents)',
-    'D16': 'Shodasamsa (Vehicles)',
-    'D20': 'Vimsamsa (Spiritual)',
-    'D24': 'Chaturvimsamsa (Education)',
-    'D27': 'Bhamsa (Strength)',
-    'D30': 'Trimsamsa (Misfortunes)',
-    'D40': 'Khavedamsa (Maternal)',
-    'D45': 'Akshavedamsa (Paternal)',
-    'D60': 'Shashtiamsa (Past Karma)',
-}
+CHART_NAMES = {chart_type: VARGA_DEFINITIONS[chart_type]['name'] for chart_type in DIVISIONAL_CHARTS}
+
+# Order of the charts along the first axis of the vectorized results
+VARGA_ORDER = list(DIVISIONAL_CHARTS.keys())
+
+# Per-planet fields of a divisional chart
+CHART_FIELDS = ('longitude', 'sign', 'signNumber', 'degreeInSign', 'formatted')
+
+
+# Built-in vargas, which cannot be replaced by registration
+_BUILTIN_VARGAS = frozenset(VARGA_DEFINITIONS)
+
+
+def register_varga(chart_type, definition, replace=False):
+    """
+    Register a custom varga scheme, e.g. a Parivritti D2 or Somanatha D9.
+    
+    The definition uses the form of ``VARGA_DEFINITIONS`` ('name',
+    'divisions' and one of 'start' / 'step', 'segments') or gives the target
+    signs of every part directly as 'table' (12 rows of ``divisions`` sign
+    names or numbers). It is validated and compiled into the same lookup
+    tables as the built-in charts; afterwards the chart works everywhere a
+    chart type is accepted and is listed in ``CHART_NAMES``.
+    
+    Parameters
+    ----------
+    chart_type : str
+        Key of the new chart (stored upper-case, e.g. 'D2-PARIVRITTI')
+    definition : dict
+        Varga definition
+    replace : bool, optional
+        Allow replacing an earlier custom registration (default: False)
+        
+    Returns
+    -------
+    str
+        Version hash of the definition; results computed with the scheme can
+        be cached under (chart_type, version)
+    """
+    chart_type = str(chart_type).upper()
+    if chart_type in _BUILTIN_VARGAS:
+        raise ValueError(f"Chart type {chart_type} is built in and cannot be replaced")
+    if chart_type in VARGA_DEFINITIONS and not replace:
+        raise ValueError(f"Chart type {chart_type} is already registered")
+    _validate_varga(definition)
+    
+    # A private copy keeps the compiled tables in step with the definition
+    definition = copy.deepcopy(definition)
+    varga = _compile_varga(definition)
+    VARGA_DEFINITIONS[chart_type] = definition
+    _VARGAS[chart_type] = varga
+    DIVISIONAL_CHARTS[chart_type] = lambda longitude: calculate_varga(chart_type, longitude)
+    CHART_NAMES[chart_type] = definition['name']
+    return varga['version']
+
+
+def varga_version(chart_type):
+    """Version hash of a varga definition (changes whenever the definition does)."""
+    if chart_type not in _VARGAS:
+        raise ValueError(f"Unknown chart type: {chart_type}. Available: {list(VARGA_DEFINITIONS.keys())}")
+    return _VARGAS[chart_type]['version']
 
-SIGN_NAMES = [
-    'Aries', 'Taurus', 'Gemini', 'Cancer', 'Leo', 'Virgo',
-    'Libra', 'Scorpio', 'Sagittarius', 'Capricorn', 'Aquarius', 'Pisces'
-]
+
+
+def calculate_varga_arrays(longitudes, chart_types=None):
+    """
+    Calculate divisional chart positions for an array of longitudes at once.
+    
+    Parameters
+    ----------
+    longitudes : array_like
+        (N,) longitudes in degrees (0-360)
+    chart_types : list of str, optional
+        Charts to calculate, any keys of ``VARGA_DEFINITIONS`` (default:
+        ``VARGA_ORDER``, the 16 standard charts)
+        
+    Returns
+    -------
+    tuple of numpy.ndarray
+        (sign numbers, degrees in sign), both of shape (len(chart_types), N);
+        sign numbers are 1-12 (int8), degrees 0-30 (float64). Results equal
+        those of ``calculate_varga``.
+    """
+    if chart_types is None:
+        chart_types = VARGA_ORDER
+    for chart_type in chart_types:
+        if chart_type not in _VARGAS:
+            raise ValueError(f"Unknown chart type: {chart_type}. Available: {list(VARGA_DEFINITIONS.keys())}")
+    
+    longitudes = np.asarray(longitudes, dtype=np.float64).ravel()
+    sign_index = (longitudes // 30).astype(np.intp) % 12
+    degree_in_sign = longitudes % 30
+    
+    signs = np.empty((len(chart_types), len(longitudes)), dtype=np.int8)
+    degrees = np.empty((len(chart_types), len(longitudes)), dtype=np.float64)
+    for row, chart_type in enumerate(chart_types):
+        varga = _VARGAS[chart_type]
+        table = varga['table']
+        if varga['size'] is not None:
+            size = varga['size']
+            part = np.minimum(np.floor_divide(degree_in_sign, size).astype(np.intp), table.shape[1] - 1)
+            degrees[row] = np.remainder(degree_in_sign, size) * varga['divisions']
+        else:
+            bounds = varga['bounds'][sign_index]
+            part = (degree_in_sign[:, None] >= bounds[:, 1:-1]).sum(axis=1)
+            start = np.take_along_axis(bounds, part[:, None], axis=1)[:, 0]
+            end = np.take_along_axis(bounds, part[:, None] + 1, axis=1)[:, 0]
+            degrees[row] = (degree_in_sign - start) * (30 / (end - start))
+        signs[row] = table[sign_index, part]
+    
+    return signs, degrees
+
+
+def varga_sign_changes(chart_type):
+    """
+    Longitudes (0-360, ascending) at which the sign of a varga changes.
+    
+    Parameters
+    ----------
+    chart_type : str
+        Key of ``VARGA_DEFINITIONS`` (e.g. 'D9')
+        
+    Returns
+    -------
+    numpy.ndarray
+        float64 array of boundary longitudes in degrees
+    """
+    if chart_type not in _VARGAS:
+        raise ValueError(f"Unknown chart type: {chart_type}. Available: {list(VARGA_DEFINITIONS.keys())}")
+    return _VARGAS[chart_type]['changes'].copy()
+
+
+def varga_boundary_distances(longitudes, chart_types=None):
+    """
+    Distance in longitude to the previous and next sign change of each varga.
+    
+    Parameters
+    ----------
+    longitudes : array_like
+        (N,) longitudes in degrees (0-360)
+    chart_types : list of str, optional
+        Charts to use, any keys of ``VARGA_DEFINITIONS`` (default:
+        ``VARGA_ORDER``, the 16 standard charts)
+        
+    Returns
+    -------
+    tuple of numpy.ndarray
+        (degrees back to the previous change, degrees on to the next change),
+        both float64 of shape (len(chart_types), N); infinite for charts
+        whose sign never changes
+    """
+    if chart_types is None:
+        chart_types = VARGA_ORDER
+    for chart_type in chart_types:
+        if chart_type not in _VARGAS:
+            raise ValueError(f"Unknown chart type: {chart_type}. Available: {list(VARGA_DEFINITIONS.keys())}")
+    
+    longitudes = np.asarray(longitudes, dtype=np.float64).ravel() % 360
+    to_previous = np.empty((len(chart_types), len(longitudes)), dtype=np.float64)
+    to_next = np.empty((len(chart_types), len(longitudes)), dtype=np.float64)
+    for row, chart_type in enumerate(chart_types):
+        changes = _VARGAS[chart_type]['changes']
+        if len(changes) == 0:
+            # A scheme that maps everything to one sign never changes
+            to_previous[row] = np.inf
+            to_next[row] = np.inf
+            continue
+        # Wrap the change list around 0 degrees on both sides
+        extended = np.concatenate(([changes[-1] - 360], changes, [changes[0] + 360]))
+        index = np.searchsorted(extended, longitudes, side='right')
+        to_previous[row] = longitudes - extended[index - 1]
+        to_next[row] = extended[index] - longitudes
+    
+    return to_previous, to_next
+
+
+def calculate_varga_sensitivity(planetary_positions, speeds, chart_types=None):
+    """
+    How far each body is from a sign change in each varga, in longitude and time.
+    
+    A varga whose sign would change within a few minutes of birth time is
+    unreliable for an uncertain birth time. The time to a boundary is the
+    longitude distance divided by the body's speed; a retrograde body reaches
+    the previous boundary later and the next one earlier.
+    
+    Parameters
+    ----------
+    planetary_positions : dict
+        Dictionary of planetary positions with longitude values
+    speeds : dict
+        Daily speeds in degrees keyed like ``planetary_positions``; bodies
+        without a (non-zero) speed get no time estimates
+    chart_types : list of str, optional
+        Charts to use, any keys of ``VARGA_DEFINITIONS`` (default:
+        ``VARGA_ORDER``, the 16 standard charts)
+        
+    Returns
+    -------
+    dict
+        Per chart type and body: 'degreesToPrevious', 'degreesToNext' and
+        'minutesEarlier' / 'minutesLater', the shift of birth time (minutes)
+        that changes the varga sign, or None without a speed; all four are
+        None for charts whose sign never changes
+    """
+    if chart_types is None:
+        chart_types = VARGA_ORDER
+    
+    bodies = list(planetary_positions.keys())
+    longitudes = [data['longitude'] if isinstance(data, dict) else data
+                  for data in planetary_positions.values()]
+    to_previous, to_next = varga_boundary_distances(longitudes, chart_types)
+    to_previous = to_previous.tolist()
+    to_next = to_next.tolist()
+    
+    result = {}
+    for row, chart_type in enumerate(chart_types):
+        chart = {}
+        for i, body in enumerate(bodies):
+            speed = speeds.get(body)
+            if np.isinf(to_next[row][i]):
+                chart[body] = {'degreesToPrevious': None, 'degreesToNext': None,
+                               'minutesEarlier': None, 'minutesLater': None}
+                continue
+            entry = {
+                'degreesToPrevious': round(to_previous[row][i], 6),
+                'degreesToNext': round(to_next[row][i], 6),
+                'minutesEarlier': None,
+                'minutesLater': None,
+            }
+            if speed:
+                # Minutes of time per degree of longitude
+                scale = 1440 / abs(float(speed))
+                earlier, later = (to_previous[row][i], to_next[row][i]) if speed > 0 \
+                    else (to_next[row][i], to_previous[row][i])
+                entry['minutesEarlier'] = round(earlier * scale, 2)
+                entry['minutesLater'] = round(later * scale, 2)
+            chart[body] = entry
+        result[chart_type] = chart
+    
+    return result
 
 
 def calculate_divisional_chart(chart_type, planetary_positions):
@@ -506,15 +765,14 @@ def calculate_divisional_chart(chart_type, planetary_positions):
     dict
         Divisional chart data for all planets
     """
-    if chart_type not in DIVISIONAL_CHARTS:
-        raise ValueError(f"Unknown chart type: {chart_type}. Available: {list(DIVISIONAL_CHARTS.keys())}")
+    if chart_type not in VARGA_DEFINITIONS:
+        raise ValueError(f"Unknown chart type: {chart_type}. Available: {list(VARGA_DEFINITIONS.keys())}")
     
-    calc_func = DIVISIONAL_CHARTS[chart_type]
     result = {}
     
     for planet, data in planetary_positions.items():
         longitude = data['longitude'] if isinstance(data, dict) else data
-        div_result = calc_func(longitude)
+        div_result = calculate_varga(chart_type, longitude)
         
         sign_name = SIGN_NAMES[div_result['sign'] - 1]
         result[planet] = {
@@ -528,31 +786,110 @@ def calculate_divisional_chart(chart_type, planetary_positions):
     return result
 
 
-def calculate_all_divisional_charts(planetary_positions):
+def calculate_all_divisional_charts(planetary_positions, chart_types=None, fields=None):
     """
-    Calculate all divisional charts for the given planetary positions.
+    Calculate divisional charts for the given planetary positions.
     
     Parameters
     ----------
     planetary_positions : dict
         Dictionary of planetary positions with longitude values
+    chart_types : list of str, optional
+        Charts to calculate, any keys of ``VARGA_DEFINITIONS`` (default:
+        ``VARGA_ORDER``, the 16 standard charts)
+    fields : list of str, optional
+        Fields of ``CHART_FIELDS`` to include for every planet (default: all)
         
     Returns
     -------
     dict
-        All divisional charts data
-    """
+        Divisional chart data keyed by chart type
+    """
+    if chart_types is None:
+        chart_types = VARGA_ORDER
+    if fields is None:
+        fields = CHART_FIELDS
+    unknown = [field for field in fields if field not in CHART_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown field: {unknown[0]}. Available: {list(CHART_FIELDS)}")
+    
+    planets = list(planetary_positions.keys())
+    longitudes = [data['longitude'] if isinstance(data, dict) else data
+                  for data in planetary_positions.values()]
+    signs, degrees = calculate_varga_arrays(longitudes, chart_types)
+    signs = signs.tolist()
+    degrees = degrees.tolist()
+    
+    # Only the requested fields are formatted
+    formatters = {
+        'longitude': lambda sign, degree: round((sign - 1) * 30 + degree, 6),
+        'sign': lambda sign, degree: SIGN_NAMES[sign - 1],
+        'signNumber': lambda sign, degree: sign,
+        'degreeInSign': lambda sign, degree: round(degree, 4),
+        'formatted': lambda sign, degree: f"{SIGN_NAMES[sign - 1]} {degree:.2f}°",
+    }
+    selected = [(field, formatters[field]) for field in fields]
+    
     all_charts = {}
     
-    for chart_type in DIVISIONAL_CHARTS.keys():
+    for row, chart_type in enumerate(chart_types):
+        chart = {}
+        for planet, sign, degree in zip(planets, signs[row], degrees[row]):
+            chart[planet] = {field: formatter(sign, degree) for field, formatter in selected}
         all_charts[chart_type] = {
-            'name': CHART_NAMES[chart_type],
-            'planets': calculate_divisional_chart(chart_type, planetary_positions)
+            'name': VARGA_DEFINITIONS[chart_type]['name'],
+            'planets': chart
         }
     
     return all_charts
 
 
+def calculate_divisional_charts_compact(planetary_positions, chart_types=None):
+    """
+    Calculate divisional charts in the compact wire format.
+    
+    Instead of a nested dict per planet, every chart holds parallel arrays of
+    sign numbers and degrees in the order of ``bodies``; sign names are sent
+    once in ``signNames`` and any formatting is left to the client.
+    
+    Parameters
+    ----------
+    planetary_positions : dict
+        Dictionary of planetary positions with longitude values
+    chart_types : list of str, optional
+        Charts to calculate, any keys of ``VARGA_DEFINITIONS`` (default:
+        ``VARGA_ORDER``, the 16 standard charts)
+        
+    Returns
+    -------
+    dict
+        {'bodies': [...], 'signNames': [...], 'charts': {chart_type:
+        {'name': str, 'signNumbers': [int], 'degrees': [float]}}}
+    """
+    if chart_types is None:
+        chart_types = VARGA_ORDER
+    
+    longitudes = [data['longitude'] if isinstance(data, dict) else data
+                  for data in planetary_positions.values()]
+    signs, degrees = calculate_varga_arrays(longitudes, chart_types)
+    signs = signs.tolist()
+    # Same rounding as 'degreeInSign' of the full format
+    degrees = [[round(degree, 4) for degree in row] for row in degrees.tolist()]
+    
+    return {
+        'bodies': list(planetary_positions.keys()),
+        'signNames': SIGN_NAMES,
+        'charts': {
+            chart_type: {
+                'name': VARGA_DEFINITIONS[chart_type]['name'],
+                'signNumbers': signs[row],
+                'degrees': degrees[row]
+            }
+            for row, chart_type in enumerate(chart_types)
+        }
+    }
+
+
 if __name__ == "__main__":
     # Test with sample positions
     test_positions = {
@@ -0,0 +1,151 @@
+"""
+Ephemeris Process Pool
+======================
+
+Multi-core batch chart calculation.
+
+Swiss Ephemeris keeps its ephemeris path and sidereal mode in global C-library
+state, so a single process cannot safely mix configurations across threads and
+gains nothing from extra cores. ``EphemerisPool`` starts worker processes that
+each create one ``AstrologyCalculator`` at startup: the ephemeris files are
+opened once per worker and its configuration stays pinned for the worker's
+lifetime. Chart jobs are dispatched in chunks of Julian Days and come back as
+compact float64 arrays, so throughput scales with the number of cores.
+
+Usage:
+    with EphemerisPool(processes=4, ephe_path='ephe') as pool:
+        charts = pool.get_planetary_chart_data_batch(dates, latitudes, longitudes)
+"""
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from astrology_calculator import AstrologyCalculator
+from julian_day import to_julian_days
+
+# Calculator owned by the current worker process
+_worker_calculator = None
+
+
+def _init_worker(ephe_path, calculator_options):
+    """Create the worker's calculator; this pins its Swiss Ephemeris state."""
+    global _worker_calculator
+    _worker_calculator = AstrologyCalculator(ephe_path, **calculator_options)
+
+
+def _compute_chunk(jds, latitudes, longitudes, house_system):
+    """Calculate one chunk; returns a (bodies, len(jds)) float64 array."""
+    longitudes_by_body = _worker_calculator.calculate_longitudes_batch(
+        jds, latitudes, longitudes, house_system
+    )
+    return np.vstack(list(longitudes_by_body.values()))
+
+
+class EphemerisPool:
+    """
+    Pool of worker processes with per-worker pinned Swiss Ephemeris state.
+    """
+
+    def __init__(self, processes=None, ephe_path='ephe', chunk_size=2048, **calculator_options):
+        """
+        Start the worker processes.
+
+        Parameters
+        ----------
+        processes : int, optional
+            Number of worker processes (default: number of CPUs)
+        ephe_path : str, optional
+            Path to Swiss Ephemeris data files (default: 'ephe')
+        chunk_size : int, optional
+            Number of charts sent to a worker per job (default: 2048)
+        **calculator_options
+            Extra ``AstrologyCalculator`` arguments for every worker, e.g. the
+            path of a Chebyshev ``ephemeris_store`` (shared through the page cache)
+        """
+        if not os.path.exists(ephe_path):
+            raise FileNotFoundError(
+                f"Ephemeris directory '{ephe_path}' not found. "
+                "Download files from ftp://ftp.astro.com/pub/swisseph/ephe/"
+            )
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be at least 1.")
+        self.processes = processes or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        # 'spawn' gives every worker a fresh Swiss Ephemeris library state
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.processes,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_worker,
+            initargs=(ephe_path, calculator_options),
+        )
+
+    def calculate_longitudes_batch(self, dates, latitudes=None, longitudes=None, house_system='P'):
+        """
+        Calculate sidereal longitudes for many instants across the workers.
+
+        Parameters
+        ----------
+        dates : array_like
+            Dates of observation (see ``julian_day.to_julian_days`` for accepted forms)
+        latitudes : float or array_like, optional
+            Geographic latitudes (required for Ascendant calculation)
+        longitudes : float or array_like, optional
+            Geographic longitudes (required for Ascendant calculation)
+        house_system : str, optional
+            House system used for the Ascendant ('P' for Placidus by default)
+
+        Returns
+        -------
+        dict
+            Mapping of body name ('Sun', ..., 'Ketu', 'Ascendant') to a float64
+            array of longitudes with one value per date
+        """
+        jds = to_julian_days(dates)
+        n = len(jds)
+        with_ascendant = latitudes is not None and longitudes is not None
+        if with_ascendant:
+            latitudes = np.broadcast_to(np.asarray(latitudes, dtype=np.float64), (n,))
+            longitudes = np.broadcast_to(np.asarray(longitudes, dtype=np.float64), (n,))
+
+        futures = []
+        for start in range(0, n, self.chunk_size):
+            chunk = slice(start, start + self.chunk_size)
+            futures.append(self._executor.submit(
+                _compute_chunk,
+                jds[chunk],
+                np.ascontiguousarray(latitudes[chunk]) if with_ascendant else None,
+                np.ascontiguousarray(longitudes[chunk]) if with_ascendant else None,
+                house_system,
+            ))
+
+        names = [planet.capitalize() for planet in AstrologyCalculator.PLANETS]
+        if with_ascendant:
+            names.append('Ascendant')
+        if not futures:
+            return {name: np.empty(0) for name in names}
+        results = np.hstack([future.result() for future in futures])
+        return dict(zip(names, results))
+
+    def get_planetary_chart_data_batch(self, dates, latitudes=None, longitudes=None, house_system='P'):
+        """
+        Get chart data for many instants across the workers.
+
+        Same parameters as ``calculate_longitudes_batch``; returns the same
+        structure as ``AstrologyCalculator.get_planetary_chart_data_batch``.
+        """
+        longitudes_by_body = self.calculate_longitudes_batch(dates, latitudes, longitudes, house_system)
+        return {body: AstrologyCalculator.to_chart_records(longs)
+                for body, longs in longitudes_by_body.items()}
+
+    def close(self):
+        """Shut down the worker processes."""
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
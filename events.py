@@ -0,0 +1,368 @@
+"""
+Event Search
+============
+
+Find the instants at which bodies cross sign or nakshatra boundaries, and the
+stations at which planets turn retrograde or direct.
+
+Instead of sampling a fixed grid, each body is stepped adaptively: the
+distance to the nearest boundary divided by the body's largest possible speed
+is a time span in which no crossing can happen, so the search jumps straight
+over it. When a step changes the division, the crossing is bracketed and
+refined with Newton's method on the longitude (the speed comes with every
+position from ``swe.calc_ut``), falling back to bisection inside the bracket.
+Crossings are located to better than a second of time. Positions come from
+``AstrologyCalculator.position_function``, which evaluates every instant
+exactly instead of through the position cache, so ``precision`` finer than
+the cache resolution is honoured and searches do not flush the cache.
+
+Stations are the zeros of the daily speed. Speed is scanned on a grid finer
+than the shortest retrograde or direct phase of each planet, so no station
+can be skipped, and every sign change of the speed is refined with the
+Illinois variant of regula falsi.
+
+Usage:
+    calc = AstrologyCalculator()
+    for event in find_ingresses(calc, 'saturn', '2025-01-01', '2030-01-01'):
+        print(event['datetime'], event['to_name'])
+    for period in find_retrograde_periods(calc, 'mercury', '2025-01-01', '2026-01-01'):
+        print(period['start'], period['end'])
+"""
+
+from julian_day import from_julian_day, to_julian_day
+
+# Width of one division of the zodiac in degrees
+DIVISIONS = {
+    'sign': 30.0,
+    'nakshatra': 360.0 / 27,
+}
+
+SIGN_NAMES = ["Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo",
+              "Libra", "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces"]
+
+NAKSHATRA_NAMES = [
+    "Ashwini", "Bharani", "Krittika", "Rohini", "Mrigashira", "Ardra",
+    "Punarvasu", "Pushya", "Ashlesha", "Magha", "Purva Phalguni", "Uttara Phalguni",
+    "Hasta", "Chitra", "Swati", "Vishakha", "Anuradha", "Jyeshtha",
+    "Mula", "Purva Ashadha", "Uttara Ashadha", "Shravana", "Dhanishta", "Shatabhisha",
+    "Purva Bhadrapada", "Uttara Bhadrapada", "Revati",
+]
+
+DIVISION_NAMES = {
+    'sign': SIGN_NAMES,
+    'nakshatra': NAKSHATRA_NAMES,
+}
+
+# Upper bound of each body's absolute daily speed in degrees (1900-2100
+# extremes plus a margin); a body cannot cover more than this in one day
+MAX_SPEEDS = {
+    'sun': 1.1,
+    'moon': 16.0,
+    'mercury': 2.5,
+    'venus': 1.4,
+    'mars': 0.9,
+    'jupiter': 0.27,
+    'saturn': 0.15,
+    'uranus': 0.075,
+    'neptune': 0.045,
+    'rahu': 0.3,
+    'ketu': 0.3,
+}
+
+# Shortest scan step in days; keeps the search moving when a body creeps
+# along a boundary
+MIN_STEP = 1.0 / 96
+
+# Default precision of event times in days (one second)
+PRECISION = 1.0 / 86400
+
+# Speed scan step in days per planet. The shortest retrograde or direct phase
+# between 1900 and 2100 is 19 days for Mercury, 40 for Venus, 60 for Mars and
+# over 110 for the outer planets, so each step holds at most one station.
+STATION_SCAN_STEPS = {
+    'mercury': 5.0,
+    'venus': 10.0,
+    'mars': 15.0,
+    'jupiter': 20.0,
+    'saturn': 20.0,
+    'uranus': 20.0,
+    'neptune': 20.0,
+}
+
+# Planets searched by default ("Mercury through Saturn")
+STATION_BODIES = ['mercury', 'venus', 'mars', 'jupiter', 'saturn']
+
+
+def _offset(longitude, boundary):
+    """Signed angular distance from a boundary in degrees (-180 to 180)."""
+    return (longitude - boundary + 180) % 360 - 180
+
+
+def _refine_crossing(position, boundary, start, end, precision):
+    """
+    Locate the instant a body crosses ``boundary`` inside [start, end].
+
+    ``position(jd)`` returns (longitude, speed); the body must be on opposite
+    sides of the boundary at ``start`` and ``end``.
+    """
+    longitude, speed = position(start)
+    start_offset = _offset(longitude, boundary)
+    jd = start - start_offset / speed if speed else (start + end) / 2
+    if not start < jd < end:
+        jd = (start + end) / 2
+
+    while True:
+        longitude, speed = position(jd)
+        offset = _offset(longitude, boundary)
+        if (offset < 0) == (start_offset < 0):
+            start, start_offset = jd, offset
+        else:
+            end = jd
+        newton = jd - offset / speed if speed else None
+        if newton is not None and abs(newton - jd) < precision:
+            return newton
+        if end - start < precision:
+            return (start + end) / 2
+        jd = newton if newton is not None and start < newton < end else (start + end) / 2
+
+
+def find_ingresses(calculator, bodies, start, end, division='sign', ayanamsa=None,
+                   precision=PRECISION):
+    """
+    Find when bodies move from one sign (or nakshatra) into another.
+
+    Parameters
+    ----------
+    calculator : AstrologyCalculator
+        Calculator providing the sidereal positions
+    bodies : str or iterable of str
+        Planet name(s) ('sun', 'moon', ..., 'rahu', 'ketu')
+    start, end : str, datetime or float
+        Search window (see ``julian_day.to_julian_day`` for accepted forms)
+    division : str, optional
+        'sign' (default) or 'nakshatra'
+    ayanamsa : str, optional
+        Ayanamsa system (default: the calculator's ayanamsa)
+    precision : float, optional
+        Precision of the event times in days (default: one second)
+
+    Returns
+    -------
+    list of dict
+        One entry per crossing, ordered by time, with 'body', 'jd',
+        'datetime' (UTC), 'division', 'from' / 'to' (1-based division numbers),
+        'from_name' / 'to_name', 'longitude' of the boundary and 'retrograde'
+    """
+    if division not in DIVISIONS:
+        raise ValueError(f"Unknown division '{division}'. Available: {', '.join(DIVISIONS)}")
+    if isinstance(bodies, str):
+        bodies = [bodies]
+    bodies = [body.lower() for body in bodies]
+    for body in bodies:
+        if body not in MAX_SPEEDS:
+            raise ValueError(f"Unknown planet '{body}'. Available: {', '.join(MAX_SPEEDS)}")
+
+    start_jd = to_julian_day(start)
+    end_jd = to_julian_day(end)
+    if end_jd <= start_jd:
+        raise ValueError("End of the search window must be after its start.")
+
+    size = DIVISIONS[division]
+    names = DIVISION_NAMES[division]
+    count = len(names)
+    events = []
+
+    for body in bodies:
+        position = calculator.position_function(body, ayanamsa)
+        max_speed = MAX_SPEEDS[body]
+        jd = start_jd
+        longitude, _ = position(jd)
+        while jd < end_jd:
+            within = longitude % size
+            step = max(min(within, size - within) / max_speed, MIN_STEP)
+            next_jd = min(jd + step, end_jd)
+            next_longitude, _ = position(next_jd)
+
+            index = int(longitude // size)
+            next_index = int(next_longitude // size)
+            if next_index != index:
+                forward = _offset(next_longitude, longitude) > 0
+                boundary = (next_index if forward else index) * size
+                event_jd = float(_refine_crossing(position, boundary, jd, next_jd, precision))
+                if event_jd < end_jd:
+                    events.append({
+                        'body': body.capitalize(),
+                        'jd': event_jd,
+                        'datetime': from_julian_day(event_jd),
+                        'division': division,
+                        'from': index + 1,
+                        'to': next_index + 1,
+                        'from_name': names[index % count],
+                        'to_name': names[next_index % count],
+                        'longitude': boundary % 360,
+                        'retrograde': not forward,
+                    })
+            jd, longitude = next_jd, next_longitude
+
+    events.sort(key=lambda event: event['jd'])
+    return events
+
+
+def bracketed_root(function, start, end, precision=PRECISION, start_value=None, end_value=None):
+    """
+    Find a zero of ``function`` inside [start, end] where it changes sign.
+
+    Uses the Illinois variant of regula falsi, which keeps the bracket of
+    bisection but converges superlinearly on smooth functions. Known values
+    at the ends of the bracket can be passed to save two evaluations.
+
+    Returns
+    -------
+    float
+        A point within ``precision`` of the zero
+    """
+    if start_value is None:
+        start_value = function(start)
+    if end_value is None:
+        end_value = function(end)
+    side = 0
+    while end - start > precision:
+        x = (start * end_value - end * start_value) / (end_value - start_value)
+        if not start < x < end:
+            x = (start + end) / 2
+        value = function(x)
+        if value == 0:
+            return x
+        if (value < 0) == (start_value < 0):
+            start, start_value = x, value
+            if side == -1:
+                end_value /= 2
+            side = -1
+        else:
+            end, end_value = x, value
+            if side == 1:
+                start_value /= 2
+            side = 1
+    return (start + end) / 2
+
+
+def _refine_station(position, start, end, precision, start_speed, end_speed):
+    """
+    Locate the instant the speed changes sign inside [start, end].
+
+    Returns (jd, longitude) of the station.
+    """
+    jd = bracketed_root(lambda t: position(t)[1], start, end, precision, start_speed, end_speed)
+    return jd, position(jd)[0]
+
+
+def find_stations(calculator, bodies, start, end, ayanamsa=None, precision=PRECISION):
+    """
+    Find when planets station retrograde or direct.
+
+    Parameters
+    ----------
+    calculator : AstrologyCalculator
+        Calculator providing the sidereal positions
+    bodies : str or iterable of str, optional
+        Planet name(s) from ``STATION_SCAN_STEPS``; None searches ``STATION_BODIES``
+    start, end : str, datetime or float
+        Search window (see ``julian_day.to_julian_day`` for accepted forms)
+    ayanamsa : str, optional
+        Ayanamsa system (default: the calculator's ayanamsa)
+    precision : float, optional
+        Precision of the station times in days (default: one second)
+
+    Returns
+    -------
+    list of dict
+        One entry per station, ordered by time, with 'body', 'jd', 'datetime'
+        (UTC), 'type' ('retrograde' or 'direct'), 'longitude', 'sign_number'
+        and 'sign_name'
+    """
+    if bodies is None:
+        bodies = STATION_BODIES
+    elif isinstance(bodies, str):
+        bodies = [bodies]
+    bodies = [body.lower() for body in bodies]
+    for body in bodies:
+        if body not in STATION_SCAN_STEPS:
+            raise ValueError(f"Planet '{body}' has no stations. Available: {', '.join(STATION_SCAN_STEPS)}")
+
+    start_jd = to_julian_day(start)
+    end_jd = to_julian_day(end)
+    if end_jd <= start_jd:
+        raise ValueError("End of the search window must be after its start.")
+
+    stations = []
+    for body in bodies:
+        position = calculator.position_function(body, ayanamsa)
+        step = STATION_SCAN_STEPS[body]
+        jd = start_jd
+        _, speed = position(jd)
+        while jd < end_jd:
+            next_jd = min(jd + step, end_jd)
+            _, next_speed = position(next_jd)
+            if (next_speed < 0) != (speed < 0):
+                station_jd, longitude = _refine_station(position, jd, next_jd, precision,
+                                                        speed, next_speed)
+                station_jd = float(station_jd)
+                stations.append({
+                    'body': body.capitalize(),
+                    'jd': station_jd,
+                    'datetime': from_julian_day(station_jd),
+                    'type': 'retrograde' if next_speed < 0 else 'direct',
+                    'longitude': longitude,
+                    'sign_number': int(longitude // 30) + 1,
+                    'sign_name': SIGN_NAMES[int(longitude // 30)],
+                })
+            jd, speed = next_jd, next_speed
+
+    stations.sort(key=lambda station: station['jd'])
+    return stations
+
+
+def find_retrograde_periods(calculator, bodies, start, end, ayanamsa=None, precision=PRECISION):
+    """
+    Find retrograde periods, pairing each retrograde station with the next direct one.
+
+    Takes the same parameters as ``find_stations``.
+
+    Returns
+    -------
+    list of dict
+        One entry per retrograde period, ordered by start, with 'body',
+        'start_jd' / 'end_jd', 'start' / 'end' (UTC datetimes) and
+        'start_longitude' / 'end_longitude'. For a period already running
+        at the start of the window (or still running at its end) the start
+        (or end) fields are None.
+    """
+    periods = []
+    open_periods = {}
+    for station in find_stations(calculator, bodies, start, end, ayanamsa, precision):
+        body = station['body']
+        if station['type'] == 'retrograde':
+            open_periods[body] = {
+                'body': body,
+                'start_jd': station['jd'],
+                'start': station['datetime'],
+                'start_longitude': station['longitude'],
+                'end_jd': None,
+                'end': None,
+                'end_longitude': None,
+            }
+            periods.append(open_periods[body])
+        else:
+            period = open_periods.pop(body, None)
+            if period is None:
+                period = {
+                    'body': body,
+                    'start_jd': None,
+                    'start': None,
+                    'start_longitude': None,
+                }
+                periods.append(period)
+            period['end_jd'] = station['jd']
+            period['end'] = station['datetime']
+            period['end_longitude'] = station['longitude']
+    return periods
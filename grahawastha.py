@@ -1,21 +1,7 @@
-import D1
 from PIL import Image, ImageDraw, ImageFont
 
-# Planet names and longitudes
-planet_longs = {
-    'Sun': D1.sun_long,
-    'Moon': D1.moon_long,
-    'Mars': D1.mars_long,
-    'Mercury': D1.mercury_long,
-    'Jupiter': D1.jupiter_long,
-    'Venus': D1.venus_long,
-    'Saturn': D1.saturn_long
-}
-
-planet_names = list(planet_longs.keys())
-
-# Extract zodiac sign (1–12) for each planet
-planet_signs = {name: int(long // 30) + 1 for name, long in planet_longs.items()}
+# Planets with avasthas, in table order
+AVASTHA_PLANETS = ['Sun', 'Moon', 'Mars', 'Mercury', 'Jupiter', 'Venus', 'Saturn']
 
 # Zodiac signs (0 to 11)
 signs = [
@@ -39,9 +25,6 @@ combust_orb = {
     "Moon": 12, "Mars": 17, "Mercury": 14, "Jupiter": 11, "Venus": 10, "Saturn": 15
 }
 
-# Avastha results will be stored here
-graha_avasthas = {}
-
 def get_sign(degree):
     return signs[int(degree // 30)]
 
@@ -94,32 +77,52 @@ def is_combust(planet, planet_deg, sun_deg):
     diff = abs((planet_deg - sun_deg + 180) % 360 - 180)
     return diff < combust_orb[planet]
 
-for planet, deg in planet_longs.items():
-    sign = get_sign(deg)
-    deg_in_sign = deg % 30
-    deeptaadi = get_deeptaadi(planet, sign)
-    jagradadi = get_jagradadi(deeptaadi)
-    balaadi = get_balaadi(planet_signs[planet], deg_in_sign)
+def calculate_graha_avasthas(planet_longs):
+    """
+    Calculate the avasthas (planetary states) of the seven planets.
+
+    Parameters
+    ----------
+    planet_longs : dict
+        Sidereal longitudes keyed by planet name; bodies other than
+        ``AVASTHA_PLANETS`` are ignored
+
+    Returns
+    -------
+    dict
+        Per planet: 'Sign', 'Deeptaadi', 'Jagradadi', 'Balaadi',
+        'Lajjitaadi' and 'Combust'
+    """
+    graha_avasthas = {}
     sun_deg = planet_longs.get("Sun", 0)
-    combust = is_combust(planet, deg, sun_deg)
-
-    if combust and deeptaadi in ["Dukhita", "Shanta"]:
-        lajjitaadi = "Lajjita"
-    elif deeptaadi == "Deepta":
-        lajjitaadi = "Garvita"
-    else:
-        lajjitaadi = "Mudita"
-
-    graha_avasthas[planet] = {
-        "Sign": sign,
-        "Deeptaadi": deeptaadi,
-        "Jagradadi": jagradadi,
-        "Balaadi": balaadi,
-        "Lajjitaadi": lajjitaadi,
-        "Combust": combust
-    }
-    # Write avasthas to a PNG file in tabular format
-
+    for planet in AVASTHA_PLANETS:
+        deg = planet_longs[planet]
+        sign = get_sign(deg)
+        deg_in_sign = deg % 30
+        deeptaadi = get_deeptaadi(planet, sign)
+        jagradadi = get_jagradadi(deeptaadi)
+        balaadi = get_balaadi(int(deg // 30) + 1, deg_in_sign)
+        combust = is_combust(planet, deg, sun_deg)
+
+        if combust and deeptaadi in ["Dukhita", "Shanta"]:
+            lajjitaadi = "Lajjita"
+        elif deeptaadi == "Deepta":
+            lajjitaadi = "Garvita"
+        else:
+            lajjitaadi = "Mudita"
+
+        graha_avasthas[planet] = {
+            "Sign": sign,
+            "Deeptaadi": deeptaadi,
+            "Jagradadi": jagradadi,
+            "Balaadi": balaadi,
+            "Lajjitaadi": lajjitaadi,
+            "Combust": combust
+        }
+    return graha_avasthas
+
+def render_avastha_table(graha_avasthas):
+    """Draw the avasthas as a table and return it as a PIL image."""
     # Prepare table data
     fieldnames = ["Planet", "Sign", "Deeptaadi", "Jagradadi", "Balaadi", "Lajjitaadi", "Combust"]
     rows = []
@@ -130,7 +133,7 @@ for planet, deg in planet_longs.items():
     # Font settings
     try:
         font = ImageFont.truetype("arial.ttf", 18)
-    except:
+    except OSError:
         font = ImageFont.load_default()
 
     cell_widths = [max(len(str(cell)) for cell in col) * 12 + 20 for col in zip(*([fieldnames] + rows))]
@@ -157,5 +160,11 @@ for planet, deg in planet_longs.items():
             draw.text((x + 10, y + 5), str(cell), fill="black", font=font)
             x += cell_widths[col_idx]
 
-    img.save("graha_avasthas.png")
-  
+    return img
+
+if __name__ == "__main__":
+    import D1
+
+    # Write avasthas to a PNG file in tabular format
+    graha_avasthas = calculate_graha_avasthas(D1.prompt_birth_positions())
+    render_avastha_table(graha_avasthas).save("graha_avasthas.png")
@@ -1,15 +1,5 @@
-import D1
-
-# Planetary longitudes
-planet_longitudes = {
-    'Sun': D1.sun_long,
-    'Moon': D1.moon_long,
-    'Mars': D1.mars_long,
-    'Mercury': D1.mercury_long,
-    'Jupiter': D1.jupiter_long,
-    'Venus': D1.venus_long,
-    'Saturn': D1.saturn_long
-}
+# Planets whose aspects are reported
+DRISHTI_PLANETS = ['Sun', 'Moon', 'Mars', 'Mercury', 'Jupiter', 'Venus', 'Saturn']
 
 # Function to normalize angle between 0-360
 def normalize(angle):
@@ -36,9 +26,10 @@ def get_graha_drishti(planet, position):
     return aspects
 
 # Mapping planets to their drishti degrees and the signs they aspect
-def get_aspect_report():
+def get_aspect_report(planet_longitudes):
     report = {}
-    for planet, pos in planet_longitudes.items():
+    for planet in DRISHTI_PLANETS:
+        pos = planet_longitudes[planet]
         aspect_points = get_graha_drishti(planet, pos)
         aspect_signs = [int(deg // 30) + 1 for deg in aspect_points]
         report[planet] = {
@@ -56,9 +47,6 @@ def print_aspect_report(report):
             print(f"  → {deg:.2f}° (Sign {sign})")
         print()
 
-# Execute
-aspect_data = get_aspect_report()
-print_aspect_report(aspect_data)
 
 def get_aspected_houses(planet_sign, planet_name):
     """
@@ -81,3 +69,10 @@ def get_aspected_houses(planet_sign, planet_name):
         aspects += [(planet_sign + 2 - 1) % 12 + 1, (planet_sign + 9 - 1) % 12 + 1]  # 3rd, 10th
 
     return sorted(set(aspects))
+
+
+if __name__ == "__main__":
+    import D1
+
+    aspect_data = get_aspect_report(D1.prompt_birth_positions())
+    print_aspect_report(aspect_data)
@@ -0,0 +1,186 @@
+"""
+Julian Day Conversion
+=====================
+
+Fast conversion of observation times to UT Julian Days for Swiss Ephemeris.
+
+Date strings in the ``YYYY-MM-DD`` / ``YYYY-MM-DD HH:MM:SS`` forms used
+throughout this project are parsed directly with proleptic Gregorian
+arithmetic (the same convention astropy uses), so no ``astropy.time.Time``
+object has to be built just to read ``.jd``. Recent string conversions are
+memoized in a bounded LRU cache, and arrays of dates are converted in a
+single vectorized pass.
+
+astropy is only needed as a compatibility path: ``Time`` objects are still
+accepted, and strings in formats the fast parser does not recognise are
+handed to astropy when it is installed.
+"""
+
+import calendar
+import re
+from datetime import date as date_type, datetime, timedelta, timezone
+from functools import lru_cache
+
+import numpy as np
+
+# Unix epoch (1970-01-01T00:00:00 UTC) as a Julian Day
+UNIX_EPOCH_JD = 2440587.5
+
+_UNIX_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# Number of distinct date strings remembered by the conversion memo
+MEMO_SIZE = 4096
+
+_DATE_PATTERN = re.compile(
+    r'^\s*(-?\d{1,4})-(\d{1,2})-(\d{1,2})'
+    r'(?:[ T](\d{1,2}):(\d{2})(?::(\d{2}(?:\.\d*)?))?)?'
+    r'\s*(?:Z|UTC)?\s*$'
+)
+
+
+def gregorian_to_jd(year, month, day, hour=0, minute=0, second=0.0):
+    """
+    Convert a proleptic Gregorian calendar date and UT time to a Julian Day.
+
+    Parameters
+    ----------
+    year, month, day : int
+        Calendar date
+    hour, minute : int, optional
+        Time of day (UT)
+    second : float, optional
+        Seconds, may be fractional
+
+    Returns
+    -------
+    float
+        Julian Day in UT
+    """
+    a = (14 - month) // 12
+    y = year + 4800 - a
+    m = month + 12 * a - 3
+    day_number = day + (153 * m + 2) // 5 + 365 * y + y // 4 - y // 100 + y // 400 - 32045
+    return day_number - 0.5 + (hour * 3600 + minute * 60 + second) / 86400.0
+
+
+def _days_in_month(year, month):
+    """Number of days in a month of the proleptic Gregorian calendar."""
+    if month == 2 and calendar.isleap(year):
+        return 29
+    return calendar.mdays[month]
+
+
+@lru_cache(maxsize=MEMO_SIZE)
+def _string_to_jd(text):
+    """Parse a date string to a Julian Day (memoized)."""
+    match = _DATE_PATTERN.match(text)
+    if match:
+        year, month, day, hour, minute, second = match.groups()
+        month, day = int(month), int(day)
+        hour = int(hour) if hour else 0
+        minute = int(minute) if minute else 0
+        second = float(second) if second else 0.0
+        if not (1 <= month <= 12 and hour <= 23 and minute <= 59 and second < 61
+                and 1 <= day <= _days_in_month(int(year), month)):
+            raise ValueError(f"Invalid date '{text}'. Use 'YYYY-MM-DD HH:MM:SS'.")
+        return gregorian_to_jd(int(year), month, day, hour, minute, second)
+
+    # Compatibility path for formats the fast parser does not handle
+    try:
+        from astropy.time import Time
+    except ImportError:
+        raise ValueError(f"Invalid date format '{text}'. Use 'YYYY-MM-DD HH:MM:SS'.")
+    try:
+        return float(Time(text).jd)
+    except ValueError as e:
+        raise ValueError(f"Invalid date format: {e}. Use 'YYYY-MM-DD HH:MM:SS'.")
+
+
+def to_julian_day(date):
+    """
+    Convert a single observation time to a UT Julian Day.
+
+    Parameters
+    ----------
+    date : str, datetime.datetime, datetime.date, float or astropy.time.Time
+        Date of observation. Strings use the ``YYYY-MM-DD[ HH:MM:SS]`` form,
+        naive datetimes are taken as UTC, aware datetimes are converted to UTC,
+        and plain numbers are treated as Julian Days already.
+
+    Returns
+    -------
+    float
+        Julian Day in UT
+    """
+    if isinstance(date, str):
+        return _string_to_jd(date)
+    if isinstance(date, datetime):
+        if date.tzinfo is not None:
+            date = date.astimezone(timezone.utc)
+        return gregorian_to_jd(date.year, date.month, date.day, date.hour, date.minute,
+                               date.second + date.microsecond / 1e6)
+    if isinstance(date, date_type):
+        return gregorian_to_jd(date.year, date.month, date.day)
+    if isinstance(date, (int, float, np.integer, np.floating)):
+        return float(date)
+    if hasattr(date, 'jd'):
+        # astropy.time.Time (or anything else exposing a Julian Day)
+        return float(date.jd)
+    raise TypeError(f"Unsupported date type: {type(date).__name__}")
+
+
+def to_julian_days(dates):
+    """
+    Convert an array of observation times to UT Julian Days in one pass.
+
+    Parameters
+    ----------
+    dates : array_like
+        Date strings, datetimes, ``numpy.datetime64`` values (UTC), an astropy
+        ``Time`` array, or Julian Days given as numbers
+
+    Returns
+    -------
+    numpy.ndarray
+        1-D array of Julian Days in UT
+    """
+    if hasattr(dates, 'jd') and not isinstance(dates, (str, np.ndarray)):
+        return np.atleast_1d(np.asarray(dates.jd, dtype=np.float64))
+
+    dates = np.atleast_1d(np.asarray(dates))
+    if dates.dtype.kind in 'iuf':
+        return dates.astype(np.float64)
+    if dates.dtype.kind == 'U':
+        try:
+            dates = dates.astype('datetime64[us]')
+        except ValueError:
+            # Fall back to the scalar parser for mixed or non-ISO strings
+            return np.fromiter((_string_to_jd(d) for d in dates.tolist()),
+                               dtype=np.float64, count=len(dates))
+    if dates.dtype.kind == 'M':
+        microseconds = (dates.astype('datetime64[us]') - np.datetime64(0, 'us')).astype(np.float64)
+        return microseconds / 86400e6 + UNIX_EPOCH_JD
+    return np.fromiter((to_julian_day(d) for d in dates.tolist()),
+                       dtype=np.float64, count=len(dates))
+
+
+def from_julian_day(jd):
+    """
+    Convert a UT Julian Day to an aware UTC datetime.
+
+    Parameters
+    ----------
+    jd : float
+        Julian Day in UT (years 1-9999)
+
+    Returns
+    -------
+    datetime.datetime
+        Time in UTC, rounded to the microsecond
+    """
+    return _UNIX_EPOCH + timedelta(microseconds=round((jd - UNIX_EPOCH_JD) * 86400e6))
+
+
+def memo_info():
+    """Return hit/miss statistics of the string conversion memo."""
+    return _string_to_jd.cache_info()
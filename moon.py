@@ -1,10 +1,10 @@
 import swisseph as swe
-from astropy.time import Time
 import os
 import pytz
 from datetime import datetime
 from timezonefinder import TimezoneFinder
 import location2 as loc
+from julian_day import to_julian_day
 
 def calculate_moon_sidereal_longitude(date, ephe_path='ephe'):
     """
@@ -13,7 +13,7 @@ def calculate_moon_sidereal_longitude(date, ephe_path='ephe'):
 
     Parameters
     ----------
-    date : str or `~astropy.time.Time`
+    date : str, `~datetime.datetime` or `~astropy.time.Time`
         Date of observation (e.g., '2025-05-11').
     ephe_path : str, optional
         Path to Swiss Ephemeris data files (default: 'ephe').
@@ -29,11 +29,7 @@ def calculate_moon_sidereal_longitude(date, ephe_path='ephe'):
     swe.set_ephe_path(ephe_path)
 
     # Convert date to Julian Day
-    if isinstance(date, str):
-        t = Time(date)
-    else:
-        t = date
-    jd = t.jd  # Julian Day in UTC
+    jd = to_julian_day(date)  # Julian Day in UTC
 
     # Set Lahiri Ayanamsa (sidereal mode)
     swe.set_sid_mode(swe.SIDM_LAHIRI)
@@ -0,0 +1,93 @@
+"""
+Position Cache
+==============
+
+Bounded LRU cache for ephemeris results.
+
+Entries are keyed on the Julian Day rounded to a configurable resolution plus
+whatever identifies the calculation (body, flags, sidereal mode, location...),
+so repeated requests for the same instant skip Swiss Ephemeris entirely.
+The cache is shared between request threads and guarded by a lock.
+"""
+
+import threading
+from collections import OrderedDict
+
+# Default key resolution: one second of time, expressed in days
+DEFAULT_RESOLUTION = 1.0 / 86400
+
+
+class PositionCache:
+    """
+    Thread-safe LRU cache with hit/miss counters.
+    """
+
+    def __init__(self, maxsize=4096, resolution=DEFAULT_RESOLUTION):
+        """
+        Parameters
+        ----------
+        maxsize : int, optional
+            Maximum number of entries; 0 disables caching (default: 4096)
+        resolution : float, optional
+            Julian Day quantization step in days (default: one second)
+        """
+        if maxsize < 0:
+            raise ValueError("Cache size must not be negative.")
+        if resolution <= 0:
+            raise ValueError("Cache resolution must be positive.")
+        self.maxsize = maxsize
+        self.resolution = resolution
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def key(self, jd, *parts):
+        """Build a cache key from a Julian Day and the calculation identifiers."""
+        return (round(jd / self.resolution),) + parts
+
+    def get(self, key):
+        """Return the cached value for ``key`` or None, updating the counters."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """Store a value, evicting the least recently used entry when full."""
+        if self.maxsize == 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        """
+        Return cache statistics.
+
+        Returns
+        -------
+        dict
+            hits, misses, current size, maximum size and key resolution (days)
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'resolution': self.resolution,
+            }
@@ -1,22 +1,3 @@
-import matplotlib.pyplot as plt
-import numpy as np
-import swisseph as swe
-from astropy.time import Time
-import os
-import pytz
-from datetime import datetime
-from timezonefinder import TimezoneFinder
-import location2 as loc
-import sun
-import moon
-import mercury
-import venus
-import mars
-import jupiter
-import saturn
-import rahu
-import ascendent
-
 rashi_swabhav = {
     'char_rashi':  [1, 4, 7, 10],   # Aries, Cancer, Libra, Capricorn (Cardinal/Movable)
     'sthir_rashi': [2, 5, 8, 11],   # Taurus, Leo, Scorpio, Aquarius (Fixed)
@@ -226,6 +207,42 @@ naisargika_bala = {
     "Saturn": 9
 }
 
+rashi_number = {
+    "Mesha": 1, "Vrishabha": 2, "Mithuna": 3, "Karka": 4,
+    "Simha": 5, "Kanya": 6, "Tula": 7, "Vrischika": 8,
+    "Dhanu": 9, "Makara": 10, "Kumbha": 11, "Meena": 12
+}
+
+# Lord (swami) of each rashi
+rashi_lord = {
+    1: "Mars",      # Mesha
+    2: "Venus",     # Vrishabha
+    3: "Mercury",   # Mithuna
+    4: "Moon",      # Karka
+    5: "Sun",       # Simha
+    6: "Mercury",   # Kanya
+    7: "Venus",     # Tula
+    8: "Mars",      # Vrischika
+    9: "Jupiter",   # Dhanu
+    10: "Saturn",   # Makara
+    11: "Saturn",   # Kumbha
+    12: "Jupiter"   # Meena
+}
+
+# Naisargika (natural) friendship; planets not listed are neutral (sama)
+naisargika_maitri = {
+    "Sun": {"friends": ["Moon", "Mars", "Jupiter"], "enemies": ["Venus", "Saturn"]},
+    "Moon": {"friends": ["Sun", "Mercury"], "enemies": []},
+    "Mars": {"friends": ["Sun", "Moon", "Jupiter"], "enemies": ["Mercury"]},
+    "Mercury": {"friends": ["Sun", "Venus"], "enemies": ["Moon"]},
+    "Jupiter": {"friends": ["Sun", "Moon", "Mars"], "enemies": ["Mercury", "Venus"]},
+    "Venus": {"friends": ["Mercury", "Saturn"], "enemies": ["Sun", "Moon"]},
+    "Saturn": {"friends": ["Mercury", "Venus"], "enemies": ["Sun", "Moon", "Mars"]}
+}
+
+# Tatkalika (temporary) friends sit in these houses counted from the planet
+tatkalika_mitra_bhav = [2, 3, 4, 10, 11, 12]
+
 planet_exalt_debil = {
     "Sun": {"exalted": "Mesha", "degree": 10, "debilitated": "Tula", "degree_debil": 10},
     "Moon": {"exalted": "Vrishabha", "degree": 3, "debilitated": "Vrischika", "degree_debil": 3},
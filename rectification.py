@@ -0,0 +1,205 @@
+"""
+Birth-Time Rectification
+========================
+
+Find the parts of a birth-time window in which a chart satisfies a set of
+constraints, such as "D9 lagna in Scorpio", "D10 lagna in Leo" or "Moon in
+Rohini".
+
+Instead of recomputing a chart for every candidate minute, every constraint
+is turned into the longitudes at which its answer can change (the sign
+changes of its varga, or the nakshatra boundaries). The times at which the
+constrained bodies cross those longitudes split the window into intervals
+with a fixed answer, and one test per interval decides it. Crossings are
+bracketed on a coarse time grid and refined with ``events.bracketed_root``.
+
+Only the Ascendant moves fast enough to matter within a window. It comes
+from ``AstrologyCalculator.ascendant_function``, which reduces each
+evaluation to a ``swe.houses_armc`` call; planets come from
+``AstrologyCalculator.position_function``. Neither goes through the position
+cache, so crossings are refined at the exact instants the root finder asks
+for.
+
+Usage:
+    calc = AstrologyCalculator()
+    windows = find_birth_windows(calc, '1990-05-11 08:00:00', '1990-05-11 10:00:00',
+                                 28.6139, 77.2090,
+                                 [{'chart': 'D9', 'sign': 'Scorpio'},
+                                  {'body': 'Moon', 'nakshatra': 'Rohini'}])
+    for window in windows:
+        print(window['start'], window['end'])
+"""
+
+import numpy as np
+
+from divisional_charts import VARGA_DEFINITIONS, SIGN_NAMES, calculate_varga, varga_sign_changes
+from events import NAKSHATRA_NAMES, PRECISION, bracketed_root
+from julian_day import from_julian_day, to_julian_day
+
+# Width of a nakshatra in degrees
+NAKSHATRA_SIZE = 360.0 / 27
+
+# Sampling step in days at which crossings are bracketed. The Ascendant moves
+# at most a few tens of degrees in 20 minutes; planets are sampled hourly.
+ASCENDANT_SCAN_STEP = 1.0 / 72
+PLANET_SCAN_STEP = 1.0 / 24
+
+
+def _resolve_values(values, names, kind):
+    """Convert names or 1-based numbers to a set of 1-based numbers."""
+    if isinstance(values, (str, int)):
+        values = [values]
+    lookup = {name.lower(): number for number, name in enumerate(names, start=1)}
+    numbers = set()
+    for value in values:
+        if isinstance(value, str) and value.lower() in lookup:
+            numbers.add(lookup[value.lower()])
+        elif isinstance(value, int) and 1 <= value <= len(names):
+            numbers.add(value)
+        else:
+            raise ValueError(f"Unknown {kind} '{value}'. Available: {', '.join(names)}")
+    return numbers
+
+
+def _normalize_constraint(calculator, constraint):
+    """
+    Validate a constraint and return (body, chart_type, allowed numbers).
+
+    ``chart_type`` is None for nakshatra constraints.
+    """
+    body = str(constraint.get('body', 'Ascendant')).capitalize()
+    if body != 'Ascendant' and body.lower() not in calculator.PLANETS:
+        raise ValueError(f"Unknown body '{body}'. Available: Ascendant, "
+                         f"{', '.join(planet.capitalize() for planet in calculator.PLANETS)}")
+    if ('sign' in constraint) == ('nakshatra' in constraint):
+        raise ValueError("Each constraint needs exactly one of 'sign' or 'nakshatra'")
+
+    if 'nakshatra' in constraint:
+        return body, None, _resolve_values(constraint['nakshatra'], NAKSHATRA_NAMES, 'nakshatra')
+
+    chart_type = str(constraint.get('chart', 'D1')).upper()
+    if chart_type not in VARGA_DEFINITIONS:
+        raise ValueError(f"Unknown chart type: {chart_type}. Available: {list(VARGA_DEFINITIONS.keys())}")
+    return body, chart_type, _resolve_values(constraint['sign'], SIGN_NAMES, 'sign')
+
+
+def _crossings(longitude, boundaries, start, end, step, precision):
+    """
+    Times at which ``longitude(jd)`` crosses any of the sorted ``boundaries``.
+
+    The window is sampled every ``step`` days; within a step the body is
+    assumed to move less than 180 degrees in one direction.
+    """
+    extended = np.concatenate((boundaries - 360, boundaries, boundaries + 360))
+    times = []
+    samples = max(int(np.ceil((end - start) / step)), 1)
+    t0, lon0 = start, longitude(start)
+    for i in range(1, samples + 1):
+        t1 = start + (end - start) * i / samples
+        lon1 = longitude(t1)
+        moved = (lon1 - lon0 + 180) % 360 - 180
+        low, high = (lon0, lon0 + moved) if moved >= 0 else (lon0 + moved, lon0)
+        passed = extended[(extended > low) & (extended <= high)]
+        if moved < 0:
+            passed = passed[::-1]
+        bracket_start = t0
+        for boundary in passed:
+            def offset(jd, boundary=boundary):
+                return (longitude(jd) - boundary + 180) % 360 - 180
+            jd = bracketed_root(offset, bracket_start, t1, precision,
+                                (lon0 - boundary + 180) % 360 - 180,
+                                (lon1 - boundary + 180) % 360 - 180)
+            times.append(float(jd))
+            bracket_start = jd
+        t0, lon0 = t1, lon1
+    return times
+
+
+def find_birth_windows(calculator, start, end, latitude, longitude, constraints,
+                       ayanamsa=None, precision=PRECISION):
+    """
+    Find the time intervals in which all constraints hold.
+
+    Parameters
+    ----------
+    calculator : AstrologyCalculator
+        Calculator providing the sidereal positions
+    start, end : str, datetime or float
+        Birth-time window (UTC), at most ``AstrologyCalculator.ASCENDANT_WINDOW`` days
+    latitude : float
+        Geographic latitude of the birth place
+    longitude : float
+        Geographic longitude of the birth place
+    constraints : list of dict
+        Each with an optional 'body' (default 'Ascendant') and either 'sign'
+        (with an optional 'chart', default 'D1') or 'nakshatra'; signs and
+        nakshatras are names or 1-based numbers, or lists of them
+    ayanamsa : str, optional
+        Ayanamsa system (default: the calculator's ayanamsa)
+    precision : float, optional
+        Precision of the interval ends in days (default: one second)
+
+    Returns
+    -------
+    list of dict
+        Intervals in time order with 'start_jd' / 'end_jd', 'start' / 'end'
+        (UTC datetimes) and 'minutes'; intervals touching the window ends are
+        clipped to it
+    """
+    if not constraints:
+        raise ValueError("At least one constraint is required")
+    rules = [_normalize_constraint(calculator, constraint) for constraint in constraints]
+
+    start_jd = to_julian_day(start)
+    end_jd = to_julian_day(end)
+    ascendant = calculator.ascendant_function(start_jd, end_jd, latitude, longitude, ayanamsa)
+
+    functions = {}
+    for body, _, _ in rules:
+        if body == 'Ascendant':
+            functions[body] = ascendant
+        elif body not in functions:
+            position = calculator.position_function(body, ayanamsa)
+            functions[body] = lambda jd, position=position: position(jd)[0]
+
+    # Longitudes at which the answer of any constraint on each body can change
+    boundaries = {}
+    for body, chart_type, _ in rules:
+        changes = (varga_sign_changes(chart_type) if chart_type is not None
+                   else np.arange(27) * NAKSHATRA_SIZE)
+        boundaries[body] = np.union1d(boundaries.get(body, np.empty(0)), changes)
+
+    cuts = {start_jd, end_jd}
+    for body, body_boundaries in boundaries.items():
+        step = ASCENDANT_SCAN_STEP if body == 'Ascendant' else PLANET_SCAN_STEP
+        cuts.update(t for t in _crossings(functions[body], body_boundaries, start_jd, end_jd,
+                                          step, precision) if start_jd < t < end_jd)
+    cuts = sorted(cuts)
+
+    def satisfied(jd):
+        positions = {body: function(jd) for body, function in functions.items()}
+        for body, chart_type, allowed in rules:
+            if chart_type is None:
+                number = int(positions[body] // NAKSHATRA_SIZE) % 27 + 1
+            else:
+                number = calculate_varga(chart_type, positions[body])['sign']
+            if number not in allowed:
+                return False
+        return True
+
+    windows = []
+    for t0, t1 in zip(cuts[:-1], cuts[1:]):
+        if not satisfied((t0 + t1) / 2):
+            continue
+        if windows and windows[-1][1] == t0:
+            windows[-1][1] = t1
+        else:
+            windows.append([t0, t1])
+
+    return [{
+        'start_jd': t0,
+        'end_jd': t1,
+        'start': from_julian_day(t0),
+        'end': from_julian_day(t1),
+        'minutes': (t1 - t0) * 1440,
+    } for t0, t1 in windows]
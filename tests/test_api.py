@@ -0,0 +1,39 @@
+"""Tests for the Flask API."""
+
+import pytest
+
+import api
+from test_astrology_calculator import EPHE_PATH
+from astrology_calculator import AstrologyCalculator
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(api, 'calculator', AstrologyCalculator(EPHE_PATH))
+    return api.app.test_client()
+
+
+def test_polar_quadrant_houses_are_a_bad_request(client):
+    body = {'date': '2020-06-01', 'time': '10:00:00', 'latitude': 80, 'longitude': 20}
+    assert client.post('/calculate', json=body).status_code == 200
+
+    response = client.post('/calculate', json=dict(body, houseSystems=['P']))
+    assert response.status_code == 400
+    assert "'P'" in response.get_json()['error'] and '66.' in response.get_json()['error']
+
+    response = client.post('/calculate', json=dict(body, houseSystems=['O']))
+    assert response.status_code == 200
+    assert len(response.get_json()['data']['houseSystems']['O']) == 12
+
+
+@pytest.mark.parametrize('ready, error, status, code', [
+    (True, None, 'healthy', 200),
+    (False, None, 'warming_up', 503),
+    (False, 'Ephemeris not initialized', 'failed', 503),
+])
+def test_health_reports_the_warm_up_state(client, monkeypatch, ready, error, status, code):
+    monkeypatch.setitem(api.warmup_status, 'ready', ready)
+    monkeypatch.setitem(api.warmup_status, 'error', error)
+    response = client.get('/health')
+    assert response.status_code == code
+    assert response.get_json()['status'] == status
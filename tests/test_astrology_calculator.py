@@ -0,0 +1,30 @@
+"""Tests for house calculations at polar latitudes."""
+
+import os
+
+import pytest
+
+from astrology_calculator import AstrologyCalculator
+
+EPHE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'ephe')
+
+
+@pytest.fixture(scope='module')
+def calculator():
+    return AstrologyCalculator(EPHE_PATH)
+
+
+@pytest.mark.parametrize('house_system', AstrologyCalculator.POLAR_UNDEFINED_HOUSE_SYSTEMS)
+def test_quadrant_houses_are_rejected_within_the_polar_circles(calculator, house_system):
+    with pytest.raises(ValueError, match=f"'{house_system}'.*latitude 80"):
+        calculator.calculate_houses('2020-06-01 10:00:00', 80, 20, [house_system])
+
+
+def test_ascendant_based_houses_work_at_latitude_80(calculator):
+    houses = calculator.calculate_houses('2020-06-01 10:00:00', 80, 20, ['W', 'O', 'E'])
+    assert all(len(cusps) == 12 for cusps in houses.values())
+
+
+def test_quadrant_houses_work_below_the_polar_circles(calculator):
+    houses = calculator.calculate_houses('2020-06-01 10:00:00', 60, 20, ['P', 'K', 'G'])
+    assert [len(houses[code]) for code in ('P', 'K', 'G')] == [12, 12, 36]
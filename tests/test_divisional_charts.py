@@ -0,0 +1,61 @@
+"""Tests for custom varga registration and sign-change distances."""
+
+import numpy as np
+import pytest
+
+import divisional_charts
+from divisional_charts import (calculate_varga_sensitivity, register_varga,
+                               varga_boundary_distances, varga_sign_changes)
+
+HALVES = [(15, 'Leo'), (15, 'Cancer')]
+
+
+@pytest.fixture
+def registered():
+    """Chart types registered by a test, removed again afterwards."""
+    chart_types = []
+    yield chart_types
+    for chart_type in chart_types:
+        for registry in (divisional_charts.VARGA_DEFINITIONS, divisional_charts._VARGAS,
+                         divisional_charts.DIVISIONAL_CHARTS, divisional_charts.CHART_NAMES):
+            registry.pop(chart_type, None)
+
+
+@pytest.mark.parametrize('definition', [
+    {'name': 'Bad', 'divisions': 2, 'segments': {'odd': [('15', 'Leo'), (15, 'Cancer')], 'even': HALVES}},
+    {'name': 'Bad', 'divisions': 2, 'segments': {'odd': [(None, 'Leo'), (15, 'Cancer')], 'even': HALVES}},
+    {'name': 'Bad', 'divisions': 2, 'segments': {'odd': 5, 'even': HALVES}},
+    {'name': 'Bad', 'divisions': 2, 'segments': {'odd': [15, 15], 'even': HALVES}},
+    {'name': 'Bad', 'divisions': 3, 'segments': {'odd': HALVES, 'even': HALVES}},
+    {'name': 'Bad', 'divisions': 2, 'table': 5},
+    {'name': 'Bad', 'divisions': 2, 'table': [[1, 2]] * 11 + [5]},
+    {'name': 'Bad', 'divisions': 2, 'table': [[1, 2]] * 12, 'step': 1},
+    {'name': 'Bad', 'divisions': 2, 'start': 1, 'offset': 3},
+])
+def test_malformed_definitions_raise_value_error(definition, registered):
+    registered.append('TEST-BAD')
+    with pytest.raises(ValueError):
+        register_varga('TEST-BAD', definition)
+    assert 'TEST-BAD' not in divisional_charts.VARGA_DEFINITIONS
+
+
+def test_segments_of_whole_divisions_are_accepted(registered):
+    registered.append('TEST-HORA')
+    register_varga('TEST-HORA', {'name': 'Hora', 'divisions': 2,
+                                 'segments': {'odd': HALVES, 'even': HALVES[::-1]}})
+    assert divisional_charts.calculate_varga('TEST-HORA', 20)['sign'] == 4
+
+
+def test_constant_scheme_has_no_sign_changes(registered):
+    registered.append('TEST-CONSTANT')
+    register_varga('TEST-CONSTANT', {'name': 'Constant', 'divisions': 3,
+                                     'table': [['Aries'] * 3] * 12})
+    assert len(varga_sign_changes('TEST-CONSTANT')) == 0
+
+    to_previous, to_next = varga_boundary_distances([10.0, 200.0], ['TEST-CONSTANT', 'D2'])
+    assert np.all(np.isinf(to_previous[0])) and np.all(np.isinf(to_next[0]))
+    np.testing.assert_allclose(to_next[1], [5.0, 25.0])
+
+    report = calculate_varga_sensitivity({'Sun': 10.0}, {'Sun': 1.0}, ['TEST-CONSTANT'])
+    assert report['TEST-CONSTANT']['Sun'] == {'degreesToPrevious': None, 'degreesToNext': None,
+                                              'minutesEarlier': None, 'minutesLater': None}
@@ -0,0 +1,196 @@
+"""
+Vimshopaka Bala
+===============
+
+Aggregate the divisional charts into Vimshopaka strength (0-20 points) and
+vargottama flags.
+
+In every varga of a scheme a planet scores dignity points from its relation
+to the lord of the sign it occupies: 20 in its own or exaltation sign, and
+otherwise 18 / 15 / 10 / 7 / 5 for a great friend / friend / neutral /
+enemy / great enemy. The compound relationship combines natural friendship
+(``rashi.naisargika_maitri``) with temporary friendship from the Rashi chart
+(lord in the 2nd-4th or 10th-12th house from the planet). The points of each
+varga are weighted by the scheme and summed, so a planet dignified in every
+varga scores 20.
+
+All charts of a batch are scored in one vectorized pass: the varga signs come
+from the compiled tables of ``divisional_charts.calculate_varga_arrays`` and
+the dignity points are gathered from a (charts, planet, lord) table.
+
+Usage:
+    points = calculate_vimshopaka(chart_data)
+    print(points['Jupiter']['shodashavarga'], points['Jupiter']['vargottama'])
+"""
+
+import numpy as np
+
+import rashi
+from divisional_charts import SIGN_NAMES, calculate_varga_arrays
+
+# Planets scored by Vimshopaka bala, in the order of the array functions
+VIMSHOPAKA_PLANETS = ('Sun', 'Moon', 'Mars', 'Mercury', 'Jupiter', 'Venus', 'Saturn')
+
+# Varga weights of each scheme (each scheme sums to 20)
+VIMSHOPAKA_SCHEMES = {
+    'shadvarga': {'D1': 6, 'D2': 2, 'D3': 4, 'D9': 5, 'D12': 2, 'D30': 1},
+    'saptavarga': {'D1': 5, 'D2': 2, 'D3': 3, 'D7': 2.5, 'D9': 4.5, 'D12': 2, 'D30': 1},
+    'dashavarga': {'D1': 3, 'D2': 1.5, 'D3': 1.5, 'D7': 1.5, 'D9': 1.5, 'D10': 1.5,
+                   'D12': 1.5, 'D16': 1.5, 'D30': 1.5, 'D60': 5},
+    'shodashavarga': {'D1': 3.5, 'D2': 1, 'D3': 1, 'D4': 0.5, 'D7': 0.5, 'D9': 3,
+                      'D10': 0.5, 'D12': 0.5, 'D16': 2, 'D20': 0.5, 'D24': 0.5,
+                      'D27': 0.5, 'D30': 1, 'D40': 0.5, 'D45': 0.5, 'D60': 4},
+}
+
+# Dignity points in the sign of a lord, indexed by compound relationship + 2
+# (great enemy, enemy, neutral, friend, great friend)
+RELATIONSHIP_POINTS = np.array([5, 7, 10, 15, 18], dtype=np.float64)
+OWN_SIGN_POINTS = 20
+
+# Every varga used by at least one scheme
+_SCHEME_VARGAS = list(dict.fromkeys(chart_type for weights in VIMSHOPAKA_SCHEMES.values()
+                                    for chart_type in weights))
+
+
+def _build_tables():
+    """Build the planet-indexed lord, exaltation and natural friendship tables."""
+    index = {planet: i for i, planet in enumerate(VIMSHOPAKA_PLANETS)}
+    # Planet index of the lord of signs 1-12 (entry 0 unused)
+    sign_lord = np.zeros(13, dtype=np.intp)
+    for sign, lord in rashi.rashi_lord.items():
+        sign_lord[sign] = index[lord]
+    exaltation = np.array([rashi.rashi_number[rashi.planet_exalt_debil[planet]['exalted']]
+                           for planet in VIMSHOPAKA_PLANETS])
+    natural = np.zeros((len(VIMSHOPAKA_PLANETS),) * 2, dtype=np.intp)
+    for planet, relations in rashi.naisargika_maitri.items():
+        for friend in relations['friends']:
+            natural[index[planet], index[friend]] = 1
+        for enemy in relations['enemies']:
+            natural[index[planet], index[enemy]] = -1
+    return sign_lord, exaltation, natural
+
+
+_SIGN_LORD, _EXALTATION, _NATURAL = _build_tables()
+_TEMPORARY_FRIEND_HOUSES = np.zeros(13, dtype=bool)
+_TEMPORARY_FRIEND_HOUSES[rashi.tatkalika_mitra_bhav] = True
+
+
+def vimshopaka_arrays(planet_longitudes, schemes=None):
+    """
+    Calculate Vimshopaka points for many charts at once.
+
+    Parameters
+    ----------
+    planet_longitudes : array_like
+        (..., 7) sidereal longitudes in the order of ``VIMSHOPAKA_PLANETS``;
+        leading axes index the charts
+    schemes : list of str, optional
+        Keys of ``VIMSHOPAKA_SCHEMES`` (default: all four)
+
+    Returns
+    -------
+    dict
+        Mapping of scheme name to a float64 array of points (0-20) with the
+        shape of ``planet_longitudes``
+    """
+    if schemes is None:
+        schemes = list(VIMSHOPAKA_SCHEMES.keys())
+    for scheme in schemes:
+        if scheme not in VIMSHOPAKA_SCHEMES:
+            raise ValueError(f"Unknown scheme: {scheme}. Available: {list(VIMSHOPAKA_SCHEMES.keys())}")
+
+    planet_longitudes = np.asarray(planet_longitudes, dtype=np.float64)
+    if planet_longitudes.shape[-1:] != (len(VIMSHOPAKA_PLANETS),):
+        raise ValueError(f"Expected longitudes of {len(VIMSHOPAKA_PLANETS)} planets on the last axis")
+    shape = planet_longitudes.shape
+    longitudes = planet_longitudes.reshape(-1, len(VIMSHOPAKA_PLANETS))
+
+    # (vargas, charts, planets) sign numbers
+    signs, _ = calculate_varga_arrays(longitudes.ravel(), _SCHEME_VARGAS)
+    signs = signs.reshape(len(_SCHEME_VARGAS), *longitudes.shape).astype(np.intp)
+
+    # Temporary friendship from the Rashi chart: house of every lord from every planet
+    rashi_signs = signs[_SCHEME_VARGAS.index('D1')]
+    houses = (rashi_signs[:, None, :] - rashi_signs[:, :, None]) % 12 + 1
+    temporary = np.where(_TEMPORARY_FRIEND_HOUSES[houses], 1, -1)
+    compound = _NATURAL + temporary
+
+    # Dignity points of every planet in every varga
+    lords = _SIGN_LORD[signs]
+    charts = np.arange(longitudes.shape[0])[None, :, None]
+    planets = np.arange(len(VIMSHOPAKA_PLANETS))
+    points = RELATIONSHIP_POINTS[compound[charts, planets, lords] + 2]
+    own = (lords == planets) | (signs == _EXALTATION)
+    points[own] = OWN_SIGN_POINTS
+
+    results = {}
+    for scheme in schemes:
+        weights = VIMSHOPAKA_SCHEMES[scheme]
+        total = np.zeros(longitudes.shape)
+        for chart_type, weight in weights.items():
+            total += weight * points[_SCHEME_VARGAS.index(chart_type)]
+        results[scheme] = (total / 20).reshape(shape)
+    return results
+
+
+def vargottama_arrays(longitudes):
+    """
+    Flag longitudes that occupy the same sign in the Rashi and Navamsa charts.
+
+    Parameters
+    ----------
+    longitudes : array_like
+        Longitudes of any shape
+
+    Returns
+    -------
+    numpy.ndarray
+        Boolean array with the shape of ``longitudes``
+    """
+    longitudes = np.asarray(longitudes, dtype=np.float64)
+    signs, _ = calculate_varga_arrays(longitudes.ravel(), ['D1', 'D9'])
+    return (signs[0] == signs[1]).reshape(longitudes.shape)
+
+
+def calculate_vimshopaka(planetary_positions, schemes=None):
+    """
+    Calculate Vimshopaka points and vargottama flags for one chart.
+
+    Parameters
+    ----------
+    planetary_positions : dict
+        Dictionary of positions with longitude values; must contain the seven
+        planets of ``VIMSHOPAKA_PLANETS``, other bodies (Rahu, Ketu,
+        Ascendant) only get a vargottama flag
+    schemes : list of str, optional
+        Keys of ``VIMSHOPAKA_SCHEMES`` (default: all four)
+
+    Returns
+    -------
+    dict
+        Per body: 'vargottama' (bool), 'navamsaSign', and for the seven
+        planets the points of every scheme rounded to 0.01
+    """
+    bodies = list(planetary_positions.keys())
+    longitudes = [data['longitude'] if isinstance(data, dict) else data
+                  for data in planetary_positions.values()]
+    missing = [planet for planet in VIMSHOPAKA_PLANETS if planet not in planetary_positions]
+    if missing:
+        raise ValueError(f"Position of {missing[0]} is required for Vimshopaka bala")
+
+    points = vimshopaka_arrays([longitudes[bodies.index(planet)] for planet in VIMSHOPAKA_PLANETS],
+                               schemes)
+    signs, _ = calculate_varga_arrays(longitudes, ['D9'])
+    vargottama = vargottama_arrays(longitudes).tolist()
+
+    result = {}
+    for i, body in enumerate(bodies):
+        result[body] = {
+            'vargottama': vargottama[i],
+            'navamsaSign': SIGN_NAMES[signs[0, i] - 1],
+        }
+        if body in VIMSHOPAKA_PLANETS:
+            planet_index = VIMSHOPAKA_PLANETS.index(body)
+            for scheme, values in points.items():
+                result[body][scheme] = round(float(values[planet_index]), 2)
+    return result